@@ -0,0 +1,7 @@
+"""AI Act Advisors — Static Site Generator
+Reads consultants.json, content/ and data/ and generates all HTML pages into build/ (or any writer)."""
+
+from .pipeline import Config, Site, build
+from .writers import DiskWriter, MemoryWriter, OverlayWriter
+
+__all__ = ['Config', 'Site', 'build', 'DiskWriter', 'MemoryWriter', 'OverlayWriter']
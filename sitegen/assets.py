@@ -0,0 +1,46 @@
+"""Static assets: the copied static/ tree and the minified script bundles."""
+
+import json, os
+
+def copy_static(ctx):
+    """Copy static/ into the build. Script sources are left out; they ship as bundles."""
+    for root, dirs, files in os.walk(ctx.static_dir):
+        dirs[:] = [d for d in dirs if d != 'tools']
+        for name in files:
+            if name in ('main.js', 'chrome.js'):
+                continue
+            full = os.path.join(root, name)
+            with open(full, 'rb') as f:
+                ctx.writer.write(os.path.relpath(full, ctx.base).replace(os.sep, '/'), f.read())
+
+def minify_js(src):
+    """Drop comments, indentation and blank lines. Code within a line is never rewritten, so it stays safe without a parser."""
+    out, in_comment = [], False
+    for line in src.splitlines():
+        line = line.strip()
+        if in_comment:
+            in_comment = '*/' not in line
+        elif line.startswith('/*'):
+            in_comment = '*/' not in line
+        elif line and not line.startswith('//'):
+            out.append(line)
+    return '\n'.join(out) + '\n'
+
+def bundle_js(ctx, name, *sources):
+    """Concatenate and minify script sources from static/js into one fingerprinted file."""
+    parts = []
+    for s in sources:
+        with open(os.path.join(ctx.static_dir, 'js', f'{s}.js'), encoding='utf-8') as f:
+            parts.append(minify_js(f.read()))
+    return ctx.write_asset(f'js/{name}.js', ''.join(parts))
+
+def load_tool_data(ctx, name):
+    with open(os.path.join(ctx.tools_data_dir, name), encoding='utf-8') as f:
+        return json.load(f)
+
+def bundle_scripts(ctx):
+    # Layout chrome (analytics loader, countdown, cookie banner, click tracking) and directory filters, shared by every page
+    ctx.scripts['site'] = bundle_js(ctx, 'site', 'main', 'chrome')
+    # Shared tool helpers get their own file so every tool page reuses one cached copy
+    for name in ('common', 'simulator', 'adventure', 'periodic-table'):
+        ctx.scripts[name] = bundle_js(ctx, name, f'tools/{name}')
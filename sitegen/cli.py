@@ -0,0 +1,74 @@
+"""Command line entry point: python -m sitegen [family ...] [--page PATH] [--consultant ID] [--import-db | --export-db JSON] [--ingest FEED]"""
+
+import argparse, json, os, sys
+from datetime import datetime, timezone
+
+from .pages import FAMILIES, family_for
+from .ingest import ingest, read_feed
+from .locales import site_locales, split_locale
+from .pipeline import Config, build
+from .store import export_json, import_json
+
+DEFAULT_BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sitegen', description='Build the AI Act Advisors static site.')
+    parser.add_argument('families', nargs='*', metavar='family', help=f'only build these page families ({", ".join(FAMILIES)})')
+    parser.add_argument('--page', action='append', default=[], metavar='PATH', help='only build this output page, e.g. about.html (repeatable)')
+    parser.add_argument('--consultant', action='append', default=[], metavar='ID', help='only build this consultant profile (repeatable)')
+    parser.add_argument('--base', default=os.environ.get('AIACT_BASE', DEFAULT_BASE), help='site source directory (default: $AIACT_BASE or the repository root)')
+    parser.add_argument('--import-db', metavar='JSON', help='load a consultants.json file into consultants.db, which builds then read instead, and exit')
+    parser.add_argument('--export-db', metavar='JSON', help='write consultants.db out as a consultants.json file and exit')
+    parser.add_argument('--ingest', metavar='FEED', help='apply a JSON Lines change feed (- for stdin) to the consultant data and rebuild only the pages it touches')
+    args = parser.parse_args(argv)
+
+    db_file = os.path.join(args.base, 'consultants.db')
+    if args.import_db:
+        with open(args.import_db, encoding='utf-8') as f:
+            import_json(json.load(f), db_file)
+        print(f'Imported {args.import_db} into {db_file}')
+        return
+    if args.export_db:
+        with open(args.export_db, 'w', encoding='utf-8') as f:
+            json.dump(export_json(db_file), f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f'Exported {db_file} to {args.export_db}')
+        return
+
+    unknown = [f for f in args.families if f not in FAMILIES]
+    if unknown:
+        parser.error(f'unknown family: {", ".join(unknown)}')
+    paths = args.page + [f'consultant/{c}.html' for c in args.consultant]
+    locales = site_locales(args.base)
+    unknown = [p for p in paths if family_for(split_locale(p, locales)[1]) is None]
+    if unknown:
+        parser.error(f'no page family builds {", ".join(unknown)}')
+    # Reproducible-builds convention: pin the build clock to a Unix timestamp
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    clock = (lambda: datetime.fromtimestamp(int(epoch), timezone.utc)) if epoch else None
+
+    if args.ingest:
+        try:
+            with (sys.stdin if args.ingest == '-' else open(args.ingest, encoding='utf-8')) as f:
+                changes = read_feed(f)
+            affected, site = ingest(args.base, changes, clock=clock)
+        except (RuntimeError, ValueError) as e:
+            sys.exit(f'error: {e}')
+        print(f"Applied {len(changes)} changes; {len(affected)} pages affected")
+        if site is None:
+            return
+        paths = sorted(affected)
+    else:
+        try:
+            site = build(Config(args.base, args.families or None, paths or None, clock=clock))
+        except (RuntimeError, ValueError) as e:
+            sys.exit(f'error: {e}')
+
+    print("Build complete!" if not paths and not args.families else "Targeted build complete!")
+    print(f"Pages generated: {sum(site.counts.values())}")
+    for name, n in site.counts.items():
+        print(f"  - {name}: {n}")
+    duplicates = site.writer.load_record('duplicates') if args.ingest or not (paths or args.families) else None
+    if duplicates:
+        print(f"Possible duplicate listings: {sum(len(d['duplicates']) for d in duplicates)} "
+              f"(merge report: {os.path.join(args.base, '.build-cache', 'records', 'duplicates.json')})")
@@ -0,0 +1,55 @@
+"""Precompressed siblings and the build manifest.
+
+Every text file a build writes gets a .gz sibling, and a .br one when the optional brotli package is installed, so a
+server can send the encoded bytes as they are instead of compressing per request. The manifest record holds each
+output file's content hash and its size per encoding, for ETags and transfer-size reports."""
+
+import gzip, hashlib
+
+try:  # optional: brotli siblings (pip install brotli)
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE = ('.html', '.css', '.js', '.svg', '.xml', '.txt', '.json')
+SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+# Fingerprinted assets are few and cached for a year, so they get the slowest, smallest brotli (cached by content);
+# pages change with every asset fingerprint, and past quality 5 they shrink by a few percent at ten times the cost
+ASSET_QUALITY = 11
+PAGE_QUALITY = 5
+
+def encode(ctx, path, data):
+    """{encoding: bytes} for the variants of data that come out smaller than it."""
+    out = {'gzip': gzip.compress(data, 9, mtime=0)}
+    if brotli is not None:
+        if path.startswith('static/'):
+            name = f'compressed/{hashlib.sha256(data).hexdigest()[:16]}.br'
+            out['br'] = ctx.read_cache(name)
+            if out['br'] is None:
+                out['br'] = brotli.compress(data, quality=ASSET_QUALITY)
+                ctx.write_cache(name, out['br'])
+        else:
+            out['br'] = brotli.compress(data, quality=PAGE_QUALITY)
+    return {enc: variant for enc, variant in out.items() if len(variant) < len(data)}
+
+def precompress(ctx, full, removed=()):
+    """Write the encoded siblings of every file this build wrote and update the manifest record: a full build replaces
+    it, a targeted one updates the files it wrote and drops the ones it removed."""
+    manifest = {} if full else dict(ctx.writer.load_record('manifest') or {})
+    for path in removed:
+        manifest.pop(path, None)
+        for suffix in SUFFIXES.values():
+            ctx.writer.remove(path + suffix)
+    for path in sorted(ctx.writer.paths):
+        if path.endswith(tuple(SUFFIXES.values())):
+            continue
+        data = ctx.writer.read(path)
+        entry = manifest[path] = {'hash': hashlib.sha256(data).hexdigest()[:20], 'size': len(data)}
+        variants = encode(ctx, path, data) if path.endswith(COMPRESSIBLE) else {}
+        for enc, suffix in SUFFIXES.items():
+            if enc in variants:
+                ctx.writer.write(path + suffix, variants[enc])
+                entry[enc] = len(variants[enc])
+            else:
+                ctx.writer.remove(path + suffix)
+    ctx.writer.save_record('manifest', dict(sorted(manifest.items())))
@@ -0,0 +1,51 @@
+"""Content collections: blog posts parsed from content/ with a hash-keyed cache."""
+
+import hashlib, json, os
+from datetime import datetime
+
+# ── Blog content ──
+# Each post is content/blog/<slug>.html: "key: value" front matter between --- lines, then the article markup
+BLOG_RISK_LABELS = {'high': 'HIGH-RISK', 'limited': 'LIMITED RISK', 'potential': 'Potentially HIGH-RISK'}
+
+def parse_post(text):
+    _, front, body = text.split('---\n', 2)
+    post = dict(line.split(': ', 1) for line in front.splitlines() if line.strip())
+    post['order'] = int(post['order'])
+    post['body'] = body
+    return post
+
+def load_post(ctx, path):
+    """Parse one post file. Parsed posts are cached by file hash, so only edited posts are parsed again."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    name = f'content/{hashlib.sha256(data).hexdigest()[:16]}.json'
+    cached = ctx.read_cache(name)
+    if cached is not None:
+        return json.loads(cached)
+    post = parse_post(data.decode('utf-8'))
+    ctx.write_cache(name, json.dumps(post).encode('utf-8'))
+    return post
+
+def load_posts(ctx):
+    """All posts, newest first."""
+    folder = os.path.join(ctx.content_dir, 'blog')
+    posts = []
+    for name in sorted(os.listdir(folder)):
+        if name.endswith('.html'):
+            post = load_post(ctx, os.path.join(folder, name))
+            post['slug'] = name[:-len('.html')]
+            posts.append(post)
+    return sorted(posts, key=lambda p: (p['date'], p['order'], p['slug']), reverse=True)
+
+def blog_card(post):
+    meta = datetime.strptime(post['date'], '%Y-%m').strftime('%B %Y')
+    if 'category' in post:
+        label = ' · '.join(filter(None, [BLOG_RISK_LABELS.get(post.get('risk')), post['category']]))
+        colors = 'background:var(--red-light);color:var(--red)' if post.get('risk') == 'high' else 'background:var(--gold-light);color:var(--gray-800)'
+        meta += f' · <span style="{colors};padding:0.1rem 0.4rem;border-radius:4px;font-size:0.75rem;font-weight:600">{label}</span>'
+    return f'''    <div class="blog-card">
+      <h2><a href="blog/{post['slug']}.html">{post.get('card_title', post['title'])}</a></h2>
+      <p class="meta">{meta}</p>
+      <p>{post['summary']}</p>
+    </div>
+'''
@@ -0,0 +1,114 @@
+"""Build context: source paths, the consultant data and the buffer of rendered pages shared by every page family.
+
+Everything a build touches hangs off its Context, so several builds can run in one process at once."""
+
+import hashlib, json, os, threading
+from datetime import datetime, timezone
+from functools import cached_property
+
+from .geo import GeoIndex, load_gazetteer
+from .similar import SimilarIndex
+from .store import JsonStore, SqliteStore
+
+def utc_now():
+    return datetime.now(timezone.utc)
+
+class Context:
+    def __init__(self, base, writer, paths=None, consultants=None, clock=None):
+        self.base = base
+        self.static_dir = os.path.join(base, 'static')
+        self.data_file = os.path.join(base, 'consultants.json')
+        self.db_file = os.path.join(base, 'consultants.db')
+        self.tools_data_dir = os.path.join(base, 'data')
+        self.gazetteer_file = os.path.join(base, 'data', 'cities.csv')
+        self.locales_dir = os.path.join(base, 'locales')
+        self.fonts_dir = os.path.join(base, 'fonts')
+        self.content_dir = os.path.join(base, 'content')
+        # Caches that carry over between builds (parsed content, purged CSS, font subsets, brotli output); None keeps
+        # them in memory for this context only
+        self.cache_dir = os.path.join(base, '.build-cache')
+        self.memory_cache = {}
+        self.writer = writer
+        # Output paths a targeted build renders; None renders every page of the families being built
+        self.paths = set(paths) if paths is not None else None
+        if consultants is not None:
+            self.consultants = consultants
+        # Rendered pages are held here until the post-render passes have run; flush_pages() writes them out
+        self.pages = {}
+        self.scripts = {}  # bundle name -> site-relative URL
+        self.critical_cache = {}  # above-the-fold token set -> critical CSS
+        self.css_rules = {}  # stylesheet URL -> its parsed rules
+        # The site's translated locales, and the one this context renders: None is English at the site root. A locale
+        # context writes its pages under <locale>/ and reaches untranslated pages and assets through to_root
+        self.locales = ()
+        self.locale = None
+        self.catalog = {}
+        self.to_root = ''
+        # The only wall-clock input to a build, used for sitemap lastmod; pages never depend on it
+        self.clock = clock or utc_now
+        self.today = self.clock().date().isoformat()
+
+    @cached_property
+    def consultants(self):
+        with open(self.data_file) as f:
+            return json.load(f)
+
+    @cached_property
+    def store(self):
+        """Consultant queries: consultants.db when it exists, else consultants.json (or the consultants given)."""
+        if 'consultants' not in self.__dict__ and os.path.exists(self.db_file):
+            return SqliteStore(self.db_file)
+        return JsonStore(self.consultants)
+
+    @cached_property
+    def geo(self):
+        return GeoIndex(self.store.all(), load_gazetteer(self.gazetteer_file))
+
+    @cached_property
+    def similar(self):
+        return SimilarIndex(self.store.all())
+
+    def t(self, text):
+        """text in this context's locale; English when the catalog has no translation."""
+        return self.catalog.get(text, text)
+
+    def wants(self, path):
+        return self.paths is None or path in self.paths
+
+    def write_page(self, path, content):
+        if self.wants(path):
+            self.pages[f'{self.locale}/{path}' if self.locale else path] = content
+
+    def flush_pages(self):
+        for path, content in self.pages.items():
+            self.writer.write(path, content.encode('utf-8'))
+
+    def write_asset(self, name, content):
+        """Write a static asset with a content hash in its filename. Returns its site-relative URL."""
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        stem, ext = os.path.splitext(name)
+        url = f'static/{stem}.{hashlib.sha256(data).hexdigest()[:10]}{ext}'
+        self.writer.write(url, data)
+        return url
+
+    def read_cache(self, name):
+        """Bytes of a .build-cache entry, or None."""
+        if self.cache_dir is None:
+            return self.memory_cache.get(name)
+        try:
+            with open(os.path.join(self.cache_dir, name), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def write_cache(self, name, data):
+        if self.cache_dir is None:
+            self.memory_cache[name] = data
+            return
+        # Written under a private name and renamed, so concurrent builds never see a partial entry
+        full = os.path.join(self.cache_dir, name)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        tmp = f'{full}.{os.getpid()}-{threading.get_ident()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, full)
@@ -0,0 +1,83 @@
+"""Duplicate listing detection.
+
+Two listings are duplicates when, in the same city, they share a website domain or have nearly the same normalised
+name. Consultants are grouped into blocks by city and domain hash, and by city and name prefix, and only consultants
+sharing a block are compared, so the work grows with block sizes rather than with every pair in the directory. Matches
+are merged into clusters with union-find; the report lists, for each cluster, the listing to keep (the earliest in
+store order) and the duplicates with the reason they matched."""
+
+import hashlib, re, unicodedata
+from difflib import SequenceMatcher
+from urllib.parse import urlsplit
+
+# Company-form suffixes and filler words that differ between submissions of the same firm
+NAME_STOPWORDS = {
+    'ab', 'ag', 'as', 'bv', 'co', 'gmbh', 'inc', 'kft', 'llc', 'llp', 'ltd', 'limited', 'nv', 'oy', 'plc', 'sa', 'sarl',
+    'sas', 'sl', 'spa', 'srl', 'sro', 'the', 'and', 'und', 'et', 'y',
+}
+# Hosts many unrelated consultants share; a match on these says nothing
+SHARED_HOSTS = {'linkedin.com', 'facebook.com', 'google.com', 'sites.google.com', 'wixsite.com', 'example.com'}
+NAME_PREFIX = 4   # characters of the normalised name that, with the city, make a block
+NAME_MATCH = 0.9  # name similarity for two consultants in the same city
+
+def normalise_name(name):
+    name = unicodedata.normalize('NFKD', name.lower()).encode('ascii', 'ignore').decode('ascii')
+    return ' '.join(w for w in re.findall(r'[a-z0-9]+', name) if w not in NAME_STOPWORDS)
+
+def normalise_domain(url):
+    host = urlsplit(url if '//' in url else f'//{url}').hostname or ''
+    host = host.removeprefix('www.')
+    return '' if host in SHARED_HOSTS else host
+
+def blocks(records):
+    """{block key: [record index]}. Each consultant lands in its city + domain block and its city + name prefix block."""
+    out = {}
+    for i, (name, domain, city) in enumerate(records):
+        if domain:
+            out.setdefault(('domain', city, hashlib.blake2b(domain.encode('utf-8'), digest_size=8).digest()), []).append(i)
+        out.setdefault(('city', city, name.replace(' ', '')[:NAME_PREFIX]), []).append(i)
+    return out
+
+def similar(a, b, threshold):
+    if a == b:
+        return True
+    if re.findall(r'\d+', a) != re.findall(r'\d+', b):
+        return False  # 'Studio 54' and 'Studio 45' are different firms however close the spelling
+    m = SequenceMatcher(None, a, b)
+    return m.real_quick_ratio() >= threshold and m.quick_ratio() >= threshold and m.ratio() >= threshold
+
+def find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+def find_duplicates(consultants):
+    """Merge report: [{'keep': id, 'duplicates': [{'id': id, 'reason': ...}]}], in store order."""
+    records = [(normalise_name(c['name']), normalise_domain(c['website']),
+                (normalise_name(c['city']), c['country'])) for c in consultants]
+    parent = list(range(len(records)))
+    reasons = {}
+    for (kind, *_), members in blocks(records).items():
+        for n, i in enumerate(members):
+            for j in members[n + 1:]:
+                a, b = records[i], records[j]
+                if kind == 'domain':
+                    reason = 'same website and city'
+                elif a[1] and b[1] and a[1] != b[1]:
+                    continue  # different websites: separate firms with similar names
+                elif similar(a[0], b[0], NAME_MATCH):
+                    reason = 'same name and city' if a[0] == b[0] else 'similar name, same city'
+                else:
+                    continue
+                reasons.setdefault(j, reason)
+                ri, rj = find(parent, i), find(parent, j)
+                if ri != rj:
+                    parent[max(ri, rj)] = min(ri, rj)
+
+    clusters = {}
+    for i in range(len(records)):
+        root = find(parent, i)
+        if root != i:
+            clusters.setdefault(root, []).append({'id': consultants[i]['id'], 'reason': reasons.get(i, 'matched a duplicate')})
+    return [{'keep': consultants[root]['id'], 'duplicates': dups} for root, dups in sorted(clusters.items())]
@@ -0,0 +1,76 @@
+"""Web fonts: subsetted, self-hosted Plus Jakarta Sans with a Google Fonts fallback."""
+
+import hashlib, io, os, re, sys
+from html import unescape
+
+try:  # optional: self-hosted font subsetting (pip install fonttools brotli)
+    from fontTools import subset as font_subset
+    import brotli  # noqa: F401 — needed by fontTools for woff2 output
+except ImportError:
+    font_subset = None
+
+# ── Web fonts ──
+# Plus Jakarta Sans is self-hosted from fonts/ when the TTFs and fontTools are available, otherwise loaded from Google Fonts
+FONT_FAMILY = 'Plus Jakarta Sans'
+FONT_FILES = {
+    300: 'PlusJakartaSans-Light.ttf', 400: 'PlusJakartaSans-Regular.ttf', 500: 'PlusJakartaSans-Medium.ttf',
+    600: 'PlusJakartaSans-SemiBold.ttf', 700: 'PlusJakartaSans-Bold.ttf', 800: 'PlusJakartaSans-ExtraBold.ttf',
+}
+FONT_PRELOAD = (400, 700)
+GOOGLE_FONTS = '''<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link href="https://fonts.googleapis.com/css2?family=Plus+Jakarta+Sans:ital,wght@0,300;0,400;0,500;0,600;0,700;0,800&display=swap" rel="stylesheet" media="print" onload="this.media='all'">'''
+
+def used_font_weights(css):
+    weights = {400, 700}  # body text, and the UA bold of headings and <strong>
+    for w in re.findall(r'font-weight:\s*(\d+|bold|normal)', css):
+        weights.add({'bold': 700, 'normal': 400}.get(w) or int(w))
+    return sorted(w for w in weights if w in FONT_FILES)
+
+def used_glyphs(html_pages, extra_text):
+    """Every character the generated pages and the tool data can put on screen, plus printable ASCII for form input."""
+    chars = set(map(chr, range(0x20, 0x7f)))
+    for html in html_pages:
+        chars.update(unescape(re.sub(r'<(script|style)\b.*?</\1>|<[^>]+>', ' ', html, flags=re.S)))
+    chars.update(extra_text)
+    return ''.join(sorted(c for c in chars if c.isprintable()))
+
+def subset_font(ctx, weight, glyphs):
+    """Subset one weight to the glyph set as woff2. Results are cached by font file and glyph set."""
+    path = os.path.join(ctx.fonts_dir, FONT_FILES[weight])
+    with open(path, 'rb') as f:
+        key = hashlib.sha256(f.read() + glyphs.encode('utf-8')).hexdigest()[:16]
+    name = f'fonts/{weight}-{key}.woff2'
+    cached = ctx.read_cache(name)
+    if cached is None:
+        options = font_subset.Options()
+        options.flavor = 'woff2'
+        out = io.BytesIO()
+        with font_subset.load_font(path, options) as font:
+            subsetter = font_subset.Subsetter(options)
+            subsetter.populate(text=glyphs)
+            subsetter.subset(font)
+            font_subset.save_font(font, out, options)
+        cached = out.getvalue()
+        ctx.write_cache(name, cached)
+    return cached
+
+def self_hosted_fonts(ctx, weights, glyphs):
+    """Write the subsetted woff2 files. Returns {weight: url}, or None to fall back to Google Fonts, with a warning on
+    stderr so a deploy without the fonts does not go unnoticed."""
+    missing = [FONT_FILES[w] for w in weights if not os.path.exists(os.path.join(ctx.fonts_dir, FONT_FILES[w]))]
+    if font_subset is None or missing:
+        if font_subset is None:
+            reason = 'fontTools is not installed (pip install fonttools brotli)'
+        else:
+            reason = f'{", ".join(missing)} not found in {ctx.fonts_dir}'
+        print(f'warning: {reason}; pages load {FONT_FAMILY} from Google Fonts', file=sys.stderr)
+        return None
+    return {w: ctx.write_asset(f'fonts/plus-jakarta-sans-{w}.woff2', subset_font(ctx, w, glyphs)) for w in weights}
+
+def font_head(font_urls, prefix):
+    if font_urls is None:
+        return GOOGLE_FONTS
+    preload = ''.join(f'<link rel="preload" href="{prefix}{url}" as="font" type="font/woff2" crossorigin>\n' for w, url in font_urls.items() if w in FONT_PRELOAD)
+    faces = ''.join(f"@font-face{{font-family:'{FONT_FAMILY}';font-style:normal;font-weight:{w};font-display:swap;src:url({prefix}{url}) format('woff2')}}" for w, url in font_urls.items())
+    return f'{preload}<style>{faces}</style>'
@@ -0,0 +1,97 @@
+"""Nearby consultants: the offline city gazetteer (data/cities.csv) and a k-d tree over the cities that have listings.
+
+Cities are indexed as points on the unit sphere, where straight-line (chord) distance orders the same way as distance
+over the earth's surface. The tree is built once per build; each nearby query walks it for the nearest cities only,
+so the cost grows with the log of the number of cities rather than with every pair of listings."""
+
+import csv, heapq, math
+
+EARTH_KM = 6371.0
+NEARBY = 6         # consultants in a nearby block
+NEARBY_KM = 1000   # cities further away than this are not "nearby"
+
+def load_gazetteer(path):
+    """{(city, country) casefolded: (lat, lon)}."""
+    with open(path, encoding='utf-8', newline='') as f:
+        return {(row['city'].casefold(), row['country'].casefold()): (float(row['lat']), float(row['lon']))
+                for row in csv.DictReader(f)}
+
+def unit_vector(lat, lon):
+    lat, lon = math.radians(lat), math.radians(lon)
+    return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat))
+
+def chord_km(chord):
+    return 2 * EARTH_KM * math.asin(min(1.0, chord / 2))
+
+def km_chord(km):
+    return 2 * math.sin(min(math.pi, km / EARTH_KM) / 2)
+
+# ── k-d tree ──
+# A node is (point, item, axis, left, right); None is an empty subtree
+
+def build_tree(points, depth=0):
+    """points: [(xyz, item)]."""
+    if not points:
+        return None
+    axis = depth % 3
+    points = sorted(points, key=lambda p: p[0][axis])
+    mid = len(points) // 2
+    point, item = points[mid]
+    return (point, item, axis, build_tree(points[:mid], depth + 1), build_tree(points[mid + 1:], depth + 1))
+
+def nearest(tree, target, k, max_dist):
+    """The k items nearest target within max_dist, as [(distance, item)] nearest first. Items are ints; at equal
+    distances the smaller one wins, so results never depend on tree shape."""
+    best = []  # max-heap of (-distance, -item)
+
+    def visit(node):
+        if node is None:
+            return
+        point, item, axis, left, right = node
+        d = math.dist(point, target)
+        if d <= max_dist:
+            if len(best) < k:
+                heapq.heappush(best, (-d, -item))
+            elif (-d, -item) > best[0]:
+                heapq.heapreplace(best, (-d, -item))
+        diff = target[axis] - point[axis]
+        near, far = (left, right) if diff < 0 else (right, left)
+        visit(near)
+        # The far side can only hold closer points if the splitting plane is closer than the current k-th best
+        if abs(diff) <= max_dist and (len(best) < k or abs(diff) <= -best[0][0]):
+            visit(far)
+
+    visit(tree)
+    return sorted((-nd, -ni) for nd, ni in best)
+
+class GeoIndex:
+    """Consultants grouped by city, with the cities that appear in the gazetteer indexed for nearest-city queries."""
+
+    def __init__(self, consultants, gazetteer):
+        self.by_city = {}
+        for c in consultants:
+            self.by_city.setdefault((c['city'], c['country']), []).append(c)
+        self.points = {}
+        for key in sorted(self.by_city):
+            latlon = gazetteer.get((key[0].casefold(), key[1].casefold()))
+            if latlon:
+                self.points[key] = unit_vector(*latlon)
+        self.cities = list(self.points)
+        self.tree = build_tree([(xyz, i) for i, xyz in enumerate(self.points.values())])
+
+    def near(self, city, country, k=NEARBY, max_km=NEARBY_KM):
+        """Up to k consultants from the nearest other cities within max_km, as [(consultant, km)], nearest first and in
+        store order within a city. Empty for a city the gazetteer does not know."""
+        target = self.points.get((city, country))
+        if target is None:
+            return []
+        out, cities = [], 1
+        # Ask for more cities until they hold k consultants or there are no more within range
+        while len(out) < k and cities < len(self.points):
+            cities = min(len(self.points), cities * 2 + 1)
+            found = nearest(self.tree, target, cities, km_chord(max_km))
+            out = [(c, round(chord_km(d))) for d, i in found if self.cities[i] != (city, country)
+                   for c in self.by_city[self.cities[i]]]
+            if len(found) < cities:
+                break
+        return out[:k]
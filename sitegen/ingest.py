@@ -0,0 +1,156 @@
+"""Change-feed ingestion: apply consultant upserts and deletes to the data store, then rebuild only the pages they touch.
+
+The feed is JSON Lines, one change per line:
+
+    {"op": "upsert", "consultant": {...a consultants.json record...}}
+    {"op": "delete", "id": "euro-partners-0"}
+
+Changes go to consultants.db when it exists, else to consultants.json. An upsert that matches the stored record is not a
+change, so a daily sync that repeats most of the directory only rebuilds what actually moved."""
+
+import json, os, re, sqlite3
+
+from .context import Context
+from .dedup import find_duplicates
+from .geo import GeoIndex, load_gazetteer
+from .similar import SimilarIndex
+from .layout import slug
+from .pipeline import Config, build
+from .store import REQUIRED_KEYS, JsonStore, SqliteStore, delete_consultant, upsert_consultant
+
+FEATURED = 12  # consultants on the homepage; matches listings
+ID = re.compile(r'[a-z0-9-]+')  # ids name output files (consultant/<id>.html), so nothing that could leave that folder
+
+def read_feed(lines):
+    changes = []
+    for n, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            change = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f'feed line {n}: {e}') from None
+        if not isinstance(change, dict):
+            raise ValueError(f'feed line {n}: a change must be a JSON object')
+        op = change.get('op')
+        if op == 'upsert':
+            if not isinstance(change.get('consultant'), dict):
+                raise ValueError(f'feed line {n}: upsert needs a consultant object')
+            missing = [k for k in REQUIRED_KEYS if k not in change['consultant']]
+            if missing:
+                raise ValueError(f'feed line {n}: consultant is missing {", ".join(missing)}')
+            cid = change['consultant']['id']
+        elif op == 'delete':
+            if not change.get('id'):
+                raise ValueError(f'feed line {n}: delete needs an id')
+            cid = change['id']
+        else:
+            raise ValueError(f'feed line {n}: unknown op {op!r}')
+        if not isinstance(cid, str) or not ID.fullmatch(cid):
+            raise ValueError(f'feed line {n}: invalid id {cid!r} (lowercase letters, digits and hyphens only)')
+        changes.append(change)
+    return changes
+
+def change_id(change):
+    return change['consultant']['id'] if change['op'] == 'upsert' else change['id']
+
+def snapshot(store, ids, gazetteer):
+    """What the affected-page computation needs from the store: the changed records and the site-wide aggregates."""
+    geo = GeoIndex(store.all(), gazetteer)
+    return {
+        'records': {c['id']: c for c in store.get_many(ids)},
+        'countries': store.country_counts(),
+        'sectors': store.sector_counts(),
+        'featured': [c['id'] for c in store.all(FEATURED)],
+        # Nearby blocks are per city: shown on the city page and on every profile there
+        'nearby': {key: geo.near(*key) for key in geo.by_city},
+        'cities': geo.by_city,
+        'similar': SimilarIndex(store.all()),
+    }
+
+def listing_paths(c):
+    paths = {f'country/{slug(c["country"])}.html', f'city/{slug(c["city"])}.html'}
+    paths.update(f'sector/{slug(s)}.html' for s in c['sectors'] if s != 'All Sectors')
+    return paths
+
+def affected_paths(before, after):
+    """Output pages whose content differs between two snapshots."""
+    changed = {cid for cid in before['records'].keys() | after['records'].keys()
+               if before['records'].get(cid) != after['records'].get(cid)}
+    if not changed:
+        return set()
+    paths = {'consultants.html'}  # every card, plus the filter counts
+    for cid in changed:
+        paths.add(f'consultant/{cid}.html')
+        for snap in (before, after):
+            if cid in snap['records']:
+                paths |= listing_paths(snap['records'][cid])
+    counts_changed = before['countries'] != after['countries'] or before['sectors'] != after['sectors']
+    if counts_changed or before['featured'] != after['featured'] or changed & set(after['featured']):
+        paths.add('index.html')
+    if before['countries'] != after['countries']:
+        paths.add('countries.html')
+    if before['sectors'] != after['sectors']:
+        paths.add('sectors.html')
+    for key in before['nearby'].keys() | after['nearby'].keys():
+        if before['nearby'].get(key) != after['nearby'].get(key):
+            paths.add(f'city/{slug(key[0])}.html')
+            paths.update(f'consultant/{c["id"]}.html' for c in after['cities'].get(key, ()))
+    # Similar strips: only profiles that share an LSH bucket with a changed consultant can have moved
+    for cid in changed:
+        for other in before['similar'].neighbours(cid) | after['similar'].neighbours(cid):
+            if before['similar'].similar(other) != after['similar'].similar(other):
+                paths.add(f'consultant/{other}.html')
+    return paths
+
+def apply_json(path, changes):
+    with open(path, encoding='utf-8') as f:
+        consultants = json.load(f)
+    index = {c['id']: i for i, c in enumerate(consultants)}
+    for change in changes:
+        cid = change_id(change)
+        if change['op'] == 'upsert':
+            if cid in index:
+                consultants[index[cid]] = change['consultant']
+            else:
+                index[cid] = len(consultants)
+                consultants.append(change['consultant'])
+        elif cid in index:
+            consultants[index.pop(cid)] = None
+    consultants = [c for c in consultants if c is not None]
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(consultants, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    os.replace(tmp, path)
+    return consultants
+
+def apply_sqlite(path, changes):
+    db = sqlite3.connect(path)
+    with db:
+        for change in changes:
+            if change['op'] == 'upsert':
+                upsert_consultant(db, change['consultant'])
+            else:
+                delete_consultant(db, change['id'])
+    db.close()
+
+def ingest(base, changes, writer=None, clock=None):
+    """Apply changes to the store under base and rebuild the pages they touch into writer (default build/).
+    Returns (the affected paths, the Site, or None when nothing changed). A rebuild also refreshes the duplicate report."""
+    ctx = Context(base, None)
+    ids = {change_id(c) for c in changes}
+    gazetteer = load_gazetteer(ctx.gazetteer_file)
+    if os.path.exists(ctx.db_file):
+        before = snapshot(SqliteStore(ctx.db_file), ids, gazetteer)
+        apply_sqlite(ctx.db_file, changes)
+        store = SqliteStore(ctx.db_file)
+    else:
+        before = snapshot(JsonStore(ctx.consultants), ids, gazetteer)
+        store = JsonStore(apply_json(ctx.data_file, changes))
+    paths = affected_paths(before, snapshot(store, ids, gazetteer))
+    if not paths:
+        return paths, None
+    site = build(Config(base, paths=sorted(paths), writer=writer, clock=clock))
+    site.writer.save_record('duplicates', find_duplicates(store.all()))
+    return paths, site
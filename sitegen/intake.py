@@ -0,0 +1,251 @@
+"""Form intake service: receives the consultation-request and listing-submission forms and stores them in SQLite.
+
+    python -m sitegen.intake --db submissions.db --port 8787
+    python -m sitegen.intake --bench 20000 --concurrency 200
+
+A plain asyncio HTTP/1.1 server (keep-alive, urlencoded bodies) with no dependencies. Accepted posts go onto a bounded
+queue; one writer task drains it in batches, each written in a single transaction off the event loop. A request is only
+answered once its batch has committed, and when the queue is full new posts get 503 + Retry-After instead of piling up
+in memory. Honeypot hits are answered like any other post and dropped."""
+
+import argparse, asyncio, json, os, sqlite3, sys, time
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlencode
+
+from .layout import FORM_ACTION
+
+THANK_YOU = '/thank-you.html'
+HONEYPOT = 'bot-field'
+MAX_BODY = 64 * 1024
+QUEUE_MAX = 10000
+BATCH = 500
+RETRY_AFTER = 1
+
+# form-name -> required fields
+FORMS = {
+    'inquiry': ('consultant_id', 'consultant', 'name', 'email', 'consent'),
+    'listing-submission': ('company', 'website', 'country', 'city', 'email', 'description', 'consent'),
+}
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS submissions (
+  id INTEGER PRIMARY KEY,
+  received_at TEXT NOT NULL,
+  form TEXT NOT NULL,
+  fields TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS submissions_form ON submissions (form, received_at);
+'''
+
+class BadRequest(Exception):
+    pass
+
+def validate(body):
+    """(form name, fields) for a urlencoded form post, or (None, None) for a honeypot hit. Raises BadRequest."""
+    fields = {k: v[0].strip() for k, v in parse_qs(body.decode('utf-8', 'replace'), keep_blank_values=True).items()}
+    if fields.pop(HONEYPOT, ''):
+        return None, None
+    form = fields.pop('form-name', '')
+    if form not in FORMS:
+        raise BadRequest(f'unknown form {form!r}')
+    missing = [k for k in FORMS[form] if not fields.get(k)]
+    if missing:
+        raise BadRequest(f'missing {", ".join(missing)}')
+    if '@' not in fields['email']:
+        raise BadRequest('invalid email')
+    return form, fields
+
+# ── Storage ──
+
+def open_db(path):
+    db = sqlite3.connect(path, check_same_thread=False)
+    db.execute('PRAGMA journal_mode=WAL')
+    db.execute('PRAGMA synchronous=NORMAL')
+    db.executescript(SCHEMA)
+    return db
+
+def write_batch(db, rows):
+    with db:
+        db.executemany('INSERT INTO submissions (received_at, form, fields) VALUES (?, ?, ?)', rows)
+
+class Intake:
+    def __init__(self, db_path, redirect=THANK_YOU):
+        self.db = open_db(db_path)
+        self.redirect = redirect
+        self.queue = asyncio.Queue(QUEUE_MAX)
+        self.stored = 0
+
+    async def writer(self):
+        """Drain the queue in batches; each waiting request is released when its batch commits. Nothing waits for a
+        batch to fill: whatever queued while the previous batch was being written goes in the next one."""
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < BATCH and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            # A request that gave up waiting (its client went away) has a cancelled future; its row is still written.
+            # Nothing here may end the loop: this task is the only writer, and without it every later POST would hang
+            try:
+                try:
+                    await asyncio.to_thread(write_batch, self.db, [row for row, _ in batch])
+                except sqlite3.Error as e:
+                    print(f'intake: batch of {len(batch)} not stored: {e}', file=sys.stderr)
+                    for _, done in batch:
+                        if not done.done():
+                            done.set_exception(e)
+                else:
+                    self.stored += len(batch)
+                    for _, done in batch:
+                        if not done.done():
+                            done.set_result(None)
+            except Exception as e:
+                print(f'intake: writer error: {e!r}', file=sys.stderr)
+                for _, done in batch:
+                    if not done.done():
+                        done.set_exception(e)
+
+    async def submit(self, form, fields):
+        """Queue one submission and wait until it is stored. Raises asyncio.QueueFull when the queue is full."""
+        done = asyncio.get_running_loop().create_future()
+        row = (datetime.now(timezone.utc).isoformat(timespec='seconds'), form, json.dumps(fields, ensure_ascii=False))
+        self.queue.put_nowait((row, done))
+        await done
+
+    async def handle(self, method, path, body):
+        """(status, extra headers, body) for one request."""
+        if path == '/healthz' and method == 'GET':
+            return 200, {}, json.dumps({'queued': self.queue.qsize(), 'stored': self.stored}).encode()
+        if path != FORM_ACTION:
+            return 404, {}, b'not found\n'
+        if method != 'POST':
+            return 405, {'Allow': 'POST'}, b'method not allowed\n'
+        try:
+            form, fields = validate(body)
+            if form is not None:
+                await self.submit(form, fields)
+        except BadRequest as e:
+            return 400, {}, f'{e}\n'.encode()
+        except asyncio.QueueFull:
+            return 503, {'Retry-After': str(RETRY_AFTER)}, b'busy, try again shortly\n'
+        except Exception:  # the writer has logged why
+            return 500, {}, b'could not store the submission\n'
+        return 303, {'Location': self.redirect}, b''
+
+    async def connection(self, reader, writer):
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                if body is None:
+                    status, extra, payload = 413, {}, b'request too large\n'
+                else:
+                    status, extra, payload = await self.handle(method, path, body)
+                keep_alive = headers.get('connection', '').lower() != 'close' and body is not None
+                writer.write(response(status, extra, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+STATUS = {200: 'OK', 303: 'See Other', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+          413: 'Content Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+async def read_request(reader):
+    """(method, path, headers, body) or None at end of stream. body is None when it exceeds MAX_BODY."""
+    line = await reader.readline()
+    if not line:
+        return None
+    method, target, _ = line.decode('latin-1').split(' ', 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get('content-length', 0))
+    if length > MAX_BODY:
+        return method, target.split('?')[0], headers, None
+    return method, target.split('?')[0], headers, await reader.readexactly(length)
+
+def response(status, extra, payload, keep_alive):
+    head = [f'HTTP/1.1 {status} {STATUS[status]}', f'Content-Length: {len(payload)}', 'Content-Type: text/plain; charset=utf-8',
+            f'Connection: {"keep-alive" if keep_alive else "close"}']
+    head += [f'{k}: {v}' for k, v in extra.items()]
+    return ('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + payload
+
+async def serve(db_path, host, port, redirect=THANK_YOU):
+    intake = Intake(db_path, redirect)
+    writer = asyncio.create_task(intake.writer())
+    server = await asyncio.start_server(intake.connection, host, port)
+    return intake, server, writer
+
+# ── Benchmark ──
+
+async def bench(total, concurrency, db_path):
+    """Post total valid inquiries over concurrency keep-alive connections; report sustained submissions per second."""
+    intake, server, writer = await serve(db_path, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    body = urlencode({'form-name': 'inquiry', 'consultant_id': 'bench', 'consultant': 'Bench Consulting', 'name': 'Load Test',
+                      'email': 'load@example.com', 'company': 'Example', 'message': 'Benchmark submission', 'consent': 'yes'}).encode()
+    request = (f'POST {FORM_ACTION} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/x-www-form-urlencoded\r\n'
+               f'Content-Length: {len(body)}\r\n\r\n').encode() + body
+    counts = {}
+
+    async def client(n):
+        reader, w = await asyncio.open_connection('127.0.0.1', port)
+        for _ in range(n):
+            w.write(request)
+            await w.drain()
+            status = int((await reader.readline()).split()[1])
+            length = 0
+            while (line := await reader.readline()) not in (b'\r\n', b''):
+                if line.lower().startswith(b'content-length:'):
+                    length = int(line.split(b':')[1])
+            await reader.readexactly(length)
+            counts[status] = counts.get(status, 0) + 1
+        w.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(total // concurrency + (i < total % concurrency)) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    server.close()
+    writer.cancel()
+    print(f'{total} posts over {concurrency} connections in {elapsed:.2f}s: {total / elapsed:.0f} submissions/s, '
+          f'{intake.stored} stored, responses {dict(sorted(counts.items()))}')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sitegen.intake', description='Run the form intake service.')
+    parser.add_argument('--db', default='submissions.db', help='SQLite file for submissions (default: submissions.db)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8787)
+    parser.add_argument('--redirect', default=THANK_YOU, help=f'where a browser goes after posting (default: {THANK_YOU})')
+    parser.add_argument('--bench', type=int, metavar='N', help='instead of serving, post N submissions to a local instance and report throughput')
+    parser.add_argument('--concurrency', type=int, default=100, help='client connections for --bench (default: 100)')
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        db_path = f'{args.db}.bench'
+        asyncio.run(bench(args.bench, args.concurrency, db_path))
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+        return
+
+    async def run():
+        _, server, _ = await serve(args.db, args.host, args.port, args.redirect)
+        print(f'Intake listening on http://{args.host}:{args.port}{FORM_ACTION}, storing to {args.db}')
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        sys.exit(0)
+
+if __name__ == '__main__':
+    main()
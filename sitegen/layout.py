@@ -0,0 +1,203 @@
+"""Page chrome and the markup shared by every page family: header, footer, icons, cards and schema."""
+
+import json, re
+from html import escape
+
+FLAGS = {
+    'United Kingdom': '🇬🇧', 'Germany': '🇩🇪', 'France': '🇫🇷',
+    'Spain': '🇪🇸', 'Netherlands': '🇳🇱', 'United States': '🇺🇸',
+    'Switzerland': '🇨🇭', 'Belgium': '🇧🇪', 'Poland': '🇵🇱',
+    'Finland': '🇫🇮', 'Sweden': '🇸🇪', 'Ireland': '🇮🇪',
+    'Norway': '🇳🇴', 'Luxembourg': '🇱🇺', 'Greece': '🇬🇷',
+    'Italy': '🇮🇹', 'Austria': '🇦🇹', 'Denmark': '🇩🇰',
+    'Portugal': '🇵🇹', 'Czech Republic': '🇨🇿',
+}
+
+def flag(country):
+    return FLAGS.get(country, '🇪🇺')
+
+def slug(s):
+    return re.sub(r'[^a-z0-9]+', '-', s.lower()).strip('-')
+
+def country_counts(consultants):
+    cc = {}
+    for c in consultants:
+        cc[c['country']] = cc.get(c['country'], 0) + 1
+    return dict(sorted(cc.items(), key=lambda x: (-x[1], x[0])))
+
+def sector_counts(consultants):
+    sc = {}
+    for c in consultants:
+        for s in c['sectors']:
+            if s != 'All Sectors':
+                sc[s] = sc.get(s, 0) + 1
+    return dict(sorted(sc.items(), key=lambda x: (-x[1], x[0])))
+
+def city_counts(consultants):
+    cc = {}
+    for c in consultants:
+        key = (c['city'], c['country'])
+        cc[key] = cc.get(key, 0) + 1
+    return dict(sorted(cc.items(), key=lambda x: (-x[1], x[0])))
+
+# ── Icons ──
+# Every icon is a <symbol> in one cached sprite; pages only carry a <use> reference to it.
+# name -> (default size, symbol body on a 24x24 stroke grid)
+ICONS = {
+    'pin': (14, '<path d="M21 10c0 7-9 13-9 13s-9-6-9-13a9 9 0 0 1 18 0z"/><circle cx="12" cy="10" r="3"/>'),
+    'globe': (16, '<circle cx="12" cy="12" r="10"/><line x1="2" y1="12" x2="22" y2="12"/><path d="M12 2a15.3 15.3 0 0 1 4 10 15.3 15.3 0 0 1-4 10 15.3 15.3 0 0 1-4-10 15.3 15.3 0 0 1 4-10z"/>'),
+    'link': (16, '<path d="M18 13v6a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V8a2 2 0 0 1 2-2h6"/><polyline points="15 3 21 3 21 9"/><line x1="10" y1="14" x2="21" y2="3"/>'),
+    'check': (14, '<path d="M22 11.08V12a10 10 0 1 1-5.93-9.14"/><polyline points="22 4 12 14.01 9 11.01"/>'),
+}
+# Stand-in for the sprite URL; the post-render pass swaps it for the fingerprinted file relative to each page
+ICON_SPRITE = 'icons.svg'
+
+def icon(name, size=None):
+    size = size or ICONS[name][0]
+    return f'<svg width="{size}" height="{size}" aria-hidden="true"><use href="{ICON_SPRITE}#i-{name}"></use></svg>'
+
+def icon_sprite():
+    symbols = ''.join(f'<symbol id="i-{name}" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" '
+                      f'stroke-linecap="round" stroke-linejoin="round">{body}</symbol>' for name, (_, body) in ICONS.items())
+    return f'<svg xmlns="http://www.w3.org/2000/svg">{symbols}</svg>'
+
+# ── Layout ──
+# Site forms post here; the deployment routes it to the intake service (python -m sitegen.intake)
+FORM_ACTION = '/forms'
+
+def untranslated(text):
+    return text
+
+# {css_path} leads to pages that exist in every locale, {root_path} to the site root: assets and English-only pages
+def header(t=untranslated):
+    return f'''<!DOCTYPE html>
+<html lang="{{lang}}">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<meta name="google-site-verification" content="lz-CmQYG7LZE-G7RL7IPztnLW2yL4FKL-g5lXHoplgA" />
+<meta name="description" content="{{meta_desc}}">
+<title>{{title}} | AI Act Advisors</title>
+<!-- fonts -->
+<link rel="stylesheet" href="{{root_path}}static/css/style.css">
+<link rel="icon" href="{{root_path}}static/images/favicon.svg" type="image/svg+xml">
+</head>
+<body>
+<div class="urgency-bar">
+  <strong><span data-countdown></span> {t("days")}</strong> {t("until EU AI Act high-risk deadline (August 2026) — Find your compliance consultant now")}
+</div>
+<header class="site-header">
+  <div class="header-inner">
+    <a href="{{css_path}}index.html" class="site-logo">AI Act <span>Advisors</span></a>
+    <button class="mobile-toggle" onclick="document.querySelector('.main-nav').classList.toggle('open')" aria-label="{t("Menu")}">&#9776;</button>
+    <nav class="main-nav">
+      <a href="{{css_path}}consultants.html">{t("All Consultants")}</a>
+      <a href="{{css_path}}countries.html">{t("By Country")}</a>
+      <a href="{{css_path}}sectors.html">{t("By Sector")}</a>
+      <a href="{{root_path}}blog.html">{t("Resources")}</a>
+      <a href="{{root_path}}products.html">{t("Free Tools")}</a>
+      <a href="{{root_path}}list-your-practice.html" class="nav-cta">{t("List Your Practice")}</a>
+    </nav>
+  </div>
+</header>'''
+
+def footer(site_js, t=untranslated):
+    return f'''<footer class="site-footer">
+  <div class="container">
+    <div class="footer-grid">
+      <div>
+        <h4>AI Act Advisors</h4>
+        <p class="footer-about">{t("Europe's directory for EU AI Act compliance consultants, ethics advisors, and governance experts. Find, compare, and contact the right expert for your organisation.")}</p>
+      </div>
+      <div>
+        <h4>{t("Directory")}</h4>
+        <a href="{{css_path}}consultants.html">{t("All Consultants")}</a>
+        <a href="{{css_path}}countries.html">{t("Browse by Country")}</a>
+        <a href="{{css_path}}sectors.html">{t("Browse by Sector")}</a>
+      </div>
+      <div>
+        <h4>{t("Resources")}</h4>
+        <a href="{{root_path}}blog.html">{t("Blog")}</a>
+        <a href="{{root_path}}about.html">{t("About Us")}</a>
+        <a href="{{root_path}}list-your-practice.html">{t("List Your Practice")}</a>
+      </div>
+      <div>
+        <h4>{t("Legal")}</h4>
+        <a href="{{root_path}}privacy.html">{t("Privacy Policy")}</a>
+        <a href="{{root_path}}terms.html">{t("Terms of Use")}</a>
+        <a href="{{root_path}}disclaimer.html">{t("Disclaimer")}</a>
+      </div>
+    </div>
+    <div class="footer-bottom">
+      <p>&copy; 2026 AI Act Advisors. {t("All rights reserved.")}</p>
+      <p class="footer-disclaimer">{t("AI Act Advisors is an independent directory service. Listings are informational only and do not constitute endorsement. Verify consultant qualifications independently. This site does not provide legal advice. For legal guidance, consult a qualified professional.")}</p>
+    </div>
+  </div>
+</footer>
+<div id="cookie-banner" class="cookie-banner">
+  <div class="cookie-banner-inner">
+    <p>{t("We use cookies for analytics only (Google Analytics 4 with anonymised IPs). No marketing cookies.")} <a href="{{root_path}}privacy.html">{t("Privacy Policy")}</a></p>
+    <div class="cookie-actions"><button class="cookie-accept" data-consent="accepted">{t("Accept")}</button><button class="cookie-decline" data-consent="declined">{t("Decline")}</button></div>
+  </div>
+</div>
+<script src="{{root_path}}{site_js}" defer></script>
+</body>
+</html>'''
+
+def page(ctx, title, meta_desc, body_html, css_path=''):
+    root_path = ctx.to_root + css_path
+    h = header(ctx.t).replace('{title}', escape(title)).replace('{meta_desc}', escape(meta_desc)).replace('{css_path}', css_path).replace('{{title}}', escape(title)).replace('{{meta_desc}}', escape(meta_desc)).replace('{{css_path}}', css_path)
+    h = h.replace('{root_path}', root_path).replace('{lang}', ctx.locale or 'en')
+    f = footer(ctx.scripts['site'], ctx.t).replace('{css_path}', css_path).replace('{root_path}', root_path)
+    return h + body_html + f
+
+def consultant_card(c, css_path='', t=untranslated):
+    badge = ''
+    if c['verificationLevel'] == 'basic-verified':
+        badge = f'<span class="badge badge-verified">{icon("check")} {t("Verified")}</span>'
+    elif c['verificationLevel'] == 'premium':
+        badge = f'<span class="badge badge-premium">★ {t("Premium")}</span>'
+
+    size_badge = ''
+    if c['companySize'] == 'enterprise':
+        size_badge = f'<span class="badge badge-enterprise">{t("Enterprise")}</span>'
+    elif c['companySize'] == 'boutique':
+        size_badge = f'<span class="badge badge-boutique">{t("Boutique")}</span>'
+
+    tags = ''.join(f'<span class="card-tag">{escape(s)}</span>' for s in c['services'][:4])
+
+    return f'''<div class="listing-card" data-track="consultant" data-id="{c['id']}" data-country="{escape(c['country'])}" data-city="{escape(c['city'])}" data-size="{c['companySize']}" data-services="{','.join(c['services'])}" data-sectors="{','.join(c['sectors'])}">
+  <div class="card-header">
+    <h3><a href="{css_path}consultant/{c['id']}.html">{escape(c['name'])}</a></h3>
+    <div>{badge} {size_badge}</div>
+  </div>
+  <div class="card-location">{icon("pin")} {escape(c['city'])}, {escape(t(c['country']))}</div>
+  <p class="card-desc">{escape(c['description'])}</p>
+  <div class="card-tags">{tags}</div>
+  <div class="card-footer">
+    <a href="{css_path}consultant/{c['id']}.html">{t("View Profile →")}</a>
+    <a href="{escape(c['website'])}" target="_blank" rel="noopener">{icon("link")} {t("Website")}</a>
+  </div>
+</div>'''
+
+def country_card(country, count, t=untranslated):
+    return f'<a href="country/{slug(country)}.html" class="country-card" data-track="country"><span class="flag">{flag(country)}</span><div class="count">{count}</div><div class="name">{escape(t(country))}</div></a>'
+
+# ── Schema markup ──
+def schema_consultant(c):
+    return f'''<script type="application/ld+json">
+{{
+  "@context": "https://schema.org",
+  "@type": "ProfessionalService",
+  "name": "{escape(c['name'])}",
+  "description": "{escape(c['description'])}",
+  "url": "{escape(c['website'])}",
+  "address": {{
+    "@type": "PostalAddress",
+    "addressLocality": "{escape(c['city'])}",
+    "addressCountry": "{escape(c['country'])}"
+  }},
+  "areaServed": "Europe",
+  "serviceType": {json.dumps(c['services'])}
+}}
+</script>'''
@@ -0,0 +1,61 @@
+"""Locales: translated copies of the directory pages (the listings and profiles families) under /<locale>/.
+
+Each locales/<code>.json catalog maps English strings to their translation, and every catalog there is a site locale.
+Strings a catalog lacks stay in English, as do the consultants' own names, descriptions, services and languages, the
+filter values the scripts match on, and the pages outside the directory, which locale pages link back to. Each page
+and its translations point at one another with hreflang alternates."""
+
+import json, os
+
+from .context import Context
+from .pages import family_for
+from .sitemap import SITE_URL
+from .writers import OverlayWriter
+
+TRANSLATED = ('listings', 'profiles')
+DEFAULT_LOCALE = 'en'
+# What a locale context inherits from the English pass rather than rebuilding: the consultant data and the indexes
+# over it, the script bundles, the critical CSS already derived for every page template, and the build caches
+SHARED = ('geo', 'similar', 'scripts', 'critical_cache', 'css_rules', 'locales', 'cache_dir', 'memory_cache')
+
+def site_locales(base):
+    """Codes of the catalogs in base/locales, sorted."""
+    folder = os.path.join(base, 'locales')
+    if not os.path.isdir(folder):
+        return ()
+    return tuple(sorted(name[:-len('.json')] for name in os.listdir(folder) if name.endswith('.json')))
+
+def load_catalog(ctx, code):
+    with open(os.path.join(ctx.locales_dir, f'{code}.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+def catalog_text(ctx):
+    """Every translated string, so the font subsets cover the characters locale pages use."""
+    return ''.join(''.join(load_catalog(ctx, code).values()) for code in ctx.locales)
+
+def split_locale(path, locales):
+    """(locale or None, the English output path) for an output path."""
+    head, _, rest = path.partition('/')
+    return (head, rest) if rest and head in locales else (None, path)
+
+def alternates(path, locales):
+    """hreflang links for a page of a translated family, or '' for any other page."""
+    _, english = split_locale(path, locales)
+    if not locales or family_for(english) not in TRANSLATED:
+        return ''
+    links = [f'<link rel="alternate" hreflang="{DEFAULT_LOCALE}" href="{SITE_URL}{english}">']
+    links += [f'<link rel="alternate" hreflang="{code}" href="{SITE_URL}{code}/{english}">' for code in locales]
+    links.append(f'<link rel="alternate" hreflang="x-default" href="{SITE_URL}{english}">')
+    return '\n'.join(links) + '\n'
+
+def locale_context(ctx, code):
+    """A context that renders code's pages on top of the English pass in ctx. Its writes are kept in an overlay for the
+    caller to collect; reads and records (the site assets) fall through to ctx's writer. It queries ctx's store, so it
+    must stay in ctx's process (see pipeline.render_locale for forked workers)."""
+    lctx = Context(ctx.base, OverlayWriter(ctx.writer), ctx.paths, clock=ctx.clock)
+    for name in SHARED:
+        if name in ctx.__dict__:
+            lctx.__dict__[name] = ctx.__dict__[name]
+    lctx.store = ctx.store
+    lctx.locale, lctx.catalog, lctx.to_root = code, load_catalog(ctx, code), '../'
+    return lctx
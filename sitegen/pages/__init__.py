@@ -0,0 +1,38 @@
+"""Page families. Each module has a render(ctx) that writes its pages; modules are imported only when a build needs them."""
+
+import re
+from importlib import import_module
+
+FAMILIES = ('listings', 'profiles', 'blog', 'legal', 'tools')
+
+# Output path (exact, or prefix ending in /) -> family, for targeted single-page builds. Under a prefix, a page is named
+# by one slug: consultant/<id>.html, blog/<slug>.html
+FAMILY_PATHS = {
+    'consultant/': 'profiles',
+    'country/': 'listings', 'sector/': 'listings', 'city/': 'listings',
+    'index.html': 'listings', 'consultants.html': 'listings', 'countries.html': 'listings', 'sectors.html': 'listings',
+    'blog/': 'blog', 'blog.html': 'blog',
+    'quiz.html': 'tools', 'adventure.html': 'tools', 'jargon-buster.html': 'tools', 'products.html': 'tools',
+    'about.html': 'legal', 'privacy.html': 'legal', 'terms.html': 'legal', 'disclaimer.html': 'legal',
+    'list-your-practice.html': 'legal', '404.html': 'legal',
+}
+PAGE_NAME = re.compile(r'[a-z0-9-]+\.html')
+
+def family_for(path):
+    """The family that builds an output page, or None when no family does."""
+    for key, family in FAMILY_PATHS.items():
+        if path == key or (key.endswith('/') and path.startswith(key) and PAGE_NAME.fullmatch(path[len(key):])):
+            return family
+    return None
+
+def data_page(path):
+    """True for pages that exist only while their data does (a consultant, a country, a blog post), which a targeted
+    build removes when they no longer render. Every other page always renders."""
+    return family_for(path) is not None and any(key.endswith('/') and path.startswith(key) for key in FAMILY_PATHS)
+
+def removed_pages(paths, rendered, families):
+    """The requested paths of the built families whose data is gone."""
+    return {p for p in paths if data_page(p) and family_for(p) in families} - rendered
+
+def load_family(name):
+    return import_module(f'{__name__}.{name}')
@@ -0,0 +1,23 @@
+"""Blog post pages and the blog index, generated from the content/blog collection."""
+
+from ..content import blog_card, load_posts
+from ..layout import page
+
+def render(ctx):
+    posts = load_posts(ctx)
+    for post in posts:
+        path = f'blog/{post["slug"]}.html'
+        if ctx.wants(path):
+            ctx.write_page(path, page(ctx, post['title'], post['description'], post['body'], '../'))
+
+    if not ctx.wants('blog.html'):
+        return
+    blog_body = f'''
+<div class="static-page">
+  <h1>AI Act Resources</h1>
+  <p>Guides, analysis, and updates on EU AI Act compliance.</p>
+  <div class="blog-list">
+{''.join(blog_card(p) for p in posts)}  </div>
+</div>
+'''
+    ctx.write_page('blog.html', page(ctx, 'AI Act Resources & Blog', 'Guides and analysis on EU AI Act compliance. Practical resources for businesses navigating AI regulation.', blog_body))
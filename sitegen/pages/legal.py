@@ -0,0 +1,130 @@
+"""Static pages: about, privacy, terms, disclaimer, list your practice and 404."""
+
+from ..layout import FORM_ACTION, page
+
+def render(ctx):
+    # About
+    about_body = '''
+<div class="static-page">
+  <h1>About AI Act Advisors</h1>
+  <p>AI Act Advisors is Europe's dedicated directory for finding EU AI Act compliance consultants, ethics advisors, and governance experts.</p>
+  <h2>Why We Exist</h2>
+  <p>The EU AI Act introduces sweeping compliance requirements for businesses deploying AI systems across Europe. With the high-risk systems deadline approaching in August 2026, thousands of companies need expert help — but finding the right consultant means clicking through dozens of individual firm websites with no way to compare.</p>
+  <p>AI Act Advisors solves this by aggregating verified consultants into one searchable, filterable directory. Think of us as the comparison platform that connects businesses with the compliance expertise they need.</p>
+  <h2>How Listings Work</h2>
+  <p>We research and verify consultants from publicly available sources including firm websites, professional directories, and EU Commission expert groups. Every listing is checked to confirm the firm actively offers AI Act compliance services.</p>
+  <p>Consultants can claim and enhance their free listing at any time. We also offer premium placement for firms seeking greater visibility.</p>
+  <h2>Contact</h2>
+  <p>For questions, corrections, or partnership inquiries: <strong>info@aiactadvisors.com</strong></p>
+</div>
+'''
+    ctx.write_page('about.html', page(ctx, 'About AI Act Advisors', 'About AI Act Advisors — Europe\'s directory for EU AI Act compliance consultants.', about_body))
+
+    # Privacy Policy
+    privacy_body = '''
+<div class="static-page">
+  <h1>Privacy Policy</h1>
+  <p><em>Last updated: February 2026</em></p>
+  <h2>Who We Are</h2>
+  <p>AI Act Advisors ("we", "us") operates aiactadvisors.com, a directory of EU AI Act compliance consultants.</p>
+  <h2>Data We Collect</h2>
+  <p><strong>Visitor data:</strong> We use Google Analytics 4 with anonymised IP addresses to understand how visitors use our site. Analytics only run after you consent via our cookie banner.</p>
+  <p><strong>Inquiry form data:</strong> When you submit a consultation request, we collect your name, email, company name, and message. This data is shared only with the consultant(s) you select.</p>
+  <p><strong>Consultant data:</strong> We publish business information about compliance consultants based on publicly available data (legitimate interest) or information they submit directly (consent).</p>
+  <h2>Lawful Basis</h2>
+  <p>Visitor analytics: consent. Inquiry forms: consent (checkbox required). Consultant listings: legitimate interest for publicly available business data; consent for self-submitted data.</p>
+  <h2>Your Rights</h2>
+  <p>Under GDPR, you have the right to access, correct, delete, restrict, or port your data. Contact us at info@aiactadvisors.com and we will respond within 30 days.</p>
+  <h2>Right to Be Forgotten</h2>
+  <p>If a consultant requests removal of their listing, we will delete it within 72 hours.</p>
+  <h2>Cookies</h2>
+  <p>We use a cookie consent banner. Analytics cookies are only set after you accept. No marketing or third-party tracking cookies are used.</p>
+  <h2>Contact</h2>
+  <p>For data requests: <strong>info@aiactadvisors.com</strong></p>
+</div>
+'''
+    ctx.write_page('privacy.html', page(ctx, 'Privacy Policy', 'AI Act Advisors privacy policy. How we collect, use, and protect your data under GDPR.', privacy_body))
+
+    # Terms
+    terms_body = '''
+<div class="static-page">
+  <h1>Terms of Use</h1>
+  <p><em>Last updated: February 2026</em></p>
+  <h2>Acceptance</h2>
+  <p>By using aiactadvisors.com, you agree to these terms.</p>
+  <h2>Directory Purpose</h2>
+  <p>AI Act Advisors is an informational directory. We aggregate publicly available information about EU AI Act compliance consultants to help businesses find appropriate expertise.</p>
+  <h2>No Legal Advice</h2>
+  <p>Nothing on this site constitutes legal advice. The directory is for informational purposes only. For legal guidance on AI Act compliance, consult a qualified professional.</p>
+  <h2>No Endorsement</h2>
+  <p>Listing a consultant on our directory does not constitute endorsement of their services, qualifications, or competence. Users are responsible for independently verifying consultant credentials before engagement.</p>
+  <h2>Accuracy</h2>
+  <p>We make reasonable efforts to ensure listing accuracy but cannot guarantee all information is current or complete. Listings are based on publicly available information and self-reported data.</p>
+  <h2>Limitation of Liability</h2>
+  <p>AI Act Advisors shall not be liable for any damages arising from the use of this directory, reliance on listing information, or engagement with listed consultants.</p>
+  <h2>Contact</h2>
+  <p>Questions about these terms: <strong>info@aiactadvisors.com</strong></p>
+</div>
+'''
+    ctx.write_page('terms.html', page(ctx, 'Terms of Use', 'AI Act Advisors terms of use.', terms_body))
+
+    # Disclaimer
+    disclaimer_body = '''
+<div class="static-page">
+  <h1>Disclaimer</h1>
+  <p>AI Act Advisors is an independent directory service. Listings are informational only and do not constitute endorsement of any consultant, firm, or service.</p>
+  <p>Verify consultant qualifications independently before making any engagement decisions. This site does not provide legal advice. For legal guidance on EU AI Act compliance, consult a qualified professional.</p>
+  <p>Listing information is based on publicly available sources and self-reported data. We make reasonable efforts to verify accuracy but cannot guarantee completeness or currency of all information.</p>
+  <p>If you represent a listed company and wish to update or remove your listing, contact <strong>info@aiactadvisors.com</strong>.</p>
+</div>
+'''
+    ctx.write_page('disclaimer.html', page(ctx, 'Disclaimer', 'AI Act Advisors disclaimer. Listings are informational only.', disclaimer_body))
+
+    # List Your Practice
+    list_body = f'''
+<div class="static-page">
+  <h1>List Your Practice</h1>
+  <p>Are you an EU AI Act compliance consultant, ethics advisor, or governance expert? Get listed in Europe's dedicated AI Act consultant directory — <strong>free</strong>.</p>
+  <h2>Why List With Us</h2>
+  <p>Businesses across Europe are searching for AI Act compliance help. Our directory connects them directly with qualified consultants like you. Listings are free and include your company profile, services, sectors, and contact information.</p>
+  <h2>Submit Your Listing</h2>
+  <form class="contact-form" name="listing-submission" method="POST" action="{FORM_ACTION}" style="max-width:600px">
+    <input type="hidden" name="form-name" value="listing-submission">
+    <p style="display:none"><label>Don't fill this out: <input name="bot-field"></label></p>
+    <label>Company Name *</label><input type="text" name="company" required>
+    <label>Website URL *</label><input type="url" name="website" required placeholder="https://">
+    <label>Country *</label><input type="text" name="country" required>
+    <label>City *</label><input type="text" name="city" required>
+    <label>Contact Email *</label><input type="email" name="email" required>
+    <label>Primary Services (select all that apply)</label>
+    <textarea name="services" placeholder="AI Act Compliance, Risk Assessment, AI Governance, ISO 42001, etc."></textarea>
+    <label>Sectors Served</label>
+    <textarea name="sectors" placeholder="Healthcare, Financial Services, Manufacturing, etc."></textarea>
+    <label>Languages</label><input type="text" name="languages" placeholder="English, German, French...">
+    <label>Company Size</label>
+    <select name="company_size"><option value="">Select...</option><option>Solo</option><option>Boutique (2-20)</option><option>Mid-size (21-200)</option><option>Enterprise (200+)</option></select>
+    <label>Description of AI Act Services (100-500 words) *</label>
+    <textarea name="description" required style="min-height:150px" placeholder="Describe your EU AI Act compliance services, approach, and key differentiators..."></textarea>
+    <label>LinkedIn URL</label><input type="url" name="linkedin" placeholder="https://linkedin.com/company/...">
+    <label class="consent-label"><input type="checkbox" name="consent" value="yes" required> I confirm this information is accurate and I authorise AI Act Advisors to publish this listing.</label>
+    <button type="submit" class="btn btn-primary" style="width:100%">Submit Listing for Review</button>
+  </form>
+  <p style="margin-top:1rem;font-size:0.85rem;color:var(--gray-500)">Submissions are reviewed within 48 hours. We verify that your website is active and explicitly mentions AI Act services.</p>
+</div>
+'''
+    ctx.write_page('list-your-practice.html', page(ctx, 'List Your Practice — Free Consultant Listing', 'Get your AI Act compliance practice listed in Europe\'s dedicated consultant directory. Free listings available.', list_body))
+
+    # ── 404 Page ──
+    page_404 = '''
+<div class="static-page" style="text-align:center;padding:4rem 1.5rem">
+  <h1 style="font-size:4rem;color:var(--navy);margin-bottom:0.5rem">404</h1>
+  <p style="font-size:1.2rem;color:var(--gray-500);margin-bottom:2rem">This page could not be found.</p>
+  <p>Looking for an AI Act consultant? Try browsing our directory.</p>
+  <div style="margin-top:1.5rem;display:flex;gap:1rem;justify-content:center;flex-wrap:wrap">
+    <a href="/index.html" class="btn btn-primary">Homepage</a>
+    <a href="/consultants.html" class="btn btn-secondary">All Consultants</a>
+    <a href="/countries.html" class="btn btn-secondary">By Country</a>
+  </div>
+</div>
+'''
+    ctx.write_page('404.html', page(ctx, 'Page Not Found', 'The page you are looking for could not be found.', page_404))
@@ -0,0 +1,220 @@
+"""Directory listings: homepage, all consultants, and the country, sector and city pages with their indexes."""
+
+from html import escape
+
+from ..layout import consultant_card, country_card, page, slug
+
+def render(ctx):
+    store, t = ctx.store, ctx.t
+    total = len(store)
+
+    # ── Homepage ──
+    cc = store.country_counts()
+    sc = store.sector_counts()
+    if ctx.wants('index.html'):
+        top_consultants = store.all(12)
+
+        country_cards = ''
+        for country, count in list(cc.items())[:8]:
+            country_cards += country_card(country, count, t)
+
+        featured_cards = ''.join(consultant_card(c, t=t) for c in top_consultants)
+
+        homepage_body = f'''
+<section class="hero">
+  <div class="container">
+    <h1>{t("Find Your <em>EU AI Act</em><br>Compliance Consultant")}</h1>
+    <p>{t("Europe's directory of verified AI Act compliance consultants, ethics advisors, and governance experts. Compare specialists and get the help you need before the deadline.")}</p>
+    <div class="hero-stats">
+      <div class="hero-stat"><span class="num">{total}</span><span class="label">{t("Consultants Listed")}</span></div>
+      <div class="hero-stat"><span class="num">{len(cc)}</span><span class="label">{t("Countries Covered")}</span></div>
+      <div class="hero-stat"><span class="num" data-countdown></span><span class="label">{t("Days to Deadline")}</span></div>
+    </div>
+  </div>
+</section>
+
+<section class="search-section">
+  <div class="container">
+    <div class="filter-bar">
+      <select id="filter-country"><option value="">{t("All Countries")}</option>{''.join(f'<option value="{escape(c)}">{escape(t(c))} ({n})</option>' for c,n in cc.items())}</select>
+      <select id="filter-sector"><option value="">{t("All Sectors")}</option>{''.join(f'<option value="{escape(s)}">{escape(t(s))} ({n})</option>' for s,n in sc.items())}</select>
+      <select id="filter-size"><option value="">{t("All Sizes")}</option><option value="boutique">{t("Boutique")}</option><option value="mid-size">{t("Mid-size")}</option><option value="enterprise">{t("Enterprise")}</option></select>
+      <button class="btn btn-primary" onclick="applyFilters()">{t("Search")}</button>
+    </div>
+  </div>
+</section>
+
+<section class="container">
+  <div class="section-heading">
+    <h2>{t("Browse by Country")}</h2>
+    <p>{t("Find AI Act compliance consultants across Europe")}</p>
+  </div>
+  <div class="country-grid">{country_cards}</div>
+</section>
+
+<section class="container">
+  <div class="section-heading">
+    <h2>{t("Featured Consultants")}</h2>
+    <p>{t("Verified EU AI Act compliance experts")}</p>
+  </div>
+  <div class="results-info">{t("Showing <strong>{shown}</strong> of {total} consultants").format(shown=len(top_consultants), total=total)}</div>
+  <div class="listings-grid" id="listings">{featured_cards}</div>
+  <div style="text-align:center;padding:1.5rem 0"><a href="consultants.html" class="btn btn-primary">{t("View All {total} Consultants →").format(total=total)}</a></div>
+</section>
+'''
+
+        ctx.write_page('index.html', page(ctx, t('Find EU AI Act Compliance Consultants'), t("Europe's directory of {total} verified EU AI Act compliance consultants across {countries} countries. Compare and contact AI governance experts before the August 2026 deadline.").format(total=total, countries=len(cc)), homepage_body))
+
+    # ── All Consultants Page ──
+    if ctx.wants('consultants.html'):
+        all_cards = ''.join(consultant_card(c, t=t) for c in store.all())
+        consultants_body = f'''
+<section class="landing-hero">
+  <div class="container">
+    <div class="breadcrumbs"><a href="index.html">{t("Home")}</a> <span>›</span> {t("All Consultants")}</div>
+    <h1>{t("All EU AI Act Consultants")}</h1>
+    <p>{t("{total} verified compliance consultants across {countries} countries").format(total=total, countries=len(cc))}</p>
+  </div>
+</section>
+<section class="search-section">
+  <div class="container">
+    <div class="filter-bar">
+      <input type="text" id="search-text" placeholder="{t("Search by name or keyword...")}">
+      <select id="filter-country"><option value="">{t("All Countries")}</option>{''.join(f'<option value="{escape(c)}">{escape(t(c))} ({n})</option>' for c,n in cc.items())}</select>
+      <select id="filter-sector"><option value="">{t("All Sectors")}</option>{''.join(f'<option value="{escape(s)}">{escape(t(s))} ({n})</option>' for s,n in sc.items())}</select>
+      <select id="filter-size"><option value="">{t("All Sizes")}</option><option value="boutique">{t("Boutique")}</option><option value="mid-size">{t("Mid-size")}</option><option value="enterprise">{t("Enterprise")}</option></select>
+      <button class="btn btn-primary" onclick="applyFilters()">{t("Search")}</button>
+      <button class="btn btn-secondary" onclick="clearFilters()">{t("Clear")}</button>
+    </div>
+  </div>
+</section>
+<section class="container">
+  <div class="results-info">{t('Showing <strong id="results-count">{total}</strong> consultants').format(total=total)}</div>
+  <div class="listings-grid" id="listings">{all_cards}</div>
+  <div class="no-results" id="no-results" style="display:none">
+    <h3>{t("No consultants found")}</h3>
+    <p>{t('Try adjusting your filters or <a href="{href}">suggest a consultant</a>.').format(href=ctx.to_root + 'list-your-practice.html')}</p>
+  </div>
+</section>
+'''
+        ctx.write_page('consultants.html', page(ctx, t('All EU AI Act Consultants'), t('Browse {total} verified EU AI Act compliance consultants. Filter by country, sector, and company size.').format(total=total), consultants_body))
+
+    # ── Country Pages ──
+    for country, count in cc.items():
+        path = f'country/{slug(country)}.html'
+        if not ctx.wants(path):
+            continue
+        country_consultants = store.in_country(country)
+        cards = ''.join(consultant_card(c, '../', t) for c in country_consultants)
+        name = t(country)
+
+        body = f'''
+<section class="landing-hero">
+  <div class="container">
+    <div class="breadcrumbs" style="color:rgba(255,255,255,0.5)"><a href="../index.html" style="color:rgba(255,255,255,0.6)">{t("Home")}</a> <span>›</span> <a href="../countries.html" style="color:rgba(255,255,255,0.6)">{t("Countries")}</a> <span>›</span> {escape(name)}</div>
+    <h1>{t("AI Act Consultants in {place}").format(place=escape(name))}</h1>
+    <p>{t("{count} verified EU AI Act compliance consultants based in {place}. Find the right expert for your organisation.").format(count=count, place=escape(name))}</p>
+  </div>
+</section>
+<section class="container">
+  <div class="results-info">{t("Showing <strong>{count}</strong> consultants in {place}").format(count=count, place=escape(name))}</div>
+  <div class="listings-grid">{cards}</div>
+</section>
+'''
+        ctx.write_page(path, page(ctx, t('AI Act Consultants in {place}').format(place=name), t('Find {count} verified EU AI Act compliance consultants in {place}. Compare AI governance experts and request consultations.').format(count=count, place=name), body, '../'))
+
+    # ── Countries Index ──
+    if ctx.wants('countries.html'):
+        all_country_cards = ''
+        for country, count in cc.items():
+            all_country_cards += country_card(country, count, t)
+
+        countries_index = f'''
+<section class="landing-hero">
+  <div class="container">
+    <div class="breadcrumbs" style="color:rgba(255,255,255,0.5)"><a href="index.html" style="color:rgba(255,255,255,0.6)">{t("Home")}</a> <span>›</span> {t("Countries")}</div>
+    <h1>{t("AI Act Consultants by Country")}</h1>
+    <p>{t("Browse {total} consultants across {countries} countries").format(total=total, countries=len(cc))}</p>
+  </div>
+</section>
+<section class="container">
+  <div class="country-grid" style="padding:2rem 0">{all_country_cards}</div>
+</section>
+'''
+        ctx.write_page('countries.html', page(ctx, t('AI Act Consultants by Country'), t('Find EU AI Act compliance consultants in {countries} European countries. Browse by location to find local experts.').format(countries=len(cc)), countries_index))
+
+    # ── Sector Pages ──
+    for sector, count in sc.items():
+        path = f'sector/{slug(sector)}.html'
+        if not ctx.wants(path):
+            continue
+        sector_consultants = store.in_sector(sector)
+        cards = ''.join(consultant_card(c, '../', t) for c in sector_consultants)
+        name = t(sector)
+
+        body = f'''
+<section class="landing-hero">
+  <div class="container">
+    <div class="breadcrumbs" style="color:rgba(255,255,255,0.5)"><a href="../index.html" style="color:rgba(255,255,255,0.6)">{t("Home")}</a> <span>›</span> <a href="../sectors.html" style="color:rgba(255,255,255,0.6)">{t("Sectors")}</a> <span>›</span> {escape(name)}</div>
+    <h1>{t("AI Act Compliance for {sector}").format(sector=escape(name))}</h1>
+    <p>{t("{count} consultants specialising in EU AI Act compliance for the {sector_lower} sector.").format(count=len(sector_consultants), sector=escape(name), sector_lower=escape(name.lower()))}</p>
+  </div>
+</section>
+<section class="container">
+  <div class="results-info">{t("Showing <strong>{count}</strong> consultants for {sector}").format(count=len(sector_consultants), sector=escape(name))}</div>
+  <div class="listings-grid">{cards}</div>
+</section>
+'''
+        ctx.write_page(path, page(ctx, t('AI Act Compliance for {sector}').format(sector=name), t('Find EU AI Act compliance consultants specialising in {sector}. {count} verified experts for your sector.').format(sector=name, count=len(sector_consultants)), body, '../'))
+
+    # ── Sectors Index ──
+    if ctx.wants('sectors.html'):
+        sector_cards = ''
+        for sector, count in sc.items():
+            sector_cards += f'<a href="sector/{slug(sector)}.html" class="country-card"><div class="count">{count}</div><div class="name">{escape(t(sector))}</div></a>'
+
+        sectors_index = f'''
+<section class="landing-hero">
+  <div class="container">
+    <div class="breadcrumbs" style="color:rgba(255,255,255,0.5)"><a href="index.html" style="color:rgba(255,255,255,0.6)">{t("Home")}</a> <span>›</span> {t("Sectors")}</div>
+    <h1>{t("AI Act Compliance by Sector")}</h1>
+    <p>{t("Find consultants specialising in your industry")}</p>
+  </div>
+</section>
+<section class="container">
+  <div class="country-grid" style="padding:2rem 0">{sector_cards}</div>
+</section>
+'''
+        ctx.write_page('sectors.html', page(ctx, t('AI Act Compliance by Sector'), t('Find EU AI Act compliance consultants by industry sector. Healthcare, financial services, manufacturing, and more.'), sectors_index))
+
+    # ── City Pages ──
+    for (city, country), count in store.city_counts().items():
+        path = f'city/{slug(city)}.html'
+        if not ctx.wants(path):
+            continue
+        city_consultants = store.in_city(city, country)
+        cards = ''.join(consultant_card(c, '../', t) for c in city_consultants)
+        nearby = ctx.geo.near(city, country)
+        nearby_html = ''
+        if nearby:
+            nearby_html = f'''
+<section class="container">
+  <div class="section-heading">
+    <h2>{t("Consultants near {city}").format(city=escape(city))}</h2>
+    <p>{t("The closest listings in other cities, within {km} km").format(km=nearby[-1][1])}</p>
+  </div>
+  <div class="listings-grid">{''.join(consultant_card(c, '../', t) for c, _ in nearby)}</div>
+</section>'''
+        body = f'''
+<section class="landing-hero">
+  <div class="container">
+    <div class="breadcrumbs" style="color:rgba(255,255,255,0.5)"><a href="../index.html" style="color:rgba(255,255,255,0.6)">{t("Home")}</a> <span>›</span> <a href="../country/{slug(country)}.html" style="color:rgba(255,255,255,0.6)">{escape(t(country))}</a> <span>›</span> {escape(city)}</div>
+    <h1>{t("AI Act Consultants in {place}").format(place=escape(city))}</h1>
+    <p>{t("{count} EU AI Act compliance consultants based in {city}, {country}.").format(count=count, city=escape(city), country=escape(t(country)))}</p>
+  </div>
+</section>
+<section class="container">
+  <div class="listings-grid">{cards}</div>
+</section>{nearby_html}
+'''
+        ctx.write_page(path, page(ctx, t('AI Act Consultants in {place}').format(place=city), t('Find {count} EU AI Act compliance consultants in {city}, {country}.').format(count=count, city=city, country=t(country)), body, '../'))
@@ -0,0 +1,109 @@
+"""Consultant profile pages: consultant/<id>.html."""
+
+from html import escape
+
+from ..layout import FORM_ACTION, consultant_card, icon, page, schema_consultant, slug
+
+def render(ctx):
+    t = ctx.t
+    if ctx.paths is None:
+        consultants = ctx.store.all()
+    else:
+        consultants = ctx.store.get_many(p[len('consultant/'):-len('.html')] for p in ctx.paths if p.startswith('consultant/'))
+
+    for c in consultants:
+        path = f'consultant/{c["id"]}.html'
+        if not ctx.wants(path):
+            continue
+        services_html = ''.join(f'<li>{escape(s)}</li>' for s in c['services'])
+        sectors_html = ''.join(f'<li>{escape(s)}</li>' for s in c['sectors'])
+        langs_html = ', '.join(c['languages'])
+
+        badge = ''
+        if c['verificationLevel'] == 'basic-verified':
+            badge = f'<span class="badge badge-verified">{icon("check")} {t("Verified")}</span>'
+
+        links = f'<div class="sidebar-item">{icon("globe")} <a href="{escape(c["website"])}" target="_blank" rel="noopener">{escape(c["website"])}</a></div>'
+        if c.get('linkedin'):
+            links += f'<div class="sidebar-item">{icon("link")} <a href="{escape(c["linkedin"])}" target="_blank" rel="noopener">LinkedIn</a></div>'
+
+        nearby_html = ''
+        nearby = ctx.geo.near(c['city'], c['country'])
+        if nearby:
+            nearby_items = ''.join(f'<div class="sidebar-item">{icon("pin")} <a href="{n["id"]}.html">{escape(n["name"])}</a> · {escape(n["city"])}, {km} km</div>' for n, km in nearby)
+            nearby_html = f'''        <div class="sidebar-card">
+          <h3>{t("Consultants Nearby")}</h3>
+          {nearby_items}
+          <div class="sidebar-item"><a href="../city/{slug(c['city'])}.html">{t("All consultants in {city} →").format(city=escape(c['city']))}</a></div>
+        </div>'''
+
+        similar_html = ''
+        similar = ctx.similar.similar(c['id'])
+        if similar:
+            similar_html = f'''
+<section class="container">
+  <div class="section-heading">
+    <h2>{t("Similar Consultants")}</h2>
+    <p>{t("Firms with overlapping services, sectors and languages")}</p>
+  </div>
+  <div class="listings-grid">{''.join(consultant_card(s, '../', t) for s, _ in similar)}</div>
+</section>'''
+
+        profile_body = f'''
+{schema_consultant(c)}
+<section class="profile-hero">
+  <div class="container">
+    <div class="breadcrumbs" style="color:rgba(255,255,255,0.5)"><a href="../index.html" style="color:rgba(255,255,255,0.6)">{t("Home")}</a> <span>›</span> <a href="../consultants.html" style="color:rgba(255,255,255,0.6)">{t("Consultants")}</a> <span>›</span> {escape(c['name'])}</div>
+    <h1>{escape(c['name'])} {badge}</h1>
+    <div class="profile-meta">
+      <span>{icon("pin")} {escape(c['city'])}, {escape(t(c['country']))}</span>
+      <span>{escape(t(c['companySize'].title()))}</span>
+      <span>{escape(c['priceRange'])}</span>
+    </div>
+  </div>
+</section>
+<section class="profile-content">
+  <div class="container">
+    <div class="profile-grid">
+      <div class="profile-main">
+        <h2>{t("About {name}").format(name=escape(c['name']))}</h2>
+        <p>{escape(c['description'])}</p>
+
+        <h2>{t("Services")}</h2>
+        <ul class="service-list">{services_html}</ul>
+
+        <h2>{t("Sectors Served")}</h2>
+        <ul class="service-list">{sectors_html}</ul>
+
+        <h2>{t("Languages")}</h2>
+        <p>{escape(langs_html)}</p>
+
+        <p style="margin-top:2rem;font-size:0.82rem;color:var(--gray-400)">{t("This listing is based on publicly available information. If you represent this company and wish to update or remove this listing, contact info@aiactadvisors.com.")}</p>
+      </div>
+      <div class="profile-sidebar">
+        <div class="sidebar-card">
+          <h3>{t("Contact Details")}</h3>
+          {links}
+        </div>
+{nearby_html}
+        <div class="sidebar-card">
+          <h3>{t("Request a Consultation")}</h3>
+          <form class="contact-form" name="inquiry-{c['id']}" method="POST" action="{FORM_ACTION}">
+            <input type="hidden" name="form-name" value="inquiry">
+            <input type="hidden" name="consultant_id" value="{c['id']}">
+            <input type="hidden" name="consultant" value="{escape(c['name'])}">
+            <p style="display:none"><label>Don't fill this out: <input name="bot-field"></label></p>
+            <label>{t("Your Name")}</label><input type="text" name="name" required>
+            <label>{t("Your Email")}</label><input type="email" name="email" required>
+            <label>{t("Company")}</label><input type="text" name="company">
+            <label>{t("Message")}</label><textarea name="message" placeholder="{t("Describe your AI Act compliance needs...")}"></textarea>
+            <label class="consent-label"><input type="checkbox" name="consent" value="yes" required> {t('I consent to my inquiry being forwarded to {name}. See our <a href="{href}">Privacy Policy</a>.').format(name=escape(c['name']), href=ctx.to_root + '../privacy.html')}</label>
+            <button type="submit" class="btn btn-primary" style="width:100%">{t("Send Inquiry")}</button>
+          </form>
+        </div>
+      </div>
+    </div>
+  </div>
+</section>{similar_html}
+'''
+        ctx.write_page(path, page(ctx, t('{name} — EU AI Act Consultant').format(name=c['name']), t('{name} provides EU AI Act compliance consulting in {city}, {country}.').format(name=c['name'], city=c['city'], country=t(c['country'])) + f' {c["description"][:150]}', profile_body, css_path='../'))
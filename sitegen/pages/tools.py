@@ -0,0 +1,388 @@
+"""Interactive tools (simulator, adventure, periodic table of terms) and the products page."""
+
+import json
+from html import escape
+
+from ..assets import load_tool_data
+from ..layout import icon, page
+
+RISK_BADGES = {
+    'high': ('risk-high', 'HIGH-RISK'),
+    'limited': ('risk-limited', 'LIMITED RISK'),
+    'minimal': ('risk-minimal', 'MINIMAL RISK'),
+}
+
+def periodic_cell(i, el):
+    if el.get('type') == 'empty':
+        return '<div class="cell c-empty"></div>'
+    if el.get('type') == 'title':
+        return f'<div class="cell c-title"><span>{escape(el["text"]).replace(chr(10), "<br>")}</span></div>'
+    return f'<div class="cell c-{el["cat"]}" data-i="{i}"><div class="num">{i + 1}</div><div class="abbr">{escape(el["abbr"])}</div><div class="name">{escape(el["name"])}</div></div>'
+
+def render(ctx):
+    # ── Simulator Page: "What Does the AI Act Mean for MY Business?" ──
+    # Tiles are rendered here; each industry's activities and actions are a separate fingerprinted JSON file
+    industry_tiles = ''
+    for ind in load_tool_data(ctx, 'simulator.json'):
+        detail = {k: ind[k] for k in ('name', 'blogSlug', 'summary', 'activities', 'actions')}
+        detail_src = ctx.write_asset(f'data/simulator/{ind["key"]}.json', json.dumps(detail, ensure_ascii=False, separators=(',', ':')))
+        badge_class, badge_label = RISK_BADGES[ind['riskLevel']]
+        industry_tiles += f'<div class="industry-tile" data-key="{ind["key"]}" data-src="{detail_src}"><div class="icon">{ind["icon"]}</div><div class="label">{escape(ind["name"])}</div><div class="risk-badge {badge_class}">{badge_label}</div></div>'
+
+    simulator_page = f'''
+<style>
+.sim-wrap .container{{max-width:900px;margin:0 auto;padding:2rem 1.5rem}}
+.sim-wrap h1{{text-align:center;font-size:2rem;margin-bottom:0.5rem;color:#1B2A4A}}
+.sim-wrap .subtitle{{text-align:center;color:#6b7280;margin-bottom:2.5rem;font-size:1.05rem}}
+.sim-wrap .industry-grid{{display:grid;grid-template-columns:repeat(auto-fit,minmax(160px,1fr));gap:1rem;margin-bottom:2rem}}
+.sim-wrap .industry-tile{{background:#fff;border:2px solid #e5e7eb;border-radius:14px;padding:1.25rem 1rem;text-align:center;cursor:pointer;transition:all 0.2s}}
+.sim-wrap .industry-tile:hover{{border-color:#C9A84C;transform:translateY(-2px);box-shadow:0 4px 12px rgba(0,0,0,0.08)}}
+.sim-wrap .industry-tile .icon{{font-size:2.2rem;margin-bottom:0.5rem}}
+.sim-wrap .industry-tile .label{{font-size:0.85rem;font-weight:600;color:#1B2A4A}}
+.sim-wrap .industry-tile .risk-badge{{display:inline-block;font-size:0.65rem;font-weight:700;padding:0.1rem 0.4rem;border-radius:4px;margin-top:0.4rem}}
+.sim-wrap .risk-high{{background:#fde8e8;color:#c0392b}}
+.sim-wrap .risk-limited{{background:#fef3cd;color:#856404}}
+.sim-wrap .risk-minimal{{background:#d4edda;color:#155724}}
+.sim-wrap #activities-section{{display:none;animation:fadeIn 0.3s ease}}
+@keyframes fadeIn{{from{{opacity:0;transform:translateY(10px)}}to{{opacity:1;transform:translateY(0)}}}}
+.sim-wrap .activities-header{{margin-bottom:1.5rem}}
+.sim-wrap .activities-header h2{{font-size:1.4rem;color:#1B2A4A;margin-bottom:0.25rem}}
+.sim-wrap .activities-header p{{color:#6b7280;font-size:0.95rem}}
+.sim-wrap .activity-list{{display:flex;flex-direction:column;gap:0.6rem;margin-bottom:2rem}}
+.sim-wrap .activity-card{{background:#fff;border:2px solid #e5e7eb;border-radius:12px;padding:1rem 1.15rem;display:flex;align-items:flex-start;gap:0.75rem;cursor:pointer;transition:all 0.15s}}
+.sim-wrap .activity-card:hover{{border-color:#C9A84C}}
+.sim-wrap .activity-card.checked{{border-color:#1B2A4A;background:#f8faff}}
+.sim-wrap .activity-card .checkbox{{width:22px;height:22px;border:2px solid #d1d5db;border-radius:6px;flex-shrink:0;margin-top:1px;display:flex;align-items:center;justify-content:center;transition:all 0.15s}}
+.sim-wrap .activity-card.checked .checkbox{{background:#1B2A4A;border-color:#1B2A4A}}
+.sim-wrap .activity-card.checked .checkbox::after{{content:'\\2713';color:#fff;font-size:0.8rem;font-weight:700}}
+.sim-wrap .activity-info{{flex:1}}
+.sim-wrap .activity-name{{font-weight:600;font-size:0.95rem;color:#1B2A4A}}
+.sim-wrap .activity-annex{{font-size:0.75rem;color:#6b7280;margin-top:0.1rem}}
+.sim-wrap .activity-risk{{display:inline-block;font-size:0.65rem;font-weight:700;padding:0.1rem 0.35rem;border-radius:3px;margin-top:0.3rem}}
+.sim-wrap .risk-prohibited{{background:#fde8e8;color:#c0392b}}
+.sim-wrap .btn-primary{{display:inline-block;background:#1B2A4A;color:#fff;padding:0.7rem 2rem;border-radius:10px;font-weight:600;font-size:1rem;border:none;cursor:pointer;text-decoration:none;font-family:inherit}}
+.sim-wrap .btn-primary:hover{{background:#2a3d6b}}
+.sim-wrap .btn-secondary{{display:inline-block;background:#f3f4f6;color:#374151;border:1px solid #d1d5db;padding:0.5rem 1.25rem;border-radius:10px;font-weight:600;font-size:0.9rem;cursor:pointer;text-decoration:none;font-family:inherit}}
+.sim-wrap .btn-secondary:hover{{background:#e5e7eb}}
+.sim-wrap .btn-row{{display:flex;gap:1rem;justify-content:center;flex-wrap:wrap;margin-top:1.5rem}}
+.sim-wrap #results-section{{display:none;animation:fadeIn 0.4s ease}}
+.sim-wrap .results-summary{{background:linear-gradient(135deg,#1B2A4A 0%,#2a3d6b 100%);color:#fff;border-radius:16px;padding:2rem;margin-bottom:2rem}}
+.sim-wrap .results-summary h2{{font-size:1.3rem;margin-bottom:0.5rem}}
+.sim-wrap .results-summary .industry-name{{color:#C9A84C;font-weight:700}}
+.sim-wrap .results-summary p{{opacity:0.9;font-size:0.95rem;line-height:1.6}}
+.sim-wrap .overall-risk{{display:inline-block;padding:0.3rem 0.8rem;border-radius:6px;font-weight:700;font-size:0.85rem;margin-top:0.75rem}}
+.sim-wrap .overall-prohibited{{background:#c0392b;color:#fff}}
+.sim-wrap .overall-high{{background:#e74c3c;color:#fff}}
+.sim-wrap .overall-limited{{background:#f39c12;color:#fff}}
+.sim-wrap .overall-minimal{{background:#27ae60;color:#fff}}
+.sim-wrap .risk-breakdown{{display:grid;grid-template-columns:repeat(auto-fit,minmax(200px,1fr));gap:1rem;margin-bottom:2rem}}
+.sim-wrap .risk-group{{background:#fff;border-radius:14px;padding:1.25rem;border-left:4px solid}}
+.sim-wrap .risk-group.prohibited{{border-color:#c0392b}}
+.sim-wrap .risk-group.high{{border-color:#e74c3c}}
+.sim-wrap .risk-group.limited{{border-color:#f39c12}}
+.sim-wrap .risk-group.minimal{{border-color:#27ae60}}
+.sim-wrap .risk-group h3{{font-size:0.85rem;text-transform:uppercase;letter-spacing:0.05em;margin-bottom:0.75rem}}
+.sim-wrap .risk-group.prohibited h3{{color:#c0392b}}
+.sim-wrap .risk-group.high h3{{color:#e74c3c}}
+.sim-wrap .risk-group.limited h3{{color:#f39c12}}
+.sim-wrap .risk-group.minimal h3{{color:#27ae60}}
+.sim-wrap .risk-group ul{{list-style:none;padding:0}}
+.sim-wrap .risk-group li{{font-size:0.85rem;padding:0.3rem 0;color:#374151;border-bottom:1px solid #f3f4f6}}
+.sim-wrap .risk-group li:last-child{{border:none}}
+.sim-wrap .action-cards{{display:grid;grid-template-columns:repeat(auto-fit,minmax(260px,1fr));gap:1rem;margin-bottom:2rem}}
+.sim-wrap .action-card{{background:#fff;border:1px solid #e5e7eb;border-radius:14px;padding:1.25rem}}
+.sim-wrap .action-card h3{{font-size:1rem;color:#1B2A4A;margin-bottom:0.5rem}}
+.sim-wrap .action-card p{{font-size:0.85rem;color:#6b7280;line-height:1.5}}
+.sim-wrap .action-card .deadline{{display:inline-block;background:#fde8e8;color:#c0392b;font-size:0.75rem;font-weight:700;padding:0.15rem 0.5rem;border-radius:4px;margin-top:0.5rem}}
+.sim-wrap .action-card .done{{display:inline-block;background:#d4edda;color:#155724;font-size:0.75rem;font-weight:700;padding:0.15rem 0.5rem;border-radius:4px;margin-top:0.5rem}}
+</style>
+<div class="sim-wrap">
+<div class="container">
+  <h1>What Does the AI Act Mean for <em>My</em> Business?</h1>
+  <p class="subtitle">Pick your industry. Tell us what you use AI for. Get your personalised compliance picture in 60 seconds.</p>
+
+  <div id="industry-section">
+    <div class="industry-grid" id="industry-grid">{industry_tiles}</div>
+  </div>
+
+  <div id="activities-section">
+    <div class="activities-header">
+      <h2 id="activities-title"></h2>
+      <p id="activities-subtitle">Tick the activities that apply to your business. These are tied to the regulation, not specific products — so they won't go out of date.</p>
+    </div>
+    <div class="activity-list" id="activity-list"></div>
+    <div class="btn-row">
+      <button class="btn-secondary" onclick="backToIndustries()">&larr; Change Industry</button>
+      <button class="btn-primary" onclick="showResults()">Show My Compliance Dashboard &rarr;</button>
+    </div>
+  </div>
+
+  <div id="results-section">
+    <div class="results-summary" id="results-summary"></div>
+    <div class="risk-breakdown" id="risk-breakdown"></div>
+    <h2 style="font-size:1.2rem;color:#1B2A4A;margin-bottom:1rem">What You Need to Do</h2>
+    <div class="action-cards" id="action-cards"></div>
+    <div class="btn-row" style="margin-top:2rem">
+      <button class="btn-secondary" onclick="backToIndustries()">&larr; Try Another Industry</button>
+      <a href="" class="btn-primary" id="blog-link">Read the Full Guide &rarr;</a>
+      <a href="consultants.html" class="btn-primary" style="background:#C9A84C;color:#1B2A4A">Find a Consultant &rarr;</a>
+    </div>
+  </div>
+</div>
+
+<script src="{ctx.scripts['common']}" defer></script>
+<script src="{ctx.scripts['simulator']}" defer></script>
+</div>
+'''
+    ctx.write_page('quiz.html', page(ctx, 'What Does the AI Act Mean for MY Business? — Free Simulator', 'Pick your industry, tick your AI activities, and get a personalised compliance dashboard in 60 seconds. Free, evergreen, tied to the regulation.', simulator_page))
+
+    # ── Adventure Page: "Choose Your Compliance Path" ──
+    scenarios_src = ctx.write_asset('data/adventure.json', json.dumps(load_tool_data(ctx, 'adventure.json'), ensure_ascii=False, separators=(',', ':')))
+
+    adventure_page = f'''
+<div style="background:#0f1729;margin:-2rem -1.5rem;padding:0">
+<style>
+.adv-wrap .container{{max-width:720px;margin:0 auto;padding:2rem 1.5rem}}
+.adv-wrap h1{{text-align:center;font-size:1.8rem;margin-bottom:0.25rem;color:#fff}}
+.adv-wrap .subtitle{{text-align:center;color:#C9A84C;margin-bottom:2rem;font-size:0.95rem}}
+.adv-wrap .progress-bar{{background:rgba(255,255,255,0.08);border-radius:99px;height:8px;margin-bottom:0.5rem;overflow:hidden}}
+.adv-wrap .progress-fill{{background:linear-gradient(90deg,#C9A84C,#27ae60);height:100%;border-radius:99px;transition:width 0.5s ease}}
+.adv-wrap .progress-text{{text-align:right;font-size:0.75rem;color:#6b7280;margin-bottom:1.5rem}}
+.adv-wrap .score-bar{{display:flex;justify-content:center;gap:1.5rem;margin-bottom:2rem}}
+.adv-wrap .score-item{{text-align:center}}
+.adv-wrap .score-item .val{{font-size:1.5rem;font-weight:800}}
+.adv-wrap .score-item .lbl{{font-size:0.7rem;text-transform:uppercase;letter-spacing:0.05em;opacity:0.6}}
+.adv-wrap .score-good .val{{color:#27ae60}}
+.adv-wrap .score-bad .val{{color:#e74c3c}}
+.adv-wrap .score-badges .val{{color:#C9A84C}}
+.adv-wrap .scenario{{background:rgba(255,255,255,0.04);border:1px solid rgba(255,255,255,0.08);border-radius:16px;padding:2rem;margin-bottom:1.5rem;animation:fadeIn 0.4s ease}}
+@keyframes fadeIn{{from{{opacity:0;transform:translateY(12px)}}to{{opacity:1;transform:translateY(0)}}}}
+.adv-wrap .scenario-context{{font-size:0.8rem;color:#C9A84C;text-transform:uppercase;letter-spacing:0.05em;margin-bottom:0.75rem}}
+.adv-wrap .scenario h2{{font-size:1.2rem;color:#fff;margin-bottom:1rem;line-height:1.4}}
+.adv-wrap .scenario p{{font-size:0.95rem;line-height:1.6;opacity:0.85;margin-bottom:1.25rem}}
+.adv-wrap .choices{{display:flex;flex-direction:column;gap:0.6rem}}
+.adv-wrap .choice{{background:rgba(255,255,255,0.04);border:2px solid rgba(255,255,255,0.12);border-radius:12px;padding:1rem 1.15rem;cursor:pointer;transition:all 0.2s;display:flex;gap:0.75rem;align-items:flex-start}}
+.adv-wrap .choice:hover{{border-color:#C9A84C;background:rgba(201,168,76,0.08)}}
+.adv-wrap .choice .letter{{background:rgba(255,255,255,0.08);width:28px;height:28px;border-radius:8px;display:flex;align-items:center;justify-content:center;font-weight:700;font-size:0.85rem;flex-shrink:0;color:#C9A84C}}
+.adv-wrap .choice .text{{font-size:0.92rem;line-height:1.4}}
+.adv-wrap .feedback{{border-radius:14px;padding:1.5rem;margin-bottom:1.5rem;animation:fadeIn 0.3s ease}}
+.adv-wrap .feedback.correct{{background:rgba(39,174,96,0.12);border:1px solid rgba(39,174,96,0.3)}}
+.adv-wrap .feedback.wrong{{background:rgba(231,76,60,0.12);border:1px solid rgba(231,76,60,0.3)}}
+.adv-wrap .feedback.partial{{background:rgba(243,156,18,0.12);border:1px solid rgba(243,156,18,0.3)}}
+.adv-wrap .feedback h3{{font-size:1rem;margin-bottom:0.5rem}}
+.adv-wrap .feedback.correct h3{{color:#27ae60}}
+.adv-wrap .feedback.wrong h3{{color:#e74c3c}}
+.adv-wrap .feedback.partial h3{{color:#f39c12}}
+.adv-wrap .feedback p{{font-size:0.88rem;line-height:1.5;opacity:0.9}}
+.adv-wrap .feedback .article-ref{{display:inline-block;background:rgba(255,255,255,0.08);padding:0.15rem 0.5rem;border-radius:4px;font-size:0.75rem;font-weight:600;margin-top:0.5rem}}
+.adv-wrap .btn-next{{display:block;width:100%;background:#C9A84C;color:#0f1729;padding:0.75rem;border-radius:10px;font-weight:700;font-size:1rem;border:none;cursor:pointer;font-family:inherit;margin-top:1rem}}
+.adv-wrap .btn-next:hover{{background:#e6c45a}}
+.adv-wrap .badge-unlock{{display:inline-flex;align-items:center;gap:0.35rem;background:rgba(201,168,76,0.15);border:1px solid rgba(201,168,76,0.3);padding:0.3rem 0.7rem;border-radius:8px;font-size:0.8rem;font-weight:600;color:#C9A84C;margin-top:0.75rem}}
+.adv-wrap .final-results{{text-align:center;animation:fadeIn 0.5s ease}}
+.adv-wrap .final-grade{{font-size:4rem;font-weight:900;margin:1rem 0 0.5rem}}
+.adv-wrap .grade-a{{color:#27ae60}}
+.adv-wrap .grade-b{{color:#C9A84C}}
+.adv-wrap .grade-c{{color:#f39c12}}
+.adv-wrap .grade-d{{color:#e67e22}}
+.adv-wrap .grade-f{{color:#e74c3c}}
+.adv-wrap .final-title{{font-size:1.3rem;color:#fff;margin-bottom:0.5rem}}
+.adv-wrap .final-desc{{font-size:0.95rem;opacity:0.8;max-width:500px;margin:0 auto 2rem;line-height:1.6}}
+.adv-wrap .badges-earned{{display:flex;flex-wrap:wrap;gap:0.5rem;justify-content:center;margin-bottom:2rem}}
+.adv-wrap .badge-display{{background:rgba(201,168,76,0.1);border:1px solid rgba(201,168,76,0.25);border-radius:10px;padding:0.5rem 0.75rem;font-size:0.8rem;color:#C9A84C}}
+.adv-wrap .btn-row{{display:flex;gap:1rem;justify-content:center;flex-wrap:wrap}}
+.adv-wrap .btn-primary{{display:inline-block;background:#C9A84C;color:#0f1729;padding:0.65rem 1.5rem;border-radius:10px;font-weight:700;font-size:0.9rem;text-decoration:none;border:none;cursor:pointer;font-family:inherit}}
+.adv-wrap .btn-outline{{display:inline-block;background:transparent;color:#fff;border:1px solid rgba(255,255,255,0.2);padding:0.65rem 1.5rem;border-radius:10px;font-weight:600;font-size:0.9rem;text-decoration:none;cursor:pointer;font-family:inherit}}
+</style>
+<div class="adv-wrap">
+<div class="container">
+  <h1>AI Act: Choose Your Compliance Path</h1>
+  <p class="subtitle">You're the new compliance lead. 10 scenarios. Every choice teaches a real AI Act concept.</p>
+
+  <div class="progress-bar"><div class="progress-fill" id="progress-fill" style="width:0%"></div></div>
+  <div class="progress-text" id="progress-text">Scenario 1 of 10</div>
+
+  <div class="score-bar">
+    <div class="score-item score-good"><div class="val" id="score-good">0</div><div class="lbl">Correct</div></div>
+    <div class="score-item score-bad"><div class="val" id="score-bad">0</div><div class="lbl">Wrong</div></div>
+    <div class="score-item score-badges"><div class="val" id="score-badges">0</div><div class="lbl">Badges</div></div>
+  </div>
+
+  <div id="game-area" data-src="{scenarios_src}"></div>
+</div>
+
+<script src="{ctx.scripts['common']}" defer></script>
+<script src="{ctx.scripts['adventure']}" defer></script>
+</div>
+</div>
+'''
+    ctx.write_page('adventure.html', page(ctx, 'AI Act: Choose Your Compliance Path — Interactive Game', '10 real-world scenarios testing your AI Act knowledge. Every choice teaches a real concept. Earn badges and get graded A through F.', adventure_page))
+
+    # ── Periodic Table of AI Act Terms ──
+    elements = load_tool_data(ctx, 'periodic-table.json')
+    elements_src = ctx.write_asset('data/periodic-table.json', json.dumps(elements, ensure_ascii=False, separators=(',', ':')))
+    periodic_cells = ''.join(periodic_cell(i, el) for i, el in enumerate(elements))
+
+    periodic_page = f'''
+<div style="background:#0f1729;margin:-2rem -1.5rem;padding:1.5rem;display:flex;flex-direction:column;align-items:center">
+<style>
+.pt-wrap h1{{font-size:1.6rem;color:#fff;margin-bottom:0.15rem;text-align:center}}
+.pt-wrap .subtitle{{color:#C9A84C;font-size:0.85rem;text-align:center;margin-bottom:1.25rem}}
+.pt-wrap .legend{{display:flex;gap:0.6rem;flex-wrap:wrap;justify-content:center;margin-bottom:1.25rem}}
+.pt-wrap .legend-item{{display:flex;align-items:center;gap:0.3rem;font-size:0.7rem;font-weight:600;opacity:0.8}}
+.pt-wrap .legend-dot{{width:12px;height:12px;border-radius:3px}}
+.pt-wrap .ptable{{display:grid;grid-template-columns:repeat(8,1fr);gap:4px;max-width:820px;width:100%}}
+.pt-wrap .cell{{position:relative;border-radius:6px;padding:6px;cursor:pointer;transition:all 0.15s;aspect-ratio:1;display:flex;flex-direction:column;justify-content:space-between;min-height:0}}
+.pt-wrap .cell:hover{{transform:scale(1.08);z-index:10;box-shadow:0 4px 20px rgba(0,0,0,0.4)}}
+.pt-wrap .cell .abbr{{font-size:1.1rem;font-weight:800;line-height:1}}
+.pt-wrap .cell .name{{font-size:0.5rem;font-weight:600;line-height:1.15;opacity:0.85;overflow:hidden}}
+.pt-wrap .cell .num{{font-size:0.5rem;opacity:0.5;text-align:right}}
+.pt-wrap .c-prohibited{{background:rgba(196,30,58,0.7);color:#fff}}
+.pt-wrap .c-risk{{background:rgba(231,76,60,0.6);color:#fff}}
+.pt-wrap .c-core{{background:rgba(27,42,74,0.9);color:#fff;border:1px solid rgba(201,168,76,0.3)}}
+.pt-wrap .c-regulation{{background:rgba(99,102,241,0.5);color:#fff}}
+.pt-wrap .c-compliance{{background:rgba(14,165,233,0.45);color:#fff}}
+.pt-wrap .c-other{{background:rgba(139,92,246,0.45);color:#fff}}
+.pt-wrap .c-empty{{background:transparent;pointer-events:none}}
+.pt-wrap .c-title{{background:transparent;pointer-events:none;display:flex;align-items:center;justify-content:center}}
+.pt-wrap .c-title span{{font-size:0.65rem;color:#C9A84C;font-weight:600;text-align:center;line-height:1.3}}
+.pt-wrap .tooltip{{display:none;position:fixed;z-index:100;background:#1a2540;border:1px solid rgba(201,168,76,0.4);border-radius:12px;padding:1.25rem;max-width:340px;width:90vw;box-shadow:0 8px 30px rgba(0,0,0,0.5);pointer-events:none}}
+.pt-wrap .tooltip.show{{display:block}}
+.pt-wrap .tooltip .tt-cat{{font-size:0.7rem;text-transform:uppercase;letter-spacing:0.05em;margin-bottom:0.25rem}}
+.pt-wrap .tooltip .tt-name{{font-size:1.1rem;font-weight:700;color:#fff;margin-bottom:0.15rem}}
+.pt-wrap .tooltip .tt-short{{font-size:0.8rem;color:#C9A84C;margin-bottom:0.5rem}}
+.pt-wrap .tooltip .tt-def{{font-size:0.82rem;line-height:1.5;opacity:0.85}}
+.pt-wrap .tt-prohibited{{color:#e74c3c}}
+.pt-wrap .tt-risk{{color:#e74c3c}}
+.pt-wrap .tt-core{{color:#C9A84C}}
+.pt-wrap .tt-regulation{{color:#818cf8}}
+.pt-wrap .tt-compliance{{color:#38bdf8}}
+.pt-wrap .tt-other{{color:#a78bfa}}
+.pt-wrap .footer{{margin-top:1.25rem;text-align:center;font-size:0.7rem;opacity:0.4}}
+.pt-wrap .footer a{{color:#C9A84C;text-decoration:none}}
+@media(max-width:700px){{  .pt-wrap .ptable{{grid-template-columns:repeat(6,1fr);max-width:400px}}
+  .pt-wrap .cell .abbr{{font-size:0.85rem}}
+  .pt-wrap .cell .name{{font-size:0.42rem}}}}
+@media(max-width:420px){{  .pt-wrap .ptable{{grid-template-columns:repeat(5,1fr);max-width:330px}}}}
+</style>
+<div class="pt-wrap">
+<h1>The Periodic Table of AI Act Terms</h1>
+<p class="subtitle">Hover over any element to see the definition. 43 terms every business needs to know.</p>
+
+<div class="legend">
+  <div class="legend-item"><div class="legend-dot" style="background:rgba(196,30,58,0.8)"></div>Prohibited</div>
+  <div class="legend-item"><div class="legend-dot" style="background:rgba(231,76,60,0.7)"></div>Risk Levels</div>
+  <div class="legend-item"><div class="legend-dot" style="background:rgba(27,42,74,0.9);border:1px solid rgba(201,168,76,0.3)"></div>Core Concepts</div>
+  <div class="legend-item"><div class="legend-dot" style="background:rgba(99,102,241,0.6)"></div>Key Articles</div>
+  <div class="legend-item"><div class="legend-dot" style="background:rgba(14,165,233,0.5)"></div>Compliance</div>
+  <div class="legend-item"><div class="legend-dot" style="background:rgba(139,92,246,0.5)"></div>Other</div>
+</div>
+
+<div class="ptable" id="ptable" data-src="{elements_src}">{periodic_cells}</div>
+
+<div class="tooltip" id="tooltip">
+  <div class="tt-cat" id="tt-cat"></div>
+  <div class="tt-name" id="tt-name"></div>
+  <div class="tt-short" id="tt-short"></div>
+  <div class="tt-def" id="tt-def"></div>
+</div>
+
+<div class="footer">Free to share with attribution &middot; <a href="https://aiactadvisors.com">aiactadvisors.com</a> &middot; February 2026</div>
+
+<script src="{ctx.scripts['common']}" defer></script>
+<script src="{ctx.scripts['periodic-table']}" defer></script>
+</div>
+</div>
+'''
+    ctx.write_page('jargon-buster.html', page(ctx, 'The Periodic Table of AI Act Terms — 43 Key Definitions', '43 essential EU AI Act terms in an interactive periodic table. Hover to see plain-English definitions. Colour-coded by category.', periodic_page))
+
+
+    # ── Products Page ──
+    products_page = f'''
+<div class="container" style="max-width:960px;margin:0 auto;padding:3rem 1.5rem">
+  <h1 style="text-align:center;font-size:2.2rem;margin-bottom:0.5rem">AI Act Compliance Tools</h1>
+  <p style="text-align:center;color:#6b7280;margin-bottom:2.5rem;font-size:1.05rem;max-width:600px;margin-left:auto;margin-right:auto">Everything you need to start your EU AI Act compliance journey. From free resources to comprehensive starter kits.</p>
+
+  <!-- Free Tools -->
+  <h2 style="font-size:1.1rem;color:#C9A84C;text-transform:uppercase;letter-spacing:0.05em;margin-bottom:1.25rem;border-bottom:2px solid #C9A84C;padding-bottom:0.5rem">Free Tools</h2>
+
+  <div style="display:grid;grid-template-columns:repeat(auto-fit,minmax(280px,1fr));gap:1.25rem;margin-bottom:3rem">
+    <!-- Simulator -->
+    <div style="background:#fff;border:1px solid #e5e7eb;border-radius:14px;padding:1.5rem;transition:box-shadow 0.2s">
+      <div style="background:#FFFDF5;border-radius:10px;padding:0.75rem;text-align:center;margin-bottom:1rem">
+        <span style="font-size:2rem">&#x1F3AF;</span>
+      </div>
+      <h3 style="font-size:1.1rem;margin-bottom:0.5rem">What Does the AI Act Mean for My Business?</h3>
+      <p style="font-size:0.9rem;color:#6b7280;margin-bottom:1rem">Pick your industry, tick your AI activities, get a personalised compliance dashboard. 10 industries, 60 seconds, tied to the regulation.</p>
+      <a href="quiz.html" style="display:inline-block;background:#1B2A4A;color:#fff;padding:0.5rem 1.25rem;border-radius:10px;font-weight:600;font-size:0.9rem;text-decoration:none">Try the Simulator</a>
+    </div>
+
+    <!-- Compliance Game -->
+    <div style="background:#fff;border:1px solid #e5e7eb;border-radius:14px;padding:1.5rem;transition:box-shadow 0.2s">
+      <div style="background:#FFFDF5;border-radius:10px;padding:0.75rem;text-align:center;margin-bottom:1rem">
+        <span style="font-size:2rem">&#x1F3AE;</span>
+      </div>
+      <h3 style="font-size:1.1rem;margin-bottom:0.5rem">Choose Your Compliance Path</h3>
+      <p style="font-size:0.9rem;color:#6b7280;margin-bottom:1rem">10 real-world scenarios. Every choice teaches a real AI Act concept. Earn badges, get graded A through F. Can you become a Compliance Expert?</p>
+      <a href="adventure.html" style="display:inline-block;background:#1B2A4A;color:#fff;padding:0.5rem 1.25rem;border-radius:10px;font-weight:600;font-size:0.9rem;text-decoration:none">Play the Game</a>
+    </div>
+
+    <!-- Periodic Table -->
+    <div style="background:#fff;border:1px solid #e5e7eb;border-radius:14px;padding:1.5rem;transition:box-shadow 0.2s">
+      <div style="background:#FFFDF5;border-radius:10px;padding:0.75rem;text-align:center;margin-bottom:1rem">
+        <span style="font-size:2rem">&#x1F9EA;</span>
+      </div>
+      <h3 style="font-size:1.1rem;margin-bottom:0.5rem">Periodic Table of AI Act Terms</h3>
+      <p style="font-size:0.9rem;color:#6b7280;margin-bottom:1rem">43 key terms in an interactive periodic table. Hover to see plain-English definitions. Colour-coded by category. One page, zero jargon.</p>
+      <a href="jargon-buster.html" style="display:inline-block;background:#1B2A4A;color:#fff;padding:0.5rem 1.25rem;border-radius:10px;font-weight:600;font-size:0.9rem;text-decoration:none">Explore the Table</a>
+    </div>
+  </div>
+
+  <!-- Paid Products -->
+  <h2 style="font-size:1.1rem;color:#C9A84C;text-transform:uppercase;letter-spacing:0.05em;margin-bottom:1.25rem;border-bottom:2px solid #C9A84C;padding-bottom:0.5rem">Compliance Kits</h2>
+
+  <div style="display:grid;grid-template-columns:repeat(auto-fit,minmax(280px,1fr));gap:1.25rem;margin-bottom:3rem">
+    <!-- Starter Kit -->
+    <div style="background:#fff;border:2px solid #C9A84C;border-radius:14px;padding:1.5rem;position:relative">
+      <div style="position:absolute;top:-12px;right:16px;background:#C9A84C;color:#fff;padding:0.2rem 0.75rem;border-radius:99px;font-size:0.75rem;font-weight:700">MOST POPULAR</div>
+      <div style="background:#FFFDF5;border-radius:10px;padding:0.75rem;text-align:center;margin-bottom:1rem">
+        <span style="font-size:2rem">&#x1F4E6;</span>
+      </div>
+      <h3 style="font-size:1.1rem;margin-bottom:0.25rem">AI Act Compliance Starter Kit</h3>
+      <p style="font-size:1.5rem;font-weight:800;color:#1B2A4A;margin-bottom:0.5rem">&euro;49 <span style="font-size:0.85rem;font-weight:400;color:#6b7280">one-off payment</span></p>
+      <p style="font-size:0.9rem;color:#6b7280;margin-bottom:1rem">7 ready-to-use templates and tools. Everything an SME needs to start AI Act compliance today.</p>
+      <ul style="list-style:none;padding:0;margin:0 0 1.25rem 0;font-size:0.85rem">
+        <li style="padding:0.3rem 0;border-bottom:1px solid #f3f4f6">{icon("check")} AI Inventory Template (pre-filled)</li>
+        <li style="padding:0.3rem 0;border-bottom:1px solid #f3f4f6">{icon("check")} Risk Classification Flowchart</li>
+        <li style="padding:0.3rem 0;border-bottom:1px solid #f3f4f6">{icon("check")} AI Literacy Briefing Template</li>
+        <li style="padding:0.3rem 0;border-bottom:1px solid #f3f4f6">{icon("check")} Transparency Disclosure Templates</li>
+        <li style="padding:0.3rem 0;border-bottom:1px solid #f3f4f6">{icon("check")} Provider Compliance Letter</li>
+        <li style="padding:0.3rem 0;border-bottom:1px solid #f3f4f6">{icon("check")} Compliance Checklist</li>
+        <li style="padding:0.3rem 0">{icon("check")} Quick Reference Card</li>
+      </ul>
+      <a href="#" style="display:block;text-align:center;background:#C9A84C;color:#fff;padding:0.65rem 1.25rem;border-radius:10px;font-weight:700;font-size:0.95rem;text-decoration:none">Coming Soon</a>
+      <p style="text-align:center;font-size:0.75rem;color:#9ca3af;margin-top:0.5rem">Instant download &bull; 30-day money-back guarantee</p>
+    </div>
+
+    <!-- Industry Guides (coming soon) -->
+    <div style="background:#fff;border:1px solid #e5e7eb;border-radius:14px;padding:1.5rem;opacity:0.85">
+      <div style="background:#f3f4f6;border-radius:10px;padding:0.75rem;text-align:center;margin-bottom:1rem">
+        <span style="font-size:2rem">&#x1F3ED;</span>
+      </div>
+      <h3 style="font-size:1.1rem;margin-bottom:0.25rem">Industry-Specific Guides</h3>
+      <p style="font-size:1.5rem;font-weight:800;color:#1B2A4A;margin-bottom:0.5rem">&euro;29 <span style="font-size:0.85rem;font-weight:400;color:#6b7280">per industry</span></p>
+      <p style="font-size:0.9rem;color:#6b7280;margin-bottom:1rem">Pre-filled templates customised for your exact sector. Available for 7 industries including recruitment, healthcare, e-commerce, and more.</p>
+      <div style="background:#f9fafb;border-radius:8px;padding:0.75rem;text-align:center;color:#6b7280;font-size:0.9rem;font-weight:600">Coming Soon</div>
+    </div>
+  </div>
+
+  <!-- CTA -->
+  <div style="background:#1B2A4A;border-radius:16px;padding:2rem;text-align:center;color:#fff">
+    <h3 style="font-size:1.3rem;margin-bottom:0.5rem;color:#fff">Not sure where to start?</h3>
+    <p style="color:#d1d5db;margin-bottom:1rem;font-size:0.95rem">Try our free simulator to find your risk level, then pick the right tools for your business.</p>
+    <a href="quiz.html" style="display:inline-block;background:#C9A84C;color:#fff;padding:0.65rem 2rem;border-radius:10px;font-weight:700;text-decoration:none;font-size:0.95rem">Try the Free Simulator</a>
+    <span style="color:#6b7280;margin:0 0.75rem">or</span>
+    <a href="consultants.html" style="display:inline-block;background:transparent;color:#C9A84C;border:2px solid #C9A84C;padding:0.55rem 1.5rem;border-radius:10px;font-weight:600;text-decoration:none;font-size:0.95rem">Find a Consultant</a>
+  </div>
+</div>
+'''
+    ctx.write_page('products.html', page(ctx, 'AI Act Compliance Tools & Templates', 'EU AI Act compliance tools, templates, and guides for SMEs. Free quiz, risk classification flowchart, and comprehensive starter kit.', products_page))
@@ -0,0 +1,144 @@
+"""Build orchestration: reset the output, bundle scripts, render the page families, run the post-render passes,
+render the locales and write the sitemap and the precompressed siblings.
+
+    site = build(Config(base, writer=MemoryWriter()))
+    html = site['index.html']
+
+Builds share no state beyond the on-disk caches, so several can run at once in one process."""
+
+import itertools, multiprocessing, os
+from concurrent.futures import ProcessPoolExecutor
+
+from .assets import bundle_scripts, copy_static
+from .compress import precompress
+from .context import Context
+from .dedup import find_duplicates
+from .locales import TRANSLATED, locale_context, site_locales, split_locale
+from .pages import FAMILIES, family_for, load_family, removed_pages
+from .postrender import assets_outdated, finish
+from .sitemap import content_hash, write_sitemap
+from .store import SqliteStore
+from .writers import DiskWriter, MemoryWriter
+
+class Config:
+    """What to build and where to send it.
+
+    families and paths narrow the build; anything narrower than everything updates an earlier full build's output.
+    families defaults to every family, or to those the paths belong to. A translated page's path stands for the page in
+    every locale. writer defaults to build/ under base. consultants replaces consultants.json (or consultants.db) when
+    given. clock is a callable returning the build time as an aware datetime (default: now); pin it and unchanged sources
+    build to byte-identical output. locales defaults to every catalog in locales/; jobs caps the worker processes that
+    render them (default: one per CPU). cache_dir holds the caches later builds reuse: .build-cache under base, except
+    for MemoryWriter builds, which keep them in memory and so leave nothing on disk."""
+
+    def __init__(self, base, families=None, paths=None, writer=None, consultants=None, clock=None, locales=None, jobs=None,
+                 cache_dir=None):
+        self.base = base
+        self.locales = site_locales(base) if locales is None else tuple(locales)
+        if paths is not None:
+            paths = list(dict.fromkeys(split_locale(p, self.locales)[1] for p in paths))
+            unknown = [p for p in paths if family_for(p) is None]
+            if unknown:
+                raise ValueError(f'no page family builds {", ".join(unknown)}')
+        if families is None:
+            families = FAMILIES if paths is None else dict.fromkeys(map(family_for, paths))
+        self.families = tuple(families)
+        self.paths = paths
+        self.writer = writer or DiskWriter(os.path.join(base, 'build'), os.path.join(base, '.build-cache', 'records'))
+        self.consultants = consultants
+        self.clock = clock
+        self.jobs = jobs
+        if cache_dir is None and not isinstance(self.writer, MemoryWriter):
+            cache_dir = os.path.join(base, '.build-cache')
+        self.cache_dir = cache_dir
+
+class Site:
+    """A finished build: the files its writer holds, and how many pages each family and each locale rendered."""
+
+    def __init__(self, writer, counts):
+        self.writer = writer
+        self.counts = counts
+
+    @property
+    def paths(self):
+        return self.writer.paths
+
+    def __contains__(self, path):
+        return path in self.writer.paths
+
+    def __getitem__(self, path):
+        return self.writer.read(path)
+
+# ── Locales ──
+# Each locale renders in its own worker, forked from the finished English pass so it inherits that pass's data,
+# indexes, asset record and critical CSS instead of rebuilding them. Jobs are looked up by token, so concurrent builds
+# in one process do not see each other's jobs
+_locale_jobs = {}
+_tokens = itertools.count()
+
+def render_locale(token, code, forked=False):
+    """(content hashes, output files, removed paths, page count) for one locale of a build."""
+    ctx, families = _locale_jobs[token]
+    lctx = locale_context(ctx, code)
+    # In-memory data is safe to share with a forked worker; the parent's open SQLite connection is not, so a worker opens its own
+    if forked and isinstance(ctx.store, SqliteStore):
+        lctx.store = SqliteStore(ctx.store.path)
+    for name in families:
+        load_family(name).render(lctx)
+    hashes = {path: content_hash(html) for path, html in lctx.pages.items()}
+    finish(lctx, False)
+    removed = set()
+    if lctx.paths is not None:
+        removed = {f'{code}/{p}' for p in removed_pages(lctx.paths, {p[len(code) + 1:] for p in lctx.pages}, families)}
+    return hashes, lctx.writer.files, removed, len(lctx.pages)
+
+def render_locales(ctx, families, jobs):
+    token = next(_tokens)
+    _locale_jobs[token] = (ctx, families)
+    try:
+        workers = min(len(ctx.locales), jobs or os.cpu_count() or 1)
+        if workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork')) as pool:
+                return list(pool.map(render_locale, [token] * len(ctx.locales), ctx.locales, [True] * len(ctx.locales)))
+        return [render_locale(token, code) for code in ctx.locales]
+    finally:
+        del _locale_jobs[token]
+
+def build(config):
+    ctx = Context(config.base, config.writer, config.paths, config.consultants, config.clock)
+    ctx.locales, ctx.cache_dir = config.locales, config.cache_dir
+    full = ctx.paths is None and set(config.families) == set(FAMILIES)
+    if full:
+        ctx.writer.reset()
+        copy_static(ctx)
+        # Possible duplicate listings are reported, not merged: someone decides which to keep
+        ctx.writer.save_record('duplicates', find_duplicates(ctx.store.all()))
+    bundle_scripts(ctx)
+
+    counts = {}
+    for name in config.families:
+        before = len(ctx.pages)
+        load_family(name).render(ctx)
+        counts[name] = len(ctx.pages) - before
+    if not full and assets_outdated(ctx):
+        # New markup or text the last full build's stylesheet and fonts do not cover: rebuild everything against fresh ones
+        return build(Config(config.base, writer=config.writer, consultants=config.consultants, clock=config.clock,
+                            locales=config.locales, jobs=config.jobs, cache_dir=config.cache_dir))
+    hashes = {path: content_hash(html) for path, html in ctx.pages.items()}
+    finish(ctx, full)
+    # A requested data page that no longer renders (say, a country whose last consultant left) leaves the output
+    removed = set() if ctx.paths is None else removed_pages(ctx.paths, ctx.pages.keys(), config.families)
+
+    translated = [name for name in config.families if name in TRANSLATED]
+    if ctx.locales and translated:
+        for code, (page_hashes, files, gone, n) in zip(ctx.locales, render_locales(ctx, translated, config.jobs)):
+            for path, data in files.items():
+                ctx.writer.write(path, data)
+            hashes.update(page_hashes)
+            removed |= gone
+            counts[code] = n
+    for path in sorted(removed):
+        ctx.writer.remove(path)
+    write_sitemap(ctx, hashes, full, removed)
+    precompress(ctx, full, removed)
+    return Site(ctx.writer, counts)
@@ -0,0 +1,119 @@
+"""Post-render passes over the buffered pages, then the write-out.
+
+A full build derives the site-wide assets (hoisted style classes, purged stylesheet, font subsets, icon sprite) from
+every page and records them with its writer. A targeted build reuses that record so its pages point at the same assets
+as the rest of the site; when its pages need rules or glyphs the record left out, the build becomes a full one."""
+
+import hashlib, os, re
+from html import unescape
+
+from .fonts import font_head, self_hosted_fonts, used_font_weights, used_glyphs
+from .layout import ICON_SPRITE, icon_sprite
+from .locales import alternates, catalog_text
+from .styles import (HOIST_MIN, hoist_styles, hoistable_styles, hoisted_css, html_tokens, inline_critical_css,
+                     parse_css, purge_css, script_tokens, selector_tokens)
+
+def tool_text(ctx):
+    text = ''
+    for name in sorted(os.listdir(ctx.tools_data_dir)):
+        if not name.endswith('.json'):
+            continue
+        with open(os.path.join(ctx.tools_data_dir, name), encoding='utf-8') as f:
+            text += f.read()
+    return text
+
+def page_tokens(html):
+    """Tokens a page can match: its markup, and the strings in its inline scripts and event handlers."""
+    tokens = html_tokens(html)
+    for m in re.finditer(r'\son[a-z]+="([^"]*)"|<script\b[^>]*>(.*?)</script>', html, re.S):
+        tokens |= script_tokens(unescape(m.group(1) or m.group(2)))
+    return tokens
+
+def site_assets(ctx, html_paths):
+    """Derive the site-wide assets from every rendered page. Hoisting is applied to the pages along the way."""
+    pages = ctx.pages
+
+    # Style hoisting: repeated inline declarations become one cached rule each
+    style_counts = {}
+    for path in html_paths:
+        for _, key in hoistable_styles(pages[path]):
+            style_counts[key] = style_counts.get(key, 0) + 1
+    hoisted = {key: 's-' + hashlib.sha256(key.encode('utf-8')).hexdigest()[:7] for key, n in style_counts.items() if n >= HOIST_MIN}
+    for path in html_paths:
+        pages[path] = hoist_styles(pages[path], hoisted)
+
+    with open(os.path.join(ctx.static_dir, 'css', 'style.css'), encoding='utf-8') as f:
+        stylesheet = f.read() + '\n/* ── Hoisted inline styles ── */\n' + hoisted_css(hoisted)
+
+    text = tool_text(ctx)
+
+    # Unused CSS: keep the rules that generated pages, scripts and tool data can match
+    site_tokens = script_tokens(text)
+    for path in html_paths:
+        site_tokens |= page_tokens(pages[path])
+    for root, _, files in os.walk(os.path.join(ctx.static_dir, 'js')):
+        for name in files:
+            with open(os.path.join(root, name), encoding='utf-8') as f:
+                site_tokens |= script_tokens(f.read())
+    unused = selector_tokens(parse_css(stylesheet)) - site_tokens
+    stylesheet = purge_css(ctx, stylesheet, site_tokens)
+
+    # Fonts: subset to the weights and characters the output actually uses, locale catalogs included
+    glyphs = used_glyphs((pages[p] for p in html_paths), text + catalog_text(ctx))
+    font_urls = self_hosted_fonts(ctx, used_font_weights(stylesheet + ''.join(pages[p] for p in html_paths)), glyphs)
+
+    return {
+        'hoisted': hoisted,
+        'style_url': ctx.write_asset('css/style.css', stylesheet),
+        'font_urls': font_urls and {str(w): url for w, url in font_urls.items()},
+        # What the purge and the subsets left out, so a targeted build can tell when its pages need more
+        'unused_tokens': sorted(unused),
+        'glyphs': glyphs if font_urls else None,
+        # Icons: one sprite for the whole site
+        'sprite_url': ctx.write_asset('icons.svg', icon_sprite()),
+    }
+
+def assets_outdated(ctx):
+    """True when the buffered pages use a class, tag or id whose rules the recorded stylesheet purged, or a character or
+    font weight its font subsets lack. Only a full build can bring those back."""
+    assets = ctx.writer.load_record('assets')
+    if assets is None:
+        return False  # finish() reports the missing full build
+    if 'unused_tokens' not in assets:
+        return True  # recorded before these checks existed
+    html = [ctx.pages[p] for p in ctx.pages if p.endswith('.html')]
+    unused = set(assets['unused_tokens'])
+    if any(page_tokens(page) & unused for page in html):
+        return True
+    if assets['font_urls'] is None:
+        return False
+    return (not set(used_glyphs(html, '')) <= set(assets['glyphs'])
+            or not {str(w) for w in used_font_weights(''.join(html))} <= assets['font_urls'].keys())
+
+def finish(ctx, full):
+    """Run the post-render passes and write every buffered page."""
+    html_paths = [p for p in ctx.pages if p.endswith('.html')]
+    if full:
+        assets = site_assets(ctx, html_paths)
+        ctx.writer.save_record('assets', assets)
+    else:
+        assets = ctx.writer.load_record('assets')
+        if assets is None:
+            raise RuntimeError('no site assets recorded for this output: run a full build before a targeted one')
+        for path in html_paths:
+            ctx.pages[path] = hoist_styles(ctx.pages[path], assets['hoisted'])
+
+    font_urls = assets['font_urls'] and {int(w): url for w, url in assets['font_urls'].items()}
+    # Parsed once per context: the render server finishes one page per request against the same stylesheet
+    if assets['style_url'] not in ctx.css_rules:
+        ctx.css_rules[assets['style_url']] = parse_css(ctx.writer.read(assets['style_url']).decode('utf-8'))
+    css_rules = ctx.css_rules[assets['style_url']]
+    for path in html_paths:
+        prefix = '../' * path.count('/')
+        html = ctx.pages[path].replace('<!-- fonts -->', font_head(font_urls, prefix), 1)
+        html = html.replace(f'<use href="{ICON_SPRITE}#', f'<use href="{prefix}{assets["sprite_url"]}#')
+        links = alternates(path, ctx.locales)
+        if links:
+            html = html.replace('</head>', links + '</head>', 1)
+        ctx.pages[path] = inline_critical_css(ctx, html, css_rules, assets['style_url'])
+    ctx.flush_pages()
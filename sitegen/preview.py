@@ -0,0 +1,196 @@
+"""Preview server for build/: serves the output the way production should, to check caching and transfer sizes
+before deploying.
+
+    python -m sitegen.preview --port 8000
+
+Each response is the .br or .gz sibling the build wrote when the client accepts that encoding, with an ETag per
+encoding from the build manifest. If-None-Match gets a 304 and a single byte range a 206. Every request is logged with
+its status, encoding, bytes sent against the uncompressed size and how long it took; Ctrl-C prints the totals."""
+
+import argparse, hashlib, json, mimetypes, os, posixpath, sys, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from .cli import DEFAULT_BASE
+from .compress import SUFFIXES
+from .serve import IMMUTABLE
+
+PREFERENCE = ('br', 'gzip')
+
+class Manifest:
+    """The build's manifest record, reloaded when a build rewrites it. Files it does not list are hashed when served."""
+
+    def __init__(self, path):
+        self.path = path
+        self.mtime = None
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def get(self, path, full):
+        with self.lock:
+            mtime = os.stat(self.path).st_mtime_ns if os.path.exists(self.path) else None
+            if mtime != self.mtime:
+                self.mtime, self.entries = mtime, {}
+                if mtime is not None:
+                    with open(self.path, encoding='utf-8') as f:
+                        self.entries = json.load(f)
+            entry = self.entries.get(path)
+        if entry is None:
+            with open(full, 'rb') as f:
+                data = f.read()
+            entry = {'hash': hashlib.sha256(data).hexdigest()[:20], 'size': len(data)}
+        return entry
+
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.not_modified = 0
+        self.sent = self.uncompressed = 0
+
+    def add(self, status, sent, uncompressed, ms):
+        with self.lock:
+            self.latencies.append(ms)
+            self.not_modified += status == 304
+            self.sent += sent
+            self.uncompressed += uncompressed
+
+    def summary(self):
+        if not self.latencies:
+            return 'No requests served'
+        ms = sorted(self.latencies)
+        saved = 1 - self.sent / self.uncompressed if self.uncompressed else 0
+        return (f'{len(ms)} requests ({self.not_modified} not modified): {self.sent / 1024:.1f} KB sent for '
+                f'{self.uncompressed / 1024:.1f} KB uncompressed ({saved:.0%} saved); latency p50 {ms[len(ms) // 2]:.2f} ms, '
+                f'p95 {ms[int(len(ms) * 0.95)]:.2f} ms, max {ms[-1]:.2f} ms')
+
+def accepted(header):
+    """Content codings an Accept-Encoding header allows."""
+    out = set()
+    for part in header.split(','):
+        name, _, params = part.partition(';')
+        name = name.strip().lower()
+        q = params.strip().removeprefix('q=')
+        try:
+            if name and (not q or float(q) > 0):
+                out.add(name)
+        except ValueError:
+            pass
+    return set(PREFERENCE) if '*' in out else out
+
+def byte_range(header, size):
+    """(start, end) inclusive for a single 'bytes=' range, 'unsatisfiable', or None to send the whole file."""
+    unit, _, spec = header.partition('=')
+    if unit.strip() != 'bytes' or ',' in spec:
+        return None
+    first, _, last = spec.strip().partition('-')
+    try:
+        if not first:
+            start, end = max(0, size - int(last)), size - 1
+        else:
+            start, end = int(first), min(int(last), size - 1) if last else size - 1
+    except ValueError:
+        return None
+    return (start, end) if start <= end and start < size else 'unsatisfiable'
+
+def output_path(url):
+    path = unquote(urlsplit(url).path)
+    out = posixpath.normpath(path).lstrip('/')
+    if path.endswith('/'):
+        out = posixpath.join(out, 'index.html')
+    out = out.removeprefix('./')
+    return None if out.startswith('..') else out
+
+class PreviewHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def respond(self, send_body):
+        start = time.perf_counter()
+        root = self.server.root
+        requested = path = output_path(self.path)
+        status = 200
+        if path is None or not os.path.isfile(os.path.join(root, path)):
+            path, status = '404.html', 404
+        full = os.path.join(root, path)
+        if not os.path.isfile(full):
+            self.send_error(404)
+            return
+        entry = self.server.manifest.get(path, full)
+
+        encodings = accepted(self.headers.get('Accept-Encoding', ''))
+        enc = next((e for e in PREFERENCE if e in encodings and e in entry and os.path.isfile(full + SUFFIXES[e])), None)
+        etag = f'"{entry["hash"]}-{enc}"' if enc else f'"{entry["hash"]}"'
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type in ('application/javascript', 'image/svg+xml', 'application/xml'):
+            content_type += '; charset=utf-8'
+        headers = {'ETag': etag, 'Cache-Control': IMMUTABLE if path.startswith('static/') else 'no-cache', 'Accept-Ranges': 'bytes'}
+        if any(e in entry for e in PREFERENCE):
+            headers['Vary'] = 'Accept-Encoding'
+
+        if status == 200 and etag in (t.strip() for t in self.headers.get('If-None-Match', '').split(',')):
+            body, status = b'', 304
+        else:
+            with open(full + SUFFIXES[enc] if enc else full, 'rb') as f:
+                body = f.read()
+            headers['Content-Type'] = content_type
+            if enc:
+                headers['Content-Encoding'] = enc
+            wanted = self.headers.get('Range')
+            if status == 200 and wanted and self.headers.get('If-Range', etag) == etag:
+                span = byte_range(wanted, len(body))
+                if span == 'unsatisfiable':
+                    headers['Content-Range'] = f'bytes */{len(body)}'
+                    body, status = b'', 416
+                elif span:
+                    headers['Content-Range'] = f'bytes {span[0]}-{span[1]}/{len(body)}'
+                    body, status = body[span[0]:span[1] + 1], 206
+        if status != 304:
+            headers['Content-Length'] = str(len(body))
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+        ms = (time.perf_counter() - start) * 1000
+        sent = len(body) if send_body else 0
+        uncompressed = entry['size'] if send_body and status in (200, 404) else sent
+        self.server.stats.add(status, sent, uncompressed, ms)
+        shown = self.path if requested is None else f'/{requested}'
+        sys.stderr.write(f'{status} {self.command} {shown} {enc or "identity"} {sent}/{uncompressed} B {ms:.2f} ms\n')
+
+    def log_request(self, code='-', size='-'):
+        pass  # respond() logs each request once it is sent, with its timing
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sitegen.preview', description='Preview build/ with precompressed files, ETags and latency logging.')
+    parser.add_argument('--base', default=os.environ.get('AIACT_BASE', DEFAULT_BASE), help='site source directory (default: $AIACT_BASE or the repository root)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    root = os.path.join(args.base, 'build')
+    if not os.path.isdir(root):
+        sys.exit(f'error: {root} does not exist: run a build first')
+    server = ThreadingHTTPServer((args.host, args.port), PreviewHandler)
+    server.root = root
+    server.manifest = Manifest(os.path.join(args.base, '.build-cache', 'records', 'manifest.json'))
+    server.stats = Stats()
+    print(f'Previewing {root} on http://{args.host}:{args.port}/')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(server.stats.summary())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+"""On-demand render server: serves a built site, but renders the directory pages (listings and profiles, in every
+locale) from the consultant data when they are requested instead of reading them from build/.
+
+    python -m sitegen.serve --port 8000 --cache-mb 64 --prewarm hot-paths.txt
+
+A full build is still needed once for the site-wide assets and the static families; after that only the pages that are
+actually visited are ever rendered. One long-lived Context serves every request, so the store, the nearby and similar
+indexes and the critical CSS cache are built once rather than per page. Responses are kept in an LRU cache bounded in
+bytes and carry an ETag, so revalidating browsers and CDNs get 304s. The app is plain WSGI (app = RenderApp(base)) and
+expects one thread per process, like wsgiref here or gunicorn's sync workers."""
+
+import argparse, hashlib, mimetypes, os, posixpath, sys
+from collections import OrderedDict
+from wsgiref.simple_server import make_server
+
+from .assets import bundle_scripts
+from .cli import DEFAULT_BASE
+from .context import Context
+from .locales import TRANSLATED, locale_context, site_locales, split_locale
+from .pages import family_for, load_family
+from .postrender import finish
+from .writers import DiskWriter, OverlayWriter
+
+RENDERED = TRANSLATED  # families rendered per request, in every locale; the rest is served as built
+CACHE_MB = 64
+IMMUTABLE = 'public, max-age=31536000, immutable'  # static/ assets carry a content hash in their names
+
+class LRUCache:
+    """path -> (etag, body), least recently used entries evicted beyond max_bytes of bodies."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = self.misses = 0
+
+    def get(self, path):
+        entry = self.entries.get(path)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(path)
+        return entry
+
+    def put(self, path, entry):
+        if len(entry[1]) > self.max_bytes:
+            return
+        old = self.entries.pop(path, None)
+        if old:
+            self.size -= len(old[1])
+        self.entries[path] = entry
+        self.size += len(entry[1])
+        while self.size > self.max_bytes:
+            _, (_, body) = self.entries.popitem(last=False)
+            self.size -= len(body)
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+class Renderer:
+    """Single pages rendered through the page families and the targeted-build post-render passes, against the
+    output and asset record of the last full build. Starts over when the data or that build changes on disk."""
+
+    def __init__(self, base):
+        self.base = base
+        self.build_dir = os.path.join(base, 'build')
+        self.record_dir = os.path.join(base, '.build-cache', 'records')
+        self.stamp = None
+        self.ctx = None
+        self.locales = ()
+        self.locale_ctxs = {}
+
+    def current_stamp(self):
+        # The locales folder's own mtime catches catalogs being added or removed, without listing it per request
+        files = ('consultants.db', 'consultants.json', os.path.join('.build-cache', 'records', 'assets.json'), 'locales')
+        files += tuple(os.path.join('locales', f'{code}.json') for code in self.locales)
+        return tuple(os.stat(p).st_mtime_ns if os.path.exists(p) else None for p in (os.path.join(self.base, f) for f in files))
+
+    def refresh(self):
+        """Drop the context, with its parsed stylesheet and critical CSS, and the locale list if their inputs changed.
+        True when they did, so cached responses are stale too."""
+        if self.current_stamp() == self.stamp:
+            return False
+        self.locales = site_locales(self.base)
+        self.stamp, self.ctx, self.locale_ctxs = self.current_stamp(), None, {}
+        return True
+
+    def context(self):
+        if self.ctx is None:
+            built = DiskWriter(self.build_dir, self.record_dir)
+            if built.load_record('assets') is None:
+                raise RuntimeError('no site assets recorded for build/: run a full build before serving')
+            self.ctx = Context(self.base, OverlayWriter(built))
+            self.ctx.locales = self.locales
+            bundle_scripts(self.ctx)
+        return self.ctx
+
+    def is_dynamic(self, path):
+        return path.endswith('.html') and family_for(split_locale(path, self.locales)[1]) in RENDERED
+
+    def render(self, path):
+        """The page's bytes, or None when the data has no such page."""
+        ctx = self.context()
+        code, english = split_locale(path, ctx.locales)
+        if code:
+            if code not in self.locale_ctxs:
+                self.locale_ctxs[code] = locale_context(ctx, code)
+            ctx = self.locale_ctxs[code]
+        ctx.paths, ctx.pages = {english}, {}
+        load_family(family_for(english)).render(ctx)
+        if path not in ctx.pages:
+            return None
+        finish(ctx, False)
+        return ctx.writer.files.pop(path)
+
+    def static(self, path):
+        full = os.path.join(self.build_dir, path)
+        if not os.path.isfile(full):
+            return None
+        with open(full, 'rb') as f:
+            return f.read()
+
+class RenderApp:
+    def __init__(self, base, cache_bytes=CACHE_MB * 1024 * 1024):
+        self.renderer = Renderer(base)
+        self.cache = LRUCache(cache_bytes)
+
+    def load(self, path):
+        """(etag, body) for an output path, from the cache or freshly rendered or read. None when there is no such file."""
+        if self.renderer.refresh():
+            self.cache.clear()
+        entry = self.cache.get(path)
+        if entry is None:
+            body = self.renderer.render(path) if self.renderer.is_dynamic(path) else self.renderer.static(path)
+            if body is None:
+                return None
+            entry = (f'"{hashlib.sha256(body).hexdigest()[:20]}"', body)
+            self.cache.put(path, entry)
+        return entry
+
+    def prewarm(self, paths):
+        """Load paths, hottest first, until the cache is full. Returns how many were loaded."""
+        n = 0
+        for path in paths:
+            if self.cache.size >= self.cache.max_bytes or self.load(path) is None:
+                continue
+            n += 1
+        return n
+
+    def __call__(self, environ, start_response):
+        method = environ['REQUEST_METHOD']
+        if method not in ('GET', 'HEAD'):
+            start_response('405 Method Not Allowed', [('Allow', 'GET, HEAD'), ('Content-Length', '0')])
+            return []
+        path = posixpath.normpath(environ.get('PATH_INFO', '/')).lstrip('/')
+        if environ.get('PATH_INFO', '/').endswith('/'):
+            path = posixpath.join(path, 'index.html')
+        path = path.removeprefix('./')
+        entry = None if path.startswith('..') else self.load(path)
+        if entry is None:
+            missing = self.load('404.html')
+            body = missing[1] if missing else b'not found\n'
+            start_response('404 Not Found', [('Content-Type', 'text/html; charset=utf-8'), ('Content-Length', str(len(body)))])
+            return [body if method == 'GET' else b'']
+
+        etag, body = entry
+        cache_control = IMMUTABLE if path.startswith('static/') else 'no-cache'
+        if etag in (t.strip() for t in environ.get('HTTP_IF_NONE_MATCH', '').split(',')):
+            start_response('304 Not Modified', [('ETag', etag), ('Cache-Control', cache_control)])
+            return []
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type in ('application/javascript', 'image/svg+xml', 'application/xml'):
+            content_type += '; charset=utf-8'
+        start_response('200 OK', [('Content-Type', content_type), ('Content-Length', str(len(body))),
+                                  ('ETag', etag), ('Cache-Control', cache_control)])
+        return [body if method == 'GET' else b'']
+
+def read_paths(f):
+    """Output paths from a hot-paths file: one per line, optionally after a hit count (as from sort | uniq -c | sort -rn)."""
+    for line in f:
+        line = line.split('#')[0].split()
+        if line:
+            yield line[-1].lstrip('/')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sitegen.serve', description='Serve the site, rendering directory pages on demand.')
+    parser.add_argument('--base', default=os.environ.get('AIACT_BASE', DEFAULT_BASE), help='site source directory (default: $AIACT_BASE or the repository root)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--cache-mb', type=float, default=CACHE_MB, help=f'response cache size (default: {CACHE_MB})')
+    parser.add_argument('--prewarm', metavar='FILE', help='render these paths (one per line, hottest first) into the cache before serving')
+    args = parser.parse_args(argv)
+
+    app = RenderApp(args.base, int(args.cache_mb * 1024 * 1024))
+    try:
+        if args.prewarm:
+            with open(args.prewarm, encoding='utf-8') as f:
+                n = app.prewarm(read_paths(f))
+            print(f'Prewarmed {n} paths ({app.cache.size / 1024 / 1024:.1f} MB)')
+        else:
+            app.renderer.refresh()
+            app.renderer.context()
+    except RuntimeError as e:
+        sys.exit(f'error: {e}')
+    print(f'Serving {args.base} on http://{args.host}:{args.port}/')
+    with make_server(args.host, args.port, app) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == '__main__':
+    main()
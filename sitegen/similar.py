@@ -0,0 +1,84 @@
+"""Similar consultants: MinHash signatures over each consultant's services, sectors and languages, banded into
+locality-sensitive hash buckets.
+
+Only consultants that share a bucket are compared, and those candidates are ranked by exact Jaccard overlap of their
+feature sets (as bitmasks over the feature vocabulary), so the cost stays near-linear in the size of the directory
+instead of comparing every pair. Hashes are seeded and derived with blake2b,
+so the same data always gives the same lists."""
+
+import hashlib, random
+from bisect import bisect_left
+
+SIMILAR = 4          # consultants in a profile's similar strip
+PERMUTATIONS = 63
+BANDS = 21           # 21 bands of 3 rows: pairs from about 45% overlap up nearly always share a bucket
+MAX_CANDIDATES = 20  # neighbours considered per bucket; identical feature sets can fill a bucket with thousands
+PRIME = (1 << 61) - 1
+SEED = 20260802
+
+def features(c):
+    return ({f'service:{s}' for s in c['services']} | {f'sector:{s}' for s in c['sectors']}
+            | {f'language:{s}' for s in c['languages']})
+
+class SimilarIndex:
+    def __init__(self, consultants):
+        rng = random.Random(SEED)
+        self.perms = [(rng.randrange(1, PRIME), rng.randrange(PRIME)) for _ in range(PERMUTATIONS)]
+        self.hashes = {}  # feature -> its hash under every permutation
+        self.consultants = consultants
+        self.bits = {}  # feature -> bit
+        self.masks = []
+        self.position = {c['id']: i for i, c in enumerate(consultants)}
+        # bucket key -> member positions, ascending; each consultant -> its bucket keys
+        self.buckets = {}
+        self.keys = []
+        band_keys = {}  # feature mask -> bucket keys; the vocabulary is small, so many consultants share a feature set
+        rows = PERMUTATIONS // BANDS
+        for i, c in enumerate(consultants):
+            fs = features(c)
+            mask = sum(1 << self.bits.setdefault(f, len(self.bits)) for f in fs)
+            keys = band_keys.get(mask)
+            if keys is None:
+                sig = self.signature(fs) if fs else None
+                keys = band_keys[mask] = [(band, tuple(sig[band * rows:(band + 1) * rows])) for band in range(BANDS)] if fs else []
+            for key in keys:
+                self.buckets.setdefault(key, []).append(i)
+            self.masks.append(mask)
+            self.keys.append(keys)
+
+    def signature(self, fs):
+        vectors = []
+        for f in fs:
+            vec = self.hashes.get(f)
+            if vec is None:
+                x = int.from_bytes(hashlib.blake2b(f.encode('utf-8'), digest_size=8).digest(), 'big')
+                vec = self.hashes[f] = tuple((a * x + b) % PRIME for a, b in self.perms)
+            vectors.append(vec)
+        return list(map(min, zip(*vectors)))
+
+    def candidates(self, i, reach=MAX_CANDIDATES):
+        """Positions sharing a bucket with i: in a large bucket, only the reach members either side of it."""
+        out = set()
+        for key in self.keys[i]:
+            members = self.buckets[key]
+            at = bisect_left(members, i)
+            out.update(members[max(0, at - reach):at + reach + 1])
+        out.discard(i)
+        return out
+
+    def similar(self, cid, k=SIMILAR):
+        """Up to k consultants most like cid, as [(consultant, overlap)]: highest overlap first, then store order."""
+        i = self.position.get(cid)
+        if i is None:
+            return []
+        a, masks = self.masks[i], self.masks
+        scored = sorted((-(a & masks[j]).bit_count() / (a | masks[j]).bit_count(), j) for j in self.candidates(i))
+        return [(self.consultants[j], -score) for score, j in scored[:k] if score < 0]
+
+    def neighbours(self, cid):
+        """Ids whose similar lists can change when cid is added, changed or removed: those that can see it as a
+        candidate, and those one further along a bucket, whose window shifts by one."""
+        i = self.position.get(cid)
+        if i is None:
+            return set()
+        return {self.consultants[j]['id'] for j in self.candidates(i, MAX_CANDIDATES + 1)}
@@ -0,0 +1,71 @@
+"""sitemap.xml and robots.txt.
+
+sitemap.xml is an index over one or more shards per site section (consultant/, country/, blog/, top-level pages...),
+split at the protocol limits. Entries come from the registry of pages actually written, and each page's lastmod only
+moves when the hash of its content does, so crawlers can skip sections that have not changed."""
+
+import hashlib
+from html import escape
+
+SITE_URL = 'https://aiactadvisors.com/'
+XMLNS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+SHARD_URLS = 50000              # protocol limits per sitemap file
+SHARD_BYTES = 50 * 1024 * 1024
+SITEMAP_EXCLUDE = {'404.html'}
+URLSET_HEAD = f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{XMLNS}">\n'
+URLSET_TAIL = '</urlset>\n'
+
+def content_hash(html):
+    """Hash of the page's own content between the site header and footer, so a new asset fingerprint or chrome
+    change does not touch every lastmod."""
+    start, end = html.find('</header>'), html.rfind('<footer class="site-footer">')
+    if start != -1 and end != -1:
+        html = html[start:end]
+    return hashlib.sha256(html.encode('utf-8')).hexdigest()[:16]
+
+def update_registry(registry, hashes, today, full, removed=()):
+    """registry is {path: [content hash, lastmod]} for every page in the output. A full build replaces it; a targeted
+    build updates the pages it rendered and drops the ones it removed."""
+    updated = {} if full else {p: entry for p, entry in registry.items() if p not in removed}
+    for path, h in hashes.items():
+        old = registry.get(path)
+        updated[path] = old if old and old[0] == h else [h, today]
+    return updated
+
+def section(path):
+    return path.split('/')[0] if '/' in path else 'pages'
+
+def shards(registry):
+    """Yield (file name, urlset XML, newest lastmod) for each shard, streaming entries in (section, path) order."""
+    limit = SHARD_BYTES - len(URLSET_HEAD) - len(URLSET_TAIL)
+    current, n, lines, size, newest = None, 0, [], 0, ''
+    for sec, path in sorted((section(p), p) for p in registry if p not in SITEMAP_EXCLUDE):
+        lastmod = registry[path][1]
+        line = f'  <url><loc>{SITE_URL}{escape(path)}</loc><lastmod>{lastmod}</lastmod></url>\n'
+        if sec != current or len(lines) == SHARD_URLS or size + len(line.encode('utf-8')) > limit:
+            if lines:
+                yield shard_name(current, n), URLSET_HEAD + ''.join(lines) + URLSET_TAIL, newest
+            n = n + 1 if sec == current else 1
+            current, lines, size, newest = sec, [], 0, ''
+        lines.append(line)
+        size += len(line.encode('utf-8'))
+        newest = max(newest, lastmod)
+    if lines:
+        yield shard_name(current, n), URLSET_HEAD + ''.join(lines) + URLSET_TAIL, newest
+
+def shard_name(sec, n):
+    return f'sitemap-{sec}.xml' if n == 1 else f'sitemap-{sec}-{n}.xml'
+
+def write_sitemap(ctx, hashes, full, removed=()):
+    """Record the rendered pages' content hashes, forget the removed ones and write the sitemap index, its shards and
+    robots.txt. Each locale's pages sit under <locale>/, so they get sitemap shards of their own."""
+    registry = update_registry(ctx.writer.load_record('pages') or {}, hashes, ctx.today, full, removed)
+    ctx.writer.save_record('pages', registry)
+
+    index = [f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{XMLNS}">\n']
+    for name, xml, lastmod in shards(registry):
+        ctx.writer.write(name, xml.encode('utf-8'))
+        index.append(f'  <sitemap><loc>{SITE_URL}{name}</loc><lastmod>{lastmod}</lastmod></sitemap>\n')
+    index.append('</sitemapindex>\n')
+    ctx.writer.write('sitemap.xml', ''.join(index).encode('utf-8'))
+    ctx.writer.write('robots.txt', f'User-agent: *\nAllow: /\nSitemap: {SITE_URL}sitemap.xml\n'.encode('utf-8'))
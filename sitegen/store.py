@@ -0,0 +1,167 @@
+"""Consultant stores: the queries the page families make against the consultant data.
+
+JsonStore answers them from the list in consultants.json. SqliteStore answers them from consultants.db with indexed
+queries, so a page only loads its own rows; a build uses it whenever consultants.db exists. Both return consultants as
+the same dicts, in the same order. python -m sitegen --import-db / --export-db convert between the two."""
+
+import json, os, sqlite3
+
+from .layout import city_counts, country_counts, sector_counts
+
+# consultants.json key -> column
+FIELDS = {
+    'id': 'id', 'name': 'name', 'country': 'country', 'city': 'city', 'verificationLevel': 'verification_level',
+    'companySize': 'company_size', 'priceRange': 'price_range', 'description': 'description', 'website': 'website',
+    'linkedin': 'linkedin',
+}
+# consultants.json list key -> table
+LISTS = {'sectors': 'sectors', 'services': 'services', 'languages': 'languages'}
+# Key order of a consultants.json record
+JSON_KEYS = ['id', 'name', 'country', 'city', 'sectors', 'services', 'languages', 'verificationLevel', 'companySize',
+             'priceRange', 'description', 'website', 'linkedin']
+# Keys a record may leave out; stored as NULL and left out again on the way back
+OPTIONAL = {'linkedin'}
+REQUIRED_KEYS = [k for k in JSON_KEYS if k not in OPTIONAL]
+# Any other keys of a record are kept as a JSON object in the extra column, so a round trip through the database is lossless
+COLUMNS = ', '.join(f'c.{col}' for col in FIELDS.values()) + ', c.extra'
+
+SCHEMA = f'''
+CREATE TABLE consultants (
+  id TEXT PRIMARY KEY,
+  position INTEGER NOT NULL UNIQUE,
+  {', '.join(f'{col} TEXT' + ('' if key in OPTIONAL else ' NOT NULL') for key, col in FIELDS.items() if col != 'id')},
+  extra TEXT
+);
+CREATE INDEX consultants_country ON consultants (country, position);
+CREATE INDEX consultants_city ON consultants (city, country, position);
+CREATE INDEX consultants_size ON consultants (company_size, position);
+''' + ''.join(f'''
+CREATE TABLE {table} (
+  consultant_id TEXT NOT NULL REFERENCES consultants (id) ON DELETE CASCADE,
+  position INTEGER NOT NULL,
+  value TEXT NOT NULL,
+  PRIMARY KEY (consultant_id, position)
+);
+CREATE INDEX {table}_value ON {table} (value, consultant_id);
+''' for table in LISTS.values())
+
+class JsonStore:
+    def __init__(self, consultants):
+        self.consultants = consultants
+
+    def __len__(self):
+        return len(self.consultants)
+
+    def all(self, limit=None):
+        return self.consultants[:limit]
+
+    def get_many(self, ids):
+        ids = set(ids)
+        return [c for c in self.consultants if c['id'] in ids]
+
+    def in_country(self, country):
+        return [c for c in self.consultants if c['country'] == country]
+
+    def in_sector(self, sector):
+        return [c for c in self.consultants if sector in c['sectors']]
+
+    def in_city(self, city, country):
+        return [c for c in self.consultants if c['city'] == city and c['country'] == country]
+
+    def country_counts(self):
+        return country_counts(self.consultants)
+
+    def sector_counts(self):
+        return sector_counts(self.consultants)
+
+    def city_counts(self):
+        return city_counts(self.consultants)
+
+class SqliteStore:
+    def __init__(self, path):
+        self.path = path
+        self.db = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+
+    def __len__(self):
+        return self.db.execute('SELECT COUNT(*) FROM consultants').fetchone()[0]
+
+    def select(self, where='1', params=(), limit=-1):
+        """Consultants matching a WHERE clause over consultants c, in store order, with their lists attached."""
+        query = f'SELECT {COLUMNS} FROM consultants c WHERE {where} ORDER BY c.position LIMIT ?'
+        out = {row[0]: (dict(zip(FIELDS, row)), row[-1]) for row in self.db.execute(query, (*params, limit))}
+        for key, table in LISTS.items():
+            for c, _ in out.values():
+                c[key] = []
+            # Same filter as the rows themselves, so this is one indexed pass per list rather than one per consultant
+            for cid, value in self.db.execute(f'SELECT l.consultant_id, l.value FROM {table} l JOIN ({query}) c ON c.id = l.consultant_id '
+                                              f'ORDER BY l.consultant_id, l.position', (*params, limit)):
+                out[cid][0][key].append(value)
+        return [{**{k: c[k] for k in JSON_KEYS if c[k] is not None or k not in OPTIONAL}, **json.loads(extra or '{}')}
+                for c, extra in out.values()]
+
+    def all(self, limit=None):
+        return self.select(limit=-1 if limit is None else limit)
+
+    def get_many(self, ids):
+        ids = list(ids)
+        return self.select(f'c.id IN ({", ".join("?" * len(ids))})', ids) if ids else []
+
+    def in_country(self, country):
+        return self.select('c.country = ?', (country,))
+
+    def in_sector(self, sector):
+        return self.select('c.id IN (SELECT consultant_id FROM sectors WHERE value = ?)', (sector,))
+
+    def in_city(self, city, country):
+        return self.select('c.city = ? AND c.country = ?', (city, country))
+
+    # Counts are ordered like layout's: most first, then by name
+    def country_counts(self):
+        return dict(self.db.execute('SELECT country, COUNT(*) n FROM consultants GROUP BY country ORDER BY n DESC, country'))
+
+    def sector_counts(self):
+        return dict(self.db.execute("SELECT value, COUNT(*) n FROM sectors WHERE value != 'All Sectors' "
+                                    'GROUP BY value ORDER BY n DESC, value'))
+
+    def city_counts(self):
+        return {(city, country): n for city, country, n in self.db.execute(
+            'SELECT city, country, COUNT(*) n FROM consultants GROUP BY city, country ORDER BY n DESC, city, country')}
+
+# ── Import / export ──
+
+def import_json(consultants, path):
+    """Create the database at path from a consultants.json list, replacing any existing one."""
+    tmp = f'{path}.{os.getpid()}.tmp'
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    db = sqlite3.connect(tmp)
+    with db:
+        db.executescript(SCHEMA)
+        for position, c in enumerate(consultants):
+            insert_consultant(db, position, c)
+    db.close()
+    os.replace(tmp, path)
+
+def insert_consultant(db, position, c):
+    extra = {k: v for k, v in c.items() if k not in FIELDS and k not in LISTS}
+    db.execute(f'INSERT INTO consultants (position, {", ".join(FIELDS.values())}, extra) VALUES ({", ".join("?" * (len(FIELDS) + 2))})',
+               (position, *(c.get(k) for k in FIELDS), json.dumps(extra, ensure_ascii=False) if extra else None))
+    for key, table in LISTS.items():
+        db.executemany(f'INSERT INTO {table} (consultant_id, position, value) VALUES (?, ?, ?)',
+                       ((c['id'], i, v) for i, v in enumerate(c[key])))
+
+def upsert_consultant(db, c):
+    """Insert or replace one consultant. A replaced consultant keeps its place in store order; a new one goes last."""
+    row = db.execute('SELECT position FROM consultants WHERE id = ?', (c['id'],)).fetchone()
+    position = row[0] if row else db.execute('SELECT COALESCE(MAX(position) + 1, 0) FROM consultants').fetchone()[0]
+    delete_consultant(db, c['id'])
+    insert_consultant(db, position, c)
+
+def delete_consultant(db, cid):
+    for table in LISTS.values():
+        db.execute(f'DELETE FROM {table} WHERE consultant_id = ?', (cid,))
+    db.execute('DELETE FROM consultants WHERE id = ?', (cid,))
+
+def export_json(path):
+    """The database at path as a consultants.json list."""
+    return SqliteStore(path).all()
@@ -0,0 +1,148 @@
+"""CSS passes over the rendered pages: style hoisting, unused-rule purging and critical CSS."""
+
+import hashlib, re
+from html import unescape
+
+# ── Style hoisting ──
+# Inline style attributes that repeat across the site become generated classes in the shared stylesheet
+HOIST_MIN = 2     # occurrences a declaration needs before it earns a class
+HOIST_WEIGHT = 5  # the class is repeated so its rule outranks the deepest component selector (four classes)
+STYLED_TAG = re.compile(r'<(script|style)\b.*?</\1>|<[a-z][a-z0-9]*\b[^>]*?\sstyle="([^"]*)"[^>]*>', re.S)
+
+def style_key(style):
+    return ';'.join(d.strip() for d in style.split(';') if d.strip())
+
+def hoistable_styles(html):
+    """Yield (match, declaration) for style attributes that can move to a class. Script and style blocks are skipped,
+    as are elements with an id (JS and #id rules target them) and display toggles (JS shows elements by clearing them)."""
+    for m in STYLED_TAG.finditer(html):
+        style = m.group(2)
+        if style and ' id="' not in m.group(0) and 'display' not in style:
+            yield m, style_key(style)
+
+def hoist_styles(html, hoisted):
+    out, i = [], 0
+    for m, key in hoistable_styles(html):
+        if key not in hoisted:
+            continue
+        cls = hoisted[key]
+        tag = m.group(0).replace(f' style="{m.group(2)}"', '', 1)
+        if ' class="' in tag:
+            tag = tag.replace(' class="', f' class="{cls} ', 1)
+        else:
+            tag = re.sub(r'\s*/?>$', lambda e: f' class="{cls}"{e.group(0)}', tag)
+        out += [html[i:m.start()], tag]
+        i = m.end()
+    return ''.join(out) + html[i:]
+
+def hoisted_css(hoisted):
+    return ''.join(f'{("." + cls) * HOIST_WEIGHT} {{ {unescape(key)}; }}\n' for key, cls in sorted(hoisted.items(), key=lambda x: x[1]))
+
+# ── Critical CSS ──
+CRITICAL_FOLD = 9000  # characters from <body> treated as above the fold
+# Fixed-position chrome that shows on first paint wherever it sits in the markup: always critical
+CRITICAL_KEEP = (r'\.cookie-',)
+
+def parse_css(css):
+    """Split a stylesheet into (prelude, body) rules. @media bodies are parsed into nested rule lists."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    rules, i = [], 0
+    while (start := css.find('{', i)) != -1:
+        depth, j = 1, start + 1
+        while depth:
+            depth += {'{': 1, '}': -1}.get(css[j], 0)
+            j += 1
+        prelude, body = ' '.join(css[i:start].split()), css[start + 1:j - 1]
+        rules.append((prelude, parse_css(body) if prelude.startswith('@media') else ' '.join(body.split())))
+        i = j
+    return rules
+
+def css_text(rules):
+    return ''.join(f'{p}{{{css_text(b) if isinstance(b, list) else b}}}' for p, b in rules)
+
+def selector_needs(selector):
+    """The tags, classes and ids each selector in a group needs, one list per selector."""
+    return [re.findall(r'[.#]?[\w-]+', re.sub(r'::?[\w-]+(\([^)]*\))?|\[[^\]]*\]', '', sel)) for sel in selector.split(',')]
+
+def selector_used(selector, tokens):
+    """True if any selector in the group only needs tags, classes and ids present in tokens."""
+    return any(all(t in tokens for t in needs) for needs in selector_needs(selector))
+
+def selector_tokens(rules):
+    """Every tag, class and id some selector in the rules needs."""
+    tokens = set()
+    for prelude, body in rules:
+        if isinstance(body, list):
+            tokens |= selector_tokens(body)
+        elif not prelude.startswith('@'):
+            tokens.update(t for needs in selector_needs(prelude) for t in needs)
+    return tokens
+
+def critical_rules(rules, tokens):
+    kept = []
+    for prelude, body in rules:
+        if isinstance(body, list):
+            inner = critical_rules(body, tokens)
+            if inner:
+                kept.append((prelude, inner))
+        elif not prelude.startswith('@') and (selector_used(prelude, tokens) or any(re.search(k, prelude) for k in CRITICAL_KEEP)):
+            kept.append((prelude, body))
+    return kept
+
+def html_tokens(html):
+    """Tags, .classes and #ids the markup uses."""
+    tokens = {'html'} | set(re.findall(r'<([a-z][a-z0-9]*)', html))
+    for classes in re.findall(r'class="([^"]*)"', html):
+        tokens.update('.' + c for c in classes.split())
+    tokens.update('#' + i for i in re.findall(r'id="([^"]*)"', html))
+    return tokens
+
+def fold_tokens(html):
+    fold = re.sub(r'<(script|style)\b.*?</\1>', '', html[html.find('<body'):], flags=re.S)[:CRITICAL_FOLD]
+    return frozenset(html_tokens(fold))
+
+# Pages built from the same template share a fold token set, so each set is computed once
+def inline_critical_css(ctx, html, rules, style_url):
+    """Inline the rules the page needs above the fold and load the full stylesheet without blocking render."""
+    tokens = fold_tokens(html)
+    if tokens not in ctx.critical_cache:
+        ctx.critical_cache[tokens] = css_text(critical_rules(rules, tokens))
+    def repl(m):
+        href = m.group(1) + style_url
+        return (f'<style>{ctx.critical_cache[tokens]}</style>\n'
+                f'<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+                f'<noscript><link rel="stylesheet" href="{href}"></noscript>')
+    return re.sub(r'<link rel="stylesheet" href="((?:\.\./)*)static/css/style\.css">', repl, html, count=1)
+
+# ── Unused CSS ──
+# Selectors matching these patterns survive the purge even when no page or script mentions them
+PURGE_KEEP = (r'\.risk-', r'\.tt-')
+
+def script_tokens(text):
+    """Every word inside a string literal of a script or data file, as a tag, .class and #id.
+    Covers markup that scripts build or toggle at runtime; over-keeping is harmless."""
+    words = set()
+    for lit in re.findall(r"'([^'\n]*)'|\"([^\"\n]*)\"|`([^`]*)`", text):
+        words.update(re.findall(r'[\w-]+', ''.join(lit)))
+    return words | {'.' + w for w in words} | {'#' + w for w in words}
+
+def purge_rules(rules, tokens):
+    kept = []
+    for prelude, body in rules:
+        if isinstance(body, list):
+            inner = purge_rules(body, tokens)
+            if inner:
+                kept.append((prelude, inner))
+        elif prelude.startswith('@') or selector_used(prelude, tokens) or any(re.search(k, prelude) for k in PURGE_KEEP):
+            kept.append((prelude, body))
+    return kept
+
+def purge_css(ctx, css, tokens):
+    """Drop the rules no token can match. Results are cached by stylesheet, token set and allowlist."""
+    key = hashlib.sha256('\0'.join([css, ' '.join(sorted(tokens)), ' '.join(PURGE_KEEP)]).encode('utf-8')).hexdigest()[:16]
+    name = f'css/style-{key}.css'
+    cached = ctx.read_cache(name)
+    if cached is None:
+        cached = css_text(purge_rules(parse_css(css), tokens)).encode('utf-8')
+        ctx.write_cache(name, cached)
+    return cached.decode('utf-8')
@@ -0,0 +1,121 @@
+"""Output writers. A build sends every file it produces (pages, assets, copied static files) through one of these."""
+
+import json, os, shutil
+
+# Every writer also keeps named records about what it holds (the site-wide assets of the last full build, the page
+# registry behind the sitemap), so later targeted builds into the same output can reuse them
+
+class DiskWriter:
+    """Writes into a directory, build/ by default. Records are kept as JSON files in record_dir when given."""
+
+    def __init__(self, root, record_dir=None):
+        self.root = root
+        self.record_dir = record_dir
+        self.records = {}
+        self.paths = set()
+
+    def reset(self):
+        if os.path.exists(self.root):
+            shutil.rmtree(self.root)
+        os.makedirs(self.root)
+        self.paths.clear()
+
+    def full_path(self, path):
+        """Where path goes under root. Refuses paths that would land outside it, whatever built them."""
+        root = os.path.realpath(self.root)
+        full = os.path.realpath(os.path.join(root, path))
+        if os.path.commonpath((root, full)) != root or full == root:
+            raise ValueError(f'output path {path!r} is outside {self.root}')
+        return full
+
+    def write(self, path, data):
+        full = self.full_path(path)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, 'wb') as f:
+            f.write(data)
+        self.paths.add(path)
+
+    def remove(self, path):
+        full = self.full_path(path)
+        if os.path.exists(full):
+            os.remove(full)
+        self.paths.discard(path)
+
+    def read(self, path):
+        with open(os.path.join(self.root, path), 'rb') as f:
+            return f.read()
+
+    def load_record(self, name):
+        path = self.record_dir and os.path.join(self.record_dir, f'{name}.json')
+        if name not in self.records and path and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.records[name] = json.load(f)
+        return self.records.get(name)
+
+    def save_record(self, name, record):
+        self.records[name] = record
+        if self.record_dir:
+            os.makedirs(self.record_dir, exist_ok=True)
+            with open(os.path.join(self.record_dir, f'{name}.json'), 'w', encoding='utf-8') as f:
+                json.dump(record, f)
+
+class MemoryWriter:
+    """Keeps the site as a {path: bytes} mapping, for tests, previews and embedding. A build into one keeps its caches
+    in memory too (see Config.cache_dir)."""
+
+    def __init__(self):
+        self.files = {}
+        self.records = {}
+
+    @property
+    def paths(self):
+        return self.files.keys()
+
+    def reset(self):
+        self.files.clear()
+
+    def write(self, path, data):
+        self.files[path] = data
+
+    def remove(self, path):
+        self.files.pop(path, None)
+
+    def read(self, path):
+        return self.files[path]
+
+    def load_record(self, name):
+        return self.records.get(name)
+
+    def save_record(self, name, record):
+        self.records[name] = record
+
+class OverlayWriter:
+    """Keeps writes in memory on top of another writer's output: reads and records fall through to it, and nothing is
+    written back. The render server uses it to render pages against a built site without touching it."""
+
+    def __init__(self, under):
+        self.under = under
+        self.files = {}
+        self.records = {}
+
+    @property
+    def paths(self):
+        return self.files.keys()
+
+    def reset(self):
+        self.files.clear()
+
+    def write(self, path, data):
+        self.files[path] = data
+
+    def remove(self, path):
+        self.files.pop(path, None)
+
+    def read(self, path):
+        return self.files[path] if path in self.files else self.under.read(path)
+
+    def load_record(self, name):
+        return self.records[name] if name in self.records else self.under.load_record(name)
+
+    def save_record(self, name, record):
+        self.records[name] = record
@@ -0,0 +1,55 @@
+/* AI Act Advisors — Layout chrome: analytics loader, deadline countdown, cookie banner, click tracking */
+
+// Google tag: events queue in dataLayer; gtag.js is only fetched after consent, once the page is idle
+var GA_ID = 'G-RRHZE8N0GW';
+window.dataLayer = window.dataLayer || [];
+function gtag(){dataLayer.push(arguments);}
+gtag('js', new Date());
+gtag('config', GA_ID);
+
+function loadAnalytics() {
+  if (window.analyticsLoaded) return;
+  window.analyticsLoaded = true;
+  var s = document.createElement('script');
+  s.async = true;
+  s.src = 'https://www.googletagmanager.com/gtag/js?id=' + GA_ID;
+  document.head.appendChild(s);
+}
+
+// Deadline countdown
+// Filled in here rather than at build time so the pages do not change from one day to the next
+var daysLeft = Math.max(0, Math.ceil((new Date('2026-08-02T00:00:00') - new Date()) / (1000 * 60 * 60 * 24)));
+document.querySelectorAll('[data-countdown]').forEach(function(el) { el.textContent = daysLeft; });
+
+// Cookie banner
+var consent = localStorage.getItem('cookie-consent');
+var banner = document.getElementById('cookie-banner');
+if (!consent && banner) banner.classList.add('show');
+if (consent === 'accepted') {
+  addEventListener('load', function() { (window.requestIdleCallback || setTimeout)(loadAnalytics); });
+}
+document.querySelectorAll('[data-consent]').forEach(function(btn) {
+  btn.addEventListener('click', function() {
+    localStorage.setItem('cookie-consent', this.dataset.consent);
+    banner.classList.remove('show');
+    if (this.dataset.consent === 'accepted') loadAnalytics();
+  });
+});
+
+// One delegated listener for all click tracking; cards say what they are via data-track
+document.addEventListener('click', function(e) {
+  var a = e.target.closest('a');
+  if (!a) return;
+  var href = a.getAttribute('href') || '';
+  var card = a.closest('[data-track]');
+  var track = card ? card.dataset.track : '';
+  if (track === 'consultant') {
+    gtag('event', 'consultant_click', {consultant_name: a.textContent.trim(), consultant_id: card.dataset.id, page_location: window.location.pathname});
+  } else if (track === 'country') {
+    gtag('event', 'country_click', {country_name: card.querySelector('.name').textContent.trim(), page_location: window.location.pathname});
+  } else if (href.indexOf('consultant/') !== -1) {
+    gtag('event', 'consultant_click', {consultant_name: a.textContent.trim(), consultant_id: href.split('/').pop().replace('.html', ''), page_location: window.location.pathname});
+  } else if (href.indexOf('list-your-practice') !== -1) {
+    gtag('event', 'cta_click', {cta_type: 'list_practice', page_location: window.location.pathname});
+  }
+});
@@ -0,0 +1,136 @@
+/* AI Act Advisors — "Choose Your Compliance Path" game */
+let SCENARIOS = [];
+
+let currentScenario = 0;
+let scoreGood = 0;
+let scoreBad = 0;
+let badges = [];
+let answered = false;
+
+function renderScenario() {
+  const s = SCENARIOS[currentScenario];
+  document.getElementById('progress-fill').style.width = ((currentScenario) / SCENARIOS.length * 100) + '%';
+  document.getElementById('progress-text').textContent = 'Scenario ' + (currentScenario + 1) + ' of ' + SCENARIOS.length;
+  answered = false;
+
+  let html = '<div class="scenario"><div class="scenario-context">' + s.context + '</div>';
+  html += '<h2>' + s.title + '</h2><p>' + s.desc + '</p>';
+  html += '<div class="choices">';
+  s.choices.forEach((c, i) => {
+    html += '<div class="choice" onclick="choose(' + i + ')" id="choice-' + i + '"><div class="letter">' + String.fromCharCode(65 + i) + '</div><div class="text">' + c.text + '</div></div>';
+  });
+  html += '</div></div>';
+  html += '<div id="feedback-area"></div>';
+  document.getElementById('game-area').innerHTML = html;
+}
+
+function choose(index) {
+  if (answered) return;
+  answered = true;
+  const s = SCENARIOS[currentScenario];
+  const choice = s.choices[index];
+
+  // Highlight selection
+  document.querySelectorAll('.choice').forEach((c, i) => {
+    if (i === index) c.style.borderColor = choice.correct ? '#27ae60' : '#e74c3c';
+    else c.style.opacity = '0.4';
+    c.style.cursor = 'default';
+  });
+
+  // Get feedback
+  let fb;
+  if (choice.correct) {
+    fb = s.feedback.correct;
+    scoreGood++;
+  } else {
+    fb = s.feedback['wrong' + index] || s.feedback['wrong0'];
+    if (fb.type === 'partial') scoreGood += 0.5;
+    else scoreBad++;
+  }
+
+  // Update scores
+  document.getElementById('score-good').textContent = Math.floor(scoreGood);
+  document.getElementById('score-bad').textContent = scoreBad;
+
+  // Badge
+  let badgeHtml = '';
+  if (choice.correct && s.badge) {
+    badges.push(s.badge);
+    document.getElementById('score-badges').textContent = badges.length;
+    badgeHtml = '<div class="badge-unlock">⭐ Badge unlocked: ' + s.badge + '</div>';
+  }
+
+  // Show feedback
+  const area = document.getElementById('feedback-area');
+  area.innerHTML = '<div class="feedback ' + fb.type + '"><h3>' + fb.title + '</h3><p>' + fb.text + '</p><div class="article-ref">' + fb.ref + '</div>' + badgeHtml + '</div>' +
+    '<button class="btn-next" onclick="nextScenario()">' + (currentScenario < SCENARIOS.length - 1 ? 'Next Scenario →' : 'See My Results →') + '</button>';
+}
+
+function nextScenario() {
+  currentScenario++;
+  if (currentScenario >= SCENARIOS.length) {
+    showFinalResults();
+  } else {
+    renderScenario();
+    window.scrollTo({top:0,behavior:'smooth'});
+  }
+}
+
+function showFinalResults() {
+  document.getElementById('progress-fill').style.width = '100%';
+  document.getElementById('progress-text').textContent = 'Complete!';
+
+  const pct = Math.round((scoreGood / SCENARIOS.length) * 100);
+  let grade, gradeClass, title, desc;
+  if (pct >= 90) { grade = 'A'; gradeClass = 'grade-a'; title = 'Compliance Expert'; desc = 'You navigated the AI Act with near-perfect judgement. You understand the risk classifications, prohibited practices, and deployer obligations. Your company is in safe hands.'; }
+  else if (pct >= 70) { grade = 'B'; gradeClass = 'grade-b'; title = 'Strong Foundation'; desc = 'You have a solid understanding of the AI Act. A few areas need sharpening, but you\'re well ahead of most businesses. Review the scenarios you missed and you\'ll be fully prepared.'; }
+  else if (pct >= 50) { grade = 'C'; gradeClass = 'grade-c'; title = 'Work to Do'; desc = 'You\'ve got the basics, but some critical concepts caught you out. The good news: you now know exactly where the gaps are. Our industry guides cover each topic in depth.'; }
+  else if (pct >= 30) { grade = 'D'; gradeClass = 'grade-d'; title = 'Needs Attention'; desc = 'Several key concepts need attention before August 2026. Consider working with a specialist consultant to build your compliance programme. Our directory can help you find one.'; }
+  else { grade = 'F'; gradeClass = 'grade-f'; title = 'Urgent Action Needed'; desc = 'Your company has significant compliance gaps. The AI Act deadline is August 2, 2026 and compliance typically takes 8–14 months. Professional guidance is strongly recommended.'; }
+
+  let html = '<div class="final-results">';
+  html += '<div class="final-grade ' + gradeClass + '">' + grade + '</div>';
+  html += '<div class="final-title">' + title + '</div>';
+  html += '<div class="final-desc">' + desc + '</div>';
+  html += '<div style="margin-bottom:1.5rem;font-size:0.9rem;opacity:0.7">You scored <strong>' + Math.floor(scoreGood) + '/' + SCENARIOS.length + '</strong> correct answers</div>';
+
+  if (badges.length > 0) {
+    html += '<div style="margin-bottom:0.5rem;font-size:0.85rem;opacity:0.6">Badges earned:</div><div class="badges-earned">';
+    badges.forEach(b => { html += '<div class="badge-display">' + b + '</div>'; });
+    html += '</div>';
+  }
+
+  html += '<div class="btn-row">';
+  html += '<a href="consultants.html" class="btn-primary">Find a Consultant →</a>';
+  html += '<a href="blog.html" class="btn-outline">Read Our Guides →</a>';
+  html += '<button class="btn-outline" onclick="resetGame()">Play Again</button>';
+  html += '</div></div>';
+
+  document.getElementById('game-area').innerHTML = html;
+  window.scrollTo({top:0,behavior:'smooth'});
+
+  trackEvent('adventure_complete', {score: Math.floor(scoreGood), grade: grade, badges: badges.length});
+}
+
+function resetGame() {
+  currentScenario = 0; scoreGood = 0; scoreBad = 0; badges = [];
+  document.getElementById('score-good').textContent = '0';
+  document.getElementById('score-bad').textContent = '0';
+  document.getElementById('score-badges').textContent = '0';
+  renderScenario();
+  window.scrollTo({top:0,behavior:'smooth'});
+}
+
+// Keyboard support
+document.addEventListener('keydown', (e) => {
+  if (!SCENARIOS.length) return;
+  if (!answered) {
+    if (e.key === 'a' || e.key === 'A' || e.key === '1') choose(0);
+    if (e.key === 'b' || e.key === 'B' || e.key === '2') choose(1);
+    if (e.key === 'c' || e.key === 'C' || e.key === '3') choose(2);
+  } else {
+    if (e.key === 'Enter' || e.key === ' ') { e.preventDefault(); nextScenario(); }
+  }
+});
+
+fetchJSON(document.getElementById('game-area').dataset.src).then(s => { SCENARIOS = s; renderScenario(); });
@@ -0,0 +1,34 @@
+/* AI Act Advisors — Helpers shared by the interactive tools */
+
+// Risk level -> [badge class, badge label]
+const RISK_BADGES = {
+  prohibited: ['risk-prohibited', 'PROHIBITED'],
+  high: ['risk-high', 'HIGH-RISK'],
+  limited: ['risk-limited', 'LIMITED'],
+  minimal: ['risk-minimal', 'MINIMAL']
+};
+
+function riskBadge(risk) {
+  return RISK_BADGES[risk] || RISK_BADGES.minimal;
+}
+
+function fetchJSON(url) {
+  return fetch(url).then(r => r.json());
+}
+
+function trackEvent(name, params) {
+  if (typeof gtag !== 'undefined') gtag('event', name, params);
+}
+
+// Place a fixed-position tooltip next to the pointer, flipping it to stay inside the viewport
+function positionTooltip(tt, x, y) {
+  const rect = tt.getBoundingClientRect();
+  let left = x + 15;
+  let top = y - 10;
+  if (left + rect.width > window.innerWidth - 10) left = x - rect.width - 15;
+  if (top + rect.height > window.innerHeight - 10) top = y - rect.height - 10;
+  if (top < 10) top = 10;
+  if (left < 10) left = 10;
+  tt.style.left = left + 'px';
+  tt.style.top = top + 'px';
+}
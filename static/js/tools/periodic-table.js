@@ -0,0 +1,46 @@
+/* AI Act Advisors — Periodic Table of AI Act Terms */
+let ELEMENTS = [];
+
+const CAT_LABELS = {prohibited:'PROHIBITED',risk:'RISK LEVEL',core:'CORE CONCEPT',regulation:'KEY ARTICLE',compliance:'COMPLIANCE',other:'OTHER'};
+
+// The cells are pre-rendered by build.py; only attach handlers once the definitions are loaded
+function hydrateTable() {
+  document.querySelectorAll('#ptable .cell[data-i]').forEach(div => {
+    const el = ELEMENTS[div.dataset.i];
+    div.addEventListener('mouseenter', (e) => showTooltipAt(e.clientX, e.clientY, el));
+    div.addEventListener('mousemove', (e) => moveTooltip(e));
+    div.addEventListener('mouseleave', hideTooltip);
+    // Touch support
+    div.addEventListener('touchstart', (e) => {
+      e.preventDefault();
+      const touch = e.touches[0];
+      showTooltipAt(touch.clientX, touch.clientY, el);
+    });
+  });
+
+  // Close tooltip on touch outside
+  document.addEventListener('touchstart', (e) => {
+    if (!e.target.closest('.cell')) hideTooltip();
+  });
+}
+
+function showTooltipAt(x, y, el) {
+  const tt = document.getElementById('tooltip');
+  document.getElementById('tt-cat').textContent = CAT_LABELS[el.cat] || el.cat;
+  document.getElementById('tt-cat').className = 'tt-cat tt-' + el.cat;
+  document.getElementById('tt-name').textContent = el.name;
+  document.getElementById('tt-short').textContent = el.short;
+  document.getElementById('tt-def').textContent = el.def;
+  tt.classList.add('show');
+  positionTooltip(tt, x, y);
+}
+
+function moveTooltip(e) {
+  positionTooltip(document.getElementById('tooltip'), e.clientX, e.clientY);
+}
+
+function hideTooltip() {
+  document.getElementById('tooltip').classList.remove('show');
+}
+
+fetchJSON(document.getElementById('ptable').dataset.src).then(els => { ELEMENTS = els; hydrateTable(); });
@@ -0,0 +1,109 @@
+/* AI Act Advisors — "What Does the AI Act Mean for MY Business?" simulator */
+const DATA = {};
+
+let selectedIndustry = null;
+
+// The tiles are pre-rendered by build.py; only attach handlers
+function init() {
+  document.querySelectorAll('#industry-grid .industry-tile').forEach(tile => {
+    tile.onclick = () => selectIndustry(tile.dataset.key);
+    tile.onmouseenter = () => loadIndustry(tile.dataset.key);
+  });
+}
+
+// Each industry's activities live in their own fingerprinted JSON file, fetched on first use
+function loadIndustry(key) {
+  if (!DATA[key]) {
+    const tile = document.querySelector('.industry-tile[data-key="' + key + '"]');
+    DATA[key] = fetchJSON(tile.dataset.src).then(data => DATA[key] = data);
+  }
+  return Promise.resolve(DATA[key]);
+}
+
+function selectIndustry(key) {
+  loadIndustry(key).then(d => renderActivities(key, d));
+}
+
+function renderActivities(key, d) {
+  selectedIndustry = key;
+  document.getElementById('industry-section').style.display = 'none';
+  document.getElementById('activities-section').style.display = 'block';
+  document.getElementById('results-section').style.display = 'none';
+  document.getElementById('activities-title').textContent = "You're a " + d.name;
+  const list = document.getElementById('activity-list');
+  list.innerHTML = '';
+  d.activities.forEach((a, i) => {
+    const card = document.createElement('div');
+    card.className = 'activity-card' + (a.checked ? ' checked' : '');
+    card.onclick = () => { a.checked = !a.checked; card.classList.toggle('checked'); };
+    const [rc, rl] = riskBadge(a.risk);
+    card.innerHTML = '<div class="checkbox"></div><div class="activity-info"><div class="activity-name">'+a.name+'</div><div class="activity-annex">'+a.annex+'</div><div class="activity-risk '+rc+'">'+rl+'</div></div>';
+    list.appendChild(card);
+  });
+  window.scrollTo({top:0,behavior:'smooth'});
+}
+
+function backToIndustries() {
+  document.getElementById('industry-section').style.display = 'block';
+  document.getElementById('activities-section').style.display = 'none';
+  document.getElementById('results-section').style.display = 'none';
+  window.scrollTo({top:0,behavior:'smooth'});
+}
+
+function showResults() {
+  const d = DATA[selectedIndustry];
+  const checked = d.activities.filter(a => a.checked);
+  document.getElementById('activities-section').style.display = 'none';
+  document.getElementById('results-section').style.display = 'block';
+  window.scrollTo({top:0,behavior:'smooth'});
+
+  const prohibited = checked.filter(a => a.risk === 'prohibited');
+  const high = checked.filter(a => a.risk === 'high');
+  const limited = checked.filter(a => a.risk === 'limited');
+  const minimal = checked.filter(a => a.risk === 'minimal');
+
+  let overallRisk = 'minimal'; let overallClass = 'overall-minimal'; let overallLabel = 'MINIMAL RISK';
+  if (limited.length > 0) { overallRisk = 'limited'; overallClass = 'overall-limited'; overallLabel = 'LIMITED RISK'; }
+  if (high.length > 0) { overallRisk = 'high'; overallClass = 'overall-high'; overallLabel = 'HIGH-RISK'; }
+  if (prohibited.length > 0) { overallRisk = 'prohibited'; overallClass = 'overall-prohibited'; overallLabel = 'PROHIBITED AI DETECTED'; }
+
+  let urgency = 'Based on '+checked.length+' activit'+(checked.length!==1?'ies':'y')+' you selected: ';
+  if (prohibited.length > 0) urgency += '<strong>'+prohibited.length+' PROHIBITED</strong> practice'+(prohibited.length>1?'s':'')+' that must stop immediately. ';
+  if (high.length > 0) urgency += '<strong>'+high.length+' HIGH-RISK</strong> activit'+(high.length>1?'ies':'y')+' requiring full compliance by August 2, 2026. ';
+  if (limited.length > 0) urgency += '<strong>'+limited.length+'</strong> with transparency obligations. ';
+  if (minimal.length > 0) urgency += '<strong>'+minimal.length+'</strong> with no specific obligations. ';
+  if (checked.length === 0) urgency = 'You didn\'t select any activities. Go back and tick the ones that apply to your business.';
+
+  document.getElementById('results-summary').innerHTML = '<h2>Your Compliance Dashboard: <span class="industry-name">'+d.name+'</span></h2><p>'+urgency+'</p><div class="overall-risk '+overallClass+'">Overall: '+overallLabel+'</div>';
+
+  const breakdown = document.getElementById('risk-breakdown');
+  breakdown.innerHTML = '';
+  [{label:'Prohibited',key:'prohibited',items:prohibited},{label:'High-Risk',key:'high',items:high},{label:'Limited Risk',key:'limited',items:limited},{label:'Minimal Risk',key:'minimal',items:minimal}].forEach(g => {
+    if (g.items.length > 0) {
+      const div = document.createElement('div');
+      div.className = 'risk-group ' + g.key;
+      let h = '<h3>'+g.label+' ('+g.items.length+')</h3><ul>';
+      g.items.forEach(a => { h += '<li>'+a.name+'</li>'; });
+      div.innerHTML = h + '</ul>';
+      breakdown.appendChild(div);
+    }
+  });
+
+  const actions = document.getElementById('action-cards');
+  actions.innerHTML = '';
+  d.actions.forEach(a => {
+    const card = document.createElement('div');
+    card.className = 'action-card';
+    const isDone = a.deadline.toLowerCase().includes('already');
+    card.innerHTML = '<h3>'+a.title+'</h3><p>'+a.text+'</p><span class="'+(isDone?'done':'deadline')+'">'+a.deadline+'</span>';
+    actions.appendChild(card);
+  });
+
+  const link = document.getElementById('blog-link');
+  link.href = 'blog/' + d.blogSlug;
+  link.textContent = 'Read the Full ' + d.name + ' Guide →';
+
+  trackEvent('simulator_complete', {industry: selectedIndustry, activities: checked.length, high_risk: high.length, prohibited: prohibited.length});
+}
+
+init();
@@ -0,0 +1,116 @@
+"""Build equivalences: an in-memory build matches a disk build, an ingest matches a full rebuild, and forked locale
+workers match rendering the locales in-process. Each test builds a small fixture directory with a pinned clock."""
+
+import json, multiprocessing, os
+from datetime import datetime, timezone
+
+import pytest
+
+from sitegen import Config, DiskWriter, MemoryWriter, build
+from sitegen.ingest import ingest, read_feed
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLOCK = lambda: datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+def consultant(n, city, country, sectors, size='boutique', **extra):
+    return {
+        'id': f'fixture-{n}', 'name': f'Fixture {n}', 'country': country, 'city': city, 'sectors': sectors,
+        'services': ['AI Act Compliance', 'Risk Assessment'], 'languages': ['English'], 'verificationLevel': 'premium',
+        'companySize': size, 'priceRange': '€€', 'description': f'Fixture {n} advises on the EU AI Act in {city}.',
+        'website': f'https://fixture{n}.example.com/', **extra,
+    }
+
+CONSULTANTS = [
+    consultant(0, 'Berlin', 'Germany', ['Healthcare'], linkedin='https://linkedin.com/company/fixture-0'),
+    consultant(1, 'Munich', 'Germany', ['Financial Services', 'Insurance'], 'mid-size'),
+    consultant(2, 'Berlin', 'Germany', ['Technology']),
+    consultant(3, 'Paris', 'France', ['Healthcare', 'Technology'], 'enterprise'),
+    consultant(4, 'Lyon', 'France', ['Retail']),
+    consultant(5, 'Dublin', 'Ireland', ['Financial Services']),
+    consultant(6, 'Vienna', 'Austria', ['Public Sector'], 'mid-size'),
+    consultant(7, 'Graz', 'Austria', ['Manufacturing']),
+]
+
+@pytest.fixture
+def site(tmp_path):
+    """A site source tree: the repository's templates and data, and the fixture consultants."""
+    base = tmp_path / 'site'
+    base.mkdir()
+    for name in ('static', 'data', 'content', 'locales'):
+        os.symlink(os.path.join(REPO, name), base / name)
+    (base / 'consultants.json').write_text(json.dumps(CONSULTANTS, ensure_ascii=False), encoding='utf-8')
+    return str(base)
+
+def read_tree(root):
+    files = {}
+    for folder, _, names in os.walk(root):
+        for name in names:
+            full = os.path.join(folder, name)
+            with open(full, 'rb') as f:
+                files[os.path.relpath(full, root).replace(os.sep, '/')] = f.read()
+    return files
+
+def test_memory_build_matches_disk_build(site, tmp_path):
+    memory = build(Config(site, writer=MemoryWriter(), clock=CLOCK))
+    assert not os.path.exists(os.path.join(site, '.build-cache'))
+    out = tmp_path / 'build'
+    build(Config(site, writer=DiskWriter(str(out), str(tmp_path / 'records')), clock=CLOCK))
+    assert 'de/index.html' in memory
+    assert read_tree(out) == memory.writer.files
+
+def test_ingest_matches_full_rebuild(site):
+    writer = MemoryWriter()
+    build(Config(site, writer=writer, clock=CLOCK))
+    moved = dict(CONSULTANTS[2], city='Paris', country='France')
+    feed = [
+        json.dumps({'op': 'upsert', 'consultant': moved}),
+        json.dumps({'op': 'upsert', 'consultant': consultant(8, 'Dublin', 'Ireland', ['Recruitment'])}),
+        json.dumps({'op': 'delete', 'id': 'fixture-6'}),
+    ]
+    paths, _ = ingest(site, read_feed(feed), writer, CLOCK)
+    assert 'consultant/fixture-6.html' in paths
+    assert writer.files == build(Config(site, writer=MemoryWriter(), clock=CLOCK)).writer.files
+
+def test_ingest_of_new_markup_matches_full_rebuild(site):
+    # Every fixture consultant is premium, so the full build purges the rules for the other badges
+    writer = MemoryWriter()
+    build(Config(site, writer=writer, clock=CLOCK))
+    style = writer.load_record('assets')['style_url']
+    assert b'.badge-verified' not in writer.files[style]
+    verified = consultant(9, 'Graz', 'Austria', ['Manufacturing'], verificationLevel='basic-verified')
+    ingest(site, read_feed([json.dumps({'op': 'upsert', 'consultant': verified})]), writer, CLOCK)
+    assert 'class="badge badge-verified"' in writer.files['consultant/fixture-9.html'].decode('utf-8')
+    assert b'.badge-verified' in writer.files[writer.load_record('assets')['style_url']]
+    assert writer.files == build(Config(site, writer=MemoryWriter(), clock=CLOCK)).writer.files
+
+def test_targeted_build_removes_only_gone_data_pages(site):
+    writer = MemoryWriter()
+    build(Config(site, writer=writer, clock=CLOCK))
+    style = writer.load_record('assets')['style_url']
+    with pytest.raises(ValueError):
+        build(Config(site, paths=[style], writer=writer, clock=CLOCK))
+    build(Config(site, families=['blog'], paths=['blog.html', 'consultant/fixture-0.html', 'consultant/gone.html'],
+                 writer=writer, clock=CLOCK))
+    assert style in writer.files and 'consultant/fixture-0.html' in writer.files
+    writer.write('consultant/gone.html', b'')
+    build(Config(site, paths=['consultant/gone.html', 'about.html'], writer=writer, clock=CLOCK))
+    assert 'consultant/gone.html' not in writer.files and 'about.html' in writer.files
+
+def test_feed_ids_must_be_slugs():
+    for cid in ('../../index', 'Fixture 9', ''):
+        with pytest.raises(ValueError):
+            read_feed([json.dumps({'op': 'upsert', 'consultant': consultant(9, 'Graz', 'Austria', [], id=cid)})])
+    with pytest.raises(ValueError):
+        read_feed([json.dumps({'op': 'delete', 'id': '../index'})])
+
+@pytest.mark.parametrize('line', ['[1]', '"upsert"', 'null', '{"op": "upsert", "consultant": null}',
+                                  '{"op": "upsert", "consultant": [1]}', '{"op": "delete"}', '{"op": "merge", "id": "a"}'])
+def test_feed_rejects_malformed_lines(line):
+    with pytest.raises(ValueError, match='feed line 2'):
+        read_feed(['', line])
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='locale workers need fork')
+def test_forked_locales_match_serial(site):
+    forked = build(Config(site, writer=MemoryWriter(), clock=CLOCK, jobs=2))
+    serial = build(Config(site, writer=MemoryWriter(), clock=CLOCK, jobs=1))
+    assert forked.counts['de'] and forked.writer.files == serial.writer.files
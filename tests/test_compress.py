@@ -0,0 +1,54 @@
+"""Precompressed siblings and the manifest record."""
+
+import gzip
+
+import pytest
+
+from sitegen.compress import SUFFIXES, brotli, precompress
+from sitegen.context import Context
+from sitegen.writers import MemoryWriter
+
+PAGE = ('<!DOCTYPE html><html><body>' + '<p>EU AI Act consultants</p>' * 200 + '</body></html>').encode()
+STYLE = ('.card{padding:1rem}' * 300).encode()
+
+@pytest.fixture
+def ctx(tmp_path):
+    ctx = Context(str(tmp_path), MemoryWriter())
+    ctx.cache_dir = None
+    for path, data in (('index.html', PAGE), ('static/css/style.1.css', STYLE), ('tiny.txt', b'ok'),
+                       ('static/images/logo.png', b'\x89PNG' * 100)):
+        ctx.writer.write(path, data)
+    return ctx
+
+def test_siblings_decode_to_the_original(ctx):
+    precompress(ctx, True)
+    files = ctx.writer.files
+    for path in ('index.html', 'static/css/style.1.css'):
+        assert gzip.decompress(files[path + '.gz']) == files[path]
+        if brotli is not None:
+            assert brotli.decompress(files[path + '.br']) == files[path]
+    # Binary files are not compressed, and neither is anything the encodings would make larger
+    assert not {'tiny.txt.gz', 'tiny.txt.br', 'static/images/logo.png.gz'} & files.keys()
+    manifest = ctx.writer.load_record('manifest')
+    assert list(manifest) == sorted(['index.html', 'static/css/style.1.css', 'tiny.txt', 'static/images/logo.png'])
+    sizes = {enc: len(files['index.html' + suffix]) for enc, suffix in SUFFIXES.items() if 'index.html' + suffix in files}
+    assert manifest['index.html'] == {'hash': manifest['index.html']['hash'], 'size': len(PAGE), **sizes}
+    assert manifest['tiny.txt'] == {'hash': manifest['tiny.txt']['hash'], 'size': 2}
+    # Only fingerprinted assets go through the brotli cache
+    assert all(name.startswith('compressed/') for name in ctx.memory_cache)
+    assert len(ctx.memory_cache) == (brotli is not None)
+
+def test_targeted_update_and_removal(ctx):
+    precompress(ctx, True)
+    before = ctx.writer.load_record('manifest')
+    ctx.writer.remove('index.html')
+    ctx.writer.write('tiny.txt', b'ok' * 500)
+    precompress(ctx, False, {'index.html'})
+    manifest = ctx.writer.load_record('manifest')
+    assert 'index.html' not in manifest and not {'index.html.gz', 'index.html.br'} & ctx.writer.files.keys()
+    assert manifest['tiny.txt']['size'] == 1000 and 'tiny.txt.gz' in ctx.writer.files
+    assert manifest['static/css/style.1.css'] == before['static/css/style.1.css']
+    # A file that stops compressing loses its stale siblings
+    ctx.writer.write('tiny.txt', b'ok')
+    precompress(ctx, False)
+    assert 'tiny.txt.gz' not in ctx.writer.files and 'gzip' not in ctx.writer.load_record('manifest')['tiny.txt']
@@ -0,0 +1,46 @@
+"""Duplicate listing detection: what counts as a match, and which listing of a cluster is kept."""
+
+from sitegen.dedup import find_duplicates, normalise_domain, normalise_name
+
+def listing(cid, name, city='Berlin', website='', country='Germany'):
+    return {'id': cid, 'name': name, 'city': city, 'country': country, 'website': website}
+
+def test_normalisation():
+    assert normalise_name('Müller & Partner GmbH') == 'muller partner'
+    assert normalise_domain('https://www.acme.de/about') == normalise_domain('acme.de') == 'acme.de'
+    assert normalise_domain('https://www.linkedin.com/company/acme') == ''
+
+def test_matches_need_the_same_city():
+    report = find_duplicates([
+        listing('a', 'Acme Advisory GmbH', website='https://acme.de/'),
+        listing('b', 'ACME Advisory', website='https://www.acme.de/team'),
+        listing('c', 'Acme Advisory', city='Munich'),
+        listing('d', 'Acme Advisory Ltd', website='https://other.example.org/'),
+        listing('e', 'Nordwind Beratung'),
+        listing('f', 'Nordwind Beratungs GmbH'),
+    ])
+    assert report == [
+        {'keep': 'a', 'duplicates': [{'id': 'b', 'reason': 'same website and city'}]},
+        {'keep': 'e', 'duplicates': [{'id': 'f', 'reason': 'similar name, same city'}]},
+    ]
+
+def test_shared_hosts_and_numbers_do_not_match():
+    assert find_duplicates([
+        listing('a', 'Alpha', website='https://linkedin.com/company/alpha'),
+        listing('b', 'Beta', website='https://linkedin.com/company/beta'),
+        listing('c', 'Studio 54 Consulting'),
+        listing('d', 'Studio 45 Consulting'),
+    ]) == []
+
+def test_ties_keep_the_earliest_listing():
+    # Identical listings: the first in store order is kept, however the pairs were reached
+    same = [listing(cid, 'Acme Advisory', website='https://acme.de/') for cid in ('z', 'y', 'x')]
+    assert find_duplicates(same) == [{'keep': 'z', 'duplicates': [
+        {'id': 'y', 'reason': 'same website and city'}, {'id': 'x', 'reason': 'same website and city'}]}]
+    # c matches a by name and b by website, joining two clusters: the earlier root wins
+    assert find_duplicates([
+        listing('a', 'Nordlicht Beratung'),
+        listing('b', 'Sonne Analytics', website='https://sonne.de/'),
+        listing('c', 'Nordlicht Beratung', website='https://sonne.de/'),
+    ]) == [{'keep': 'a', 'duplicates': [
+        {'id': 'b', 'reason': 'matched a duplicate'}, {'id': 'c', 'reason': 'same name and city'}]}]
@@ -0,0 +1,47 @@
+"""Nearby consultants: the k-d tree agrees with a brute-force scan, and cities the gazetteer lacks have no neighbours."""
+
+import math, random
+
+from sitegen.geo import GeoIndex, build_tree, chord_km, km_chord, load_gazetteer, nearest, unit_vector
+
+GAZETTEER = {('berlin', 'germany'): (52.52, 13.405), ('potsdam', 'germany'): (52.3906, 13.0645),
+             ('munich', 'germany'): (48.1351, 11.582), ('vienna', 'austria'): (48.2082, 16.3738),
+             ('lisbon', 'portugal'): (38.7223, -9.1393)}
+
+def listing(cid, city, country):
+    return {'id': cid, 'city': city, 'country': country}
+
+def test_nearest_matches_brute_force():
+    rng = random.Random(7)
+    points = [unit_vector(rng.uniform(35, 70), rng.uniform(-10, 30)) for _ in range(300)]
+    # Duplicate points tie on distance: the smaller item must win whatever the tree shape
+    points += points[:20]
+    tree = build_tree([(p, i) for i, p in enumerate(points)])
+    for _ in range(50):
+        target = unit_vector(rng.uniform(35, 70), rng.uniform(-10, 30))
+        for k, max_dist in ((1, 2.0), (8, 2.0), (8, km_chord(300))):
+            brute = sorted((math.dist(p, target), i) for i, p in enumerate(points))
+            assert nearest(tree, target, k, max_dist) == [(d, i) for d, i in brute if d <= max_dist][:k]
+
+def test_near_orders_by_distance_and_skips_own_city():
+    index = GeoIndex([listing('b1', 'Berlin', 'Germany'), listing('p1', 'Potsdam', 'Germany'),
+                      listing('m1', 'Munich', 'Germany'), listing('p2', 'Potsdam', 'Germany'),
+                      listing('l1', 'Lisbon', 'Portugal'), listing('b2', 'Berlin', 'Germany')], GAZETTEER)
+    near = index.near('Berlin', 'Germany')
+    assert [c['id'] for c, _ in near] == ['p1', 'p2', 'm1']  # Lisbon is beyond NEARBY_KM
+    assert 20 < near[0][1] < 40 and 480 < near[2][1] < 520
+    assert [c['id'] for c, _ in index.near('Berlin', 'Germany', k=1)] == ['p1']
+    assert index.near('Berlin', 'Germany', max_km=10) == []
+
+def test_unknown_city_has_no_neighbours():
+    consultants = [listing('b1', 'Berlin', 'Germany'), listing('x1', 'Atlantis', 'Germany')]
+    assert GeoIndex(consultants, GAZETTEER).near('Atlantis', 'Germany') == []
+    empty = GeoIndex(consultants, {})
+    assert empty.tree is None and empty.near('Berlin', 'Germany') == []
+    assert GeoIndex([listing('b1', 'Berlin', 'Germany')], GAZETTEER).near('Berlin', 'Germany') == []
+
+def test_gazetteer_keys_are_casefolded(tmp_path):
+    path = tmp_path / 'cities.csv'
+    path.write_text('city,country,lat,lon\nMünchen,Germany,48.1351,11.582\n', encoding='utf-8')
+    assert load_gazetteer(str(path)) == {('münchen', 'germany'): (48.1351, 11.582)}
+    assert round(chord_km(km_chord(500))) == 500
@@ -0,0 +1,114 @@
+"""The form intake service: validation, status codes, batching through the writer task, and malformed requests on the
+wire. Each test runs its own event loop against a fresh database."""
+
+import asyncio, json, sqlite3
+from urllib.parse import urlencode
+
+import pytest
+
+from sitegen.intake import FORM_ACTION, MAX_BODY, BadRequest, Intake, serve, validate
+
+INQUIRY = {'form-name': 'inquiry', 'consultant_id': 'acme', 'consultant': 'Acme', 'name': 'Ada', 'email': 'ada@example.com',
+           'consent': 'yes', 'message': 'Grüße'}
+
+def post(**changes):
+    return urlencode({k: v for k, v in dict(INQUIRY, **changes).items() if v is not None}).encode()
+
+def stored(db):
+    with sqlite3.connect(db) as conn:
+        return [(form, json.loads(fields)) for form, fields in conn.execute('SELECT form, fields FROM submissions ORDER BY id')]
+
+@pytest.fixture
+def db(tmp_path):
+    return str(tmp_path / 'submissions.db')
+
+def test_validate():
+    assert validate(post()) == ('inquiry', {k: v for k, v in INQUIRY.items() if k != 'form-name'})
+    assert validate(post(**{'bot-field': 'x'})) == (None, None)
+    for body, error in [(post(**{'form-name': 'nope'}), 'unknown form'), (post(email=None, name='  '), 'missing name, email'),
+                        (post(email='ada'), 'invalid email'), (b'', 'unknown form'), (b'\xff\xfe%%&&==', 'unknown form')]:
+        with pytest.raises(BadRequest, match=error):
+            validate(body)
+
+def test_handle_statuses(db):
+    async def run():
+        intake = Intake(db)
+        writer = asyncio.create_task(intake.writer())
+        results = [await intake.handle('POST', FORM_ACTION, post()),
+                   await intake.handle('POST', FORM_ACTION, post(**{'bot-field': 'x'})),
+                   await intake.handle('POST', FORM_ACTION, post(consent='')),
+                   await intake.handle('GET', FORM_ACTION, b''),
+                   await intake.handle('POST', '/elsewhere', post()),
+                   await intake.handle('GET', '/healthz', b'')]
+        writer.cancel()
+        return results
+
+    ok, honeypot, bad, get, missing, health = asyncio.run(run())
+    assert ok == honeypot == (303, {'Location': '/thank-you.html'}, b'')
+    assert bad[0] == 400 and get[:2] == (405, {'Allow': 'POST'}) and missing[0] == 404
+    assert json.loads(health[2]) == {'queued': 0, 'stored': 1}
+    assert stored(db) == [('inquiry', validate(post())[1])]
+
+def test_full_queue_and_failed_write(db):
+    async def run():
+        intake = Intake(db)
+        intake.queue = asyncio.Queue(1)
+        waiting = asyncio.create_task(intake.handle('POST', FORM_ACTION, post()))
+        await asyncio.sleep(0)
+        busy = await intake.handle('POST', FORM_ACTION, post())
+        # The writer starts against a closed database: the queued post fails, and the writer keeps running
+        intake.db.close()
+        writer = asyncio.create_task(intake.writer())
+        failed = await waiting
+        again = await intake.handle('POST', FORM_ACTION, post())
+        writer.cancel()
+        return busy, failed, again
+
+    busy, failed, again = asyncio.run(run())
+    assert busy == (503, {'Retry-After': '1'}, b'busy, try again shortly\n')
+    assert failed[0] == again[0] == 500
+
+def test_cancelled_submit_is_still_stored(db):
+    async def run():
+        intake = Intake(db)
+        gone = asyncio.create_task(intake.submit('inquiry', {'name': 'gone'}))
+        await asyncio.sleep(0)
+        gone.cancel()
+        writer = asyncio.create_task(intake.writer())
+        await intake.submit('inquiry', {'name': 'next'})
+        writer.cancel()
+        return gone.cancelled()
+
+    assert asyncio.run(run())
+    assert [fields['name'] for _, fields in stored(db)] == ['gone', 'next']
+
+async def exchange(port, raw):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(raw)
+    writer.write_eof()
+    data = await reader.read()
+    writer.close()
+    return data
+
+def test_malformed_requests_on_the_wire(db):
+    async def run():
+        intake, server, writer = await serve(db, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        body = post()
+        head = f'POST {FORM_ACTION} HTTP/1.1\r\nContent-Length: {len(body)}\r\n'
+        out = [await exchange(port, b'GARBAGE\r\n\r\n'),
+               await exchange(port, f'POST {FORM_ACTION} HTTP/1.1\r\nContent-Length: lots\r\n\r\n'.encode()),
+               await exchange(port, f'POST {FORM_ACTION} HTTP/1.1\r\nContent-Length: {MAX_BODY + 1}\r\n\r\n'.encode()),
+               # The client hangs up partway through a body
+               await exchange(port, head.encode() + b'\r\n' + body[:10]),
+               # Two posts on one keep-alive connection, the second asking to close
+               await exchange(port, head.encode() + b'\r\n' + body + head.encode() + b'Connection: close\r\n\r\n' + body)]
+        server.close()
+        writer.cancel()
+        return out
+
+    garbage, bad_length, too_large, truncated, two = asyncio.run(run())
+    assert garbage == bad_length == truncated == b''
+    assert too_large.startswith(b'HTTP/1.1 413 ') and b'Connection: close' in too_large
+    assert two.count(b'HTTP/1.1 303 See Other') == 2 and two.count(b'Connection: keep-alive') == 1
+    assert len(stored(db)) == 2
@@ -0,0 +1,90 @@
+"""The preview server: encoding choice, per-encoding ETags, 304s and byte ranges, over a real socket."""
+
+import gzip, http.client, os, threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from sitegen.compress import precompress
+from sitegen.context import Context
+from sitegen.preview import Manifest, PreviewHandler, Stats, accepted, byte_range, output_path
+from sitegen.writers import DiskWriter
+
+PAGE = ('<!DOCTYPE html><html><body>' + '<p>EU AI Act consultants</p>' * 200 + '</body></html>').encode()
+
+@pytest.fixture
+def server(tmp_path):
+    root, records = tmp_path / 'build', tmp_path / 'records'
+    ctx = Context(str(tmp_path), DiskWriter(str(root), str(records)))
+    for path, data in (('index.html', PAGE), ('404.html', b'<p>gone</p>'), ('static/app.1.js', b'let a = 1;\n' * 100)):
+        ctx.writer.write(path, data)
+    precompress(ctx, True)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PreviewHandler)
+    server.root, server.manifest, server.stats = str(root), Manifest(str(records / 'manifest.json')), Stats()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def get(server, path, **headers):
+    conn = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=5)
+    conn.request('GET', path, headers={k.replace('_', '-'): v for k, v in headers.items()})
+    response = conn.getresponse()
+    body = response.read()
+    conn.close()
+    return response.status, response.headers, body
+
+def test_helpers():
+    assert accepted('gzip;q=0, br;q=0.5, identity') == {'br', 'identity'}
+    assert accepted('*') == {'br', 'gzip'} and accepted('gzip;q=x') == set()
+    assert byte_range('bytes=0-9', 100) == (0, 9)
+    assert byte_range('bytes=90-', 100) == byte_range('bytes=-10', 100) == (90, 99)
+    assert byte_range('bytes=95-200', 100) == (95, 99)
+    assert byte_range('bytes=100-', 100) == byte_range('bytes=5-1', 100) == 'unsatisfiable'
+    assert byte_range('bytes=0-1,5-6', 100) is None and byte_range('items=0-1', 100) is None
+    assert byte_range('bytes=a-b', 100) is None
+    assert output_path('/') == 'index.html' and output_path('/de/?q=1') == 'de/index.html'
+    # Parent segments cannot climb out of build/
+    assert output_path('/%2e%2e/secret') == 'secret' and output_path('/a/../b.html') == 'b.html'
+
+def test_encoding_choice_and_etags(server):
+    status, headers, body = get(server, '/', Accept_Encoding='gzip, br')
+    br = os.path.exists(os.path.join(server.root, 'index.html.br'))
+    assert status == 200 and headers['Content-Encoding'] == ('br' if br else 'gzip')
+    assert headers['Vary'] == 'Accept-Encoding' and headers['Cache-Control'] == 'no-cache'
+    status, gz_headers, body = get(server, '/index.html', Accept_Encoding='gzip')
+    assert gzip.decompress(body) == PAGE and gz_headers['ETag'].endswith('-gzip"')
+    status, plain, body = get(server, '/index.html')
+    assert body == PAGE and 'Content-Encoding' not in plain and plain['Content-Length'] == str(len(PAGE))
+    assert len({headers['ETag'], gz_headers['ETag'], plain['ETag']}) == 3 - (not br)
+    assert get(server, '/static/app.1.js')[1]['Cache-Control'] == 'public, max-age=31536000, immutable'
+
+def test_not_modified(server):
+    etag = get(server, '/index.html', Accept_Encoding='gzip')[1]['ETag']
+    status, headers, body = get(server, '/index.html', Accept_Encoding='gzip', If_None_Match=f'"x", {etag}')
+    assert (status, body, headers['ETag']) == (304, b'', etag) and 'Content-Length' not in headers
+    # The identity ETag does not match the gzip one, so a client that stops accepting gzip gets the full page
+    assert get(server, '/index.html', If_None_Match=etag)[0] == 200
+    assert server.stats.not_modified == 1
+
+def test_ranges(server):
+    status, headers, body = get(server, '/index.html', Range='bytes=0-14')
+    assert (status, body, headers['Content-Range']) == (206, PAGE[:15], f'bytes 0-14/{len(PAGE)}')
+    assert get(server, '/index.html', Range='bytes=-5')[2] == PAGE[-5:]
+    status, headers, body = get(server, '/index.html', Range=f'bytes={len(PAGE)}-')
+    assert (status, body, headers['Content-Range']) == (416, b'', f'bytes */{len(PAGE)}')
+    etag = get(server, '/index.html')[1]['ETag']
+    assert get(server, '/index.html', Range='bytes=0-14', If_Range=etag)[0] == 206
+    # A stale If-Range means the client's partial copy is out of date: send the whole file
+    status, _, body = get(server, '/index.html', Range='bytes=0-14', If_Range='"stale"')
+    assert (status, body) == (200, PAGE)
+    # Ranges apply to the encoded bytes the client asked for
+    _, _, gz = get(server, '/index.html', Accept_Encoding='gzip')
+    assert get(server, '/index.html', Accept_Encoding='gzip', Range='bytes=0-9')[2] == gz[:10]
+
+def test_missing_pages(server):
+    status, headers, body = get(server, '/nowhere.html', Range='bytes=0-1', If_None_Match='"x"')
+    assert (status, body) == (404, b'<p>gone</p>')
+    os.remove(os.path.join(server.root, '404.html'))
+    assert get(server, '/nowhere.html')[0] == 404
@@ -0,0 +1,72 @@
+"""The render server: pages rendered on demand match the built ones, and responses revalidate by ETag."""
+
+import json, os
+
+import pytest
+
+from sitegen import Config, build
+from sitegen.serve import IMMUTABLE, LRUCache, RenderApp
+from test_build import CLOCK, CONSULTANTS, REPO
+
+@pytest.fixture(scope='module')
+def base(tmp_path_factory):
+    """A full disk build of the fixture site, as the server expects to find it."""
+    base = tmp_path_factory.mktemp('site')
+    for name in ('static', 'data', 'content', 'locales'):
+        os.symlink(os.path.join(REPO, name), base / name)
+    (base / 'consultants.json').write_text(json.dumps(CONSULTANTS, ensure_ascii=False), encoding='utf-8')
+    build(Config(str(base), clock=CLOCK))
+    return base
+
+def get(app, path, **headers):
+    out = {}
+    def start_response(status, response_headers):
+        out['status'], out['headers'] = int(status.split()[0]), dict(response_headers)
+    environ = {'REQUEST_METHOD': headers.pop('method', 'GET'), 'PATH_INFO': path}
+    environ.update({f'HTTP_{k.upper()}': v for k, v in headers.items()})
+    out['body'] = b''.join(app(environ, start_response))
+    return out
+
+def test_lru_evicts_by_bytes():
+    cache = LRUCache(10)
+    cache.put('a', ('1', b'aaaa'))
+    cache.put('b', ('2', b'bbbb'))
+    cache.get('a')
+    cache.put('c', ('3', b'cccc'))  # over budget: b is the least recently used
+    assert list(cache.entries) == ['a', 'c'] and cache.size == 8
+    cache.put('huge', ('4', b'x' * 11))
+    cache.put('a', ('5', b'aa'))
+    assert 'huge' not in cache.entries and cache.size == 6 and (cache.hits, cache.misses) == (1, 0)
+
+def test_rendered_pages_match_the_build(base):
+    app = RenderApp(str(base))
+    for path in ('consultant/fixture-0.html', 'de/consultant/fixture-3.html', 'country/germany.html', 'index.html'):
+        response = get(app, f'/{path}')
+        assert response['status'] == 200, path
+        assert response['body'] == (base / 'build' / path).read_bytes(), path
+    assert get(app, '/')['body'] == (base / 'build' / 'index.html').read_bytes()
+
+def test_etag_revalidation(base):
+    app = RenderApp(str(base))
+    first = get(app, '/consultant/fixture-1.html')
+    etag = first['headers']['ETag']
+    assert first['headers']['Cache-Control'] == 'no-cache'
+    again = get(app, '/consultant/fixture-1.html', if_none_match=f'"other", {etag}')
+    assert (again['status'], again['body'], again['headers']['ETag']) == (304, b'', etag)
+    assert get(app, '/consultant/fixture-1.html', if_none_match='"other"')['status'] == 200
+    assert app.cache.hits == 2
+    # New data on disk drops the cache; an unchanged page keeps its ETag
+    os.utime(base / 'consultants.json')
+    assert get(app, '/consultant/fixture-1.html', if_none_match=etag)['status'] == 304 and app.cache.hits == 2
+
+def test_static_and_missing(base):
+    app = RenderApp(str(base))
+    style = json.loads((base / '.build-cache' / 'records' / 'assets.json').read_text())['style_url']
+    static = get(app, f'/{style}')
+    assert static['status'] == 200 and static['headers']['Cache-Control'] == IMMUTABLE
+    assert static['headers']['Content-Type'] == 'text/css; charset=utf-8'
+    missing = get(app, '/consultant/nobody.html')
+    assert missing['status'] == 404 and missing['body'] == (base / 'build' / '404.html').read_bytes()
+    assert get(app, '/../consultants.json')['status'] == 404
+    assert get(app, '/index.html', method='HEAD')['body'] == b''
+    assert get(app, '/index.html', method='POST')['status'] == 405
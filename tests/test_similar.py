@@ -0,0 +1,50 @@
+"""Similar consultants: ranking, degenerate directories, and the neighbours an ingest has to re-render."""
+
+import random
+
+from sitegen.similar import SimilarIndex
+
+def consultant(cid, services, sectors=(), languages=('English',)):
+    return {'id': cid, 'services': list(services), 'sectors': list(sectors), 'languages': list(languages)}
+
+def directory(n, seed=3):
+    rng = random.Random(seed)
+    services = ['Audit', 'Training', 'Risk', 'Governance', 'DPIA', 'Strategy']
+    sectors = ['Healthcare', 'Finance', 'Retail', 'Public Sector']
+    return [consultant(f'c{i}', rng.sample(services, rng.randint(1, 3)), rng.sample(sectors, rng.randint(1, 2)),
+                       rng.sample(['English', 'German', 'French'], rng.randint(1, 2))) for i in range(n)]
+
+def ids(pairs):
+    return [c['id'] for c, _ in pairs]
+
+def test_ranked_by_overlap_then_store_order():
+    index = SimilarIndex([
+        consultant('a', ['Audit', 'Training'], ['Healthcare']),
+        consultant('b', ['Audit'], ['Finance']),
+        consultant('c', ['Audit', 'Training'], ['Healthcare']),
+        consultant('d', ['Audit', 'Training'], ['Healthcare']),
+        consultant('e', ['Strategy'], ['Retail'], ['French']),
+    ])
+    assert [(c['id'], overlap) for c, overlap in index.similar('a')][:3] == [('c', 1.0), ('d', 1.0), ('b', 0.4)]
+    assert 'e' not in ids(index.similar('a')) and index.similar('a', k=1) == [(index.consultants[2], 1.0)]
+    assert index.similar('missing') == [] and index.neighbours('missing') == set()
+
+def test_single_and_featureless_consultants():
+    single = SimilarIndex([consultant('a', ['Audit'])])
+    assert single.similar('a') == [] and single.neighbours('a') == set()
+    bare = SimilarIndex([consultant('a', [], languages=()), consultant('b', [], languages=())])
+    assert bare.similar('a') == [] and bare.neighbours('a') == set()
+    assert SimilarIndex([]).similar('a') == []
+
+def test_lists_are_deterministic():
+    people = directory(200)
+    first, second = SimilarIndex(people), SimilarIndex(list(people))
+    assert all(first.similar(c['id']) == second.similar(c['id']) for c in people)
+
+def test_removal_only_changes_neighbours():
+    people = directory(300)
+    before = SimilarIndex(people)
+    for gone in ('c0', 'c150', 'c299'):
+        after = SimilarIndex([c for c in people if c['id'] != gone])
+        changed = {c['id'] for c in people if c['id'] != gone and ids(before.similar(c['id'])) != ids(after.similar(c['id']))}
+        assert changed <= before.neighbours(gone)
@@ -0,0 +1,51 @@
+"""Sitemap shards and the lastmod registry."""
+
+import re
+
+from sitegen import sitemap
+from sitegen.sitemap import URLSET_HEAD, URLSET_TAIL, content_hash, shards, update_registry
+
+def registry(*paths, lastmod='2026-01-01'):
+    return {p: ['h', lastmod] for p in paths}
+
+def urls(xml):
+    return re.findall(r'<loc>https://aiactadvisors\.com/([^<]*)</loc>', xml)
+
+def test_shards_split_by_section_and_skip_excluded():
+    out = list(shards(registry('index.html', '404.html', 'consultant/a.html', 'consultant/b.html', 'blog/x.html')))
+    assert [name for name, _, _ in out] == ['sitemap-blog.xml', 'sitemap-consultant.xml', 'sitemap-pages.xml']
+    assert urls(out[1][1]) == ['consultant/a.html', 'consultant/b.html']
+    assert urls(out[2][1]) == ['index.html']
+
+def test_shard_url_limit_boundary(monkeypatch):
+    monkeypatch.setattr(sitemap, 'SHARD_URLS', 3)
+    exact = list(shards(registry('city/a.html', 'city/b.html', 'city/c.html')))
+    assert [name for name, _, _ in exact] == ['sitemap-city.xml']
+    over = list(shards(registry('city/a.html', 'city/b.html', 'city/c.html', 'city/d.html')))
+    assert [name for name, _, _ in over] == ['sitemap-city.xml', 'sitemap-city-2.xml']
+    assert urls(over[1][1]) == ['city/d.html']
+
+def test_shard_byte_limit_boundary(monkeypatch):
+    one = list(shards(registry('city/a.html')))[0][1]
+    line = len(one) - len(URLSET_HEAD) - len(URLSET_TAIL)
+    # Room for exactly two entries: a third starts a new shard, and each shard stays within the limit
+    monkeypatch.setattr(sitemap, 'SHARD_BYTES', len(URLSET_HEAD) + len(URLSET_TAIL) + 2 * line)
+    out = list(shards(registry('city/a.html', 'city/b.html', 'city/c.html')))
+    assert [urls(xml) for _, xml, _ in out] == [['city/a.html', 'city/b.html'], ['city/c.html']]
+    assert all(len(xml.encode('utf-8')) <= sitemap.SHARD_BYTES for _, xml, _ in out)
+
+def test_shard_lastmod_is_newest_entry():
+    reg = {'blog/a.html': ['h', '2026-01-01'], 'blog/b.html': ['h', '2026-03-05'], 'index.html': ['h', '2025-12-31']}
+    assert {name: lastmod for name, _, lastmod in shards(reg)} == {'sitemap-blog.xml': '2026-03-05', 'sitemap-pages.xml': '2025-12-31'}
+
+def test_lastmod_moves_only_with_content():
+    old = {'a.html': ['h1', '2026-01-01'], 'b.html': ['h2', '2026-01-01'], 'gone.html': ['h3', '2026-01-01']}
+    targeted = update_registry(old, {'a.html': 'h1', 'b.html': 'h2-new'}, '2026-02-01', False, {'gone.html'})
+    assert targeted == {'a.html': ['h1', '2026-01-01'], 'b.html': ['h2-new', '2026-02-01']}
+    # A full build keeps unchanged lastmods but forgets pages it did not render
+    assert update_registry(old, {'a.html': 'h1'}, '2026-02-01', True) == {'a.html': ['h1', '2026-01-01']}
+
+def test_content_hash_ignores_site_chrome():
+    page = '<head>{}</head><header>nav</header><main>body</main><footer class="site-footer">{}</footer>'
+    assert content_hash(page.format('style.1.css', 'x')) == content_hash(page.format('style.2.css', 'y'))
+    assert content_hash(page.format('a', 'b')) != content_hash(page.format('a', 'b').replace('body', 'other'))
@@ -0,0 +1,61 @@
+"""The SQLite store answers like the JSON store, and consultants.json survives a trip through consultants.db."""
+
+import sqlite3
+
+import pytest
+
+from sitegen.store import JsonStore, SqliteStore, delete_consultant, export_json, import_json, upsert_consultant
+
+def consultant(cid, country, city, sectors, **extra):
+    return {
+        'id': cid, 'name': cid.title(), 'country': country, 'city': city, 'sectors': sectors,
+        'services': ['AI Audit', 'Training'], 'languages': ['English', 'German'], 'verificationLevel': 'premium',
+        'companySize': 'boutique', 'priceRange': '€', 'description': f'{cid} in {city}', 'website': f'https://{cid}.example.com/',
+        **extra,
+    }
+
+CONSULTANTS = [
+    consultant('b', 'Germany', 'Berlin', ['Healthcare', 'All Sectors'], linkedin='https://linkedin.com/company/b'),
+    consultant('a', 'France', 'Paris', ['Retail']),  # no linkedin
+    consultant('c', 'Germany', 'Munich', ['Healthcare'], linkedin='', featured=True, tags={'x': [1, 'é']}),
+    consultant('d', 'Germany', 'Berlin', []),
+]
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / 'consultants.db')
+    import_json(CONSULTANTS, path)
+    return path
+
+def test_round_trip_keeps_every_key(db):
+    assert export_json(db) == CONSULTANTS
+    assert 'linkedin' not in export_json(db)[1]
+
+def test_queries_match_json_store(db):
+    sql, js = SqliteStore(db), JsonStore(CONSULTANTS)
+    assert len(sql) == len(js) == 4
+    for query, args in [('all', ()), ('all', (2,)), ('get_many', (['d', 'a', 'zz'],)), ('get_many', ([],)),
+                        ('in_country', ('Germany',)), ('in_country', ('Spain',)), ('in_sector', ('Healthcare',)),
+                        ('in_city', ('Berlin', 'Germany')), ('country_counts', ()), ('sector_counts', ()), ('city_counts', ())]:
+        assert getattr(sql, query)(*args) == getattr(js, query)(*args), query
+    assert list(sql.country_counts()) == ['Germany', 'France']
+    assert 'All Sectors' not in sql.sector_counts()
+
+def test_upsert_keeps_position_and_delete_cascades(db):
+    conn = sqlite3.connect(db)
+    with conn:
+        upsert_consultant(conn, dict(CONSULTANTS[0], city='Hamburg', sectors=['Insurance']))
+        upsert_consultant(conn, consultant('e', 'Spain', 'Madrid', ['Retail']))
+        delete_consultant(conn, 'a')
+    assert conn.execute('SELECT COUNT(*) FROM sectors WHERE consultant_id = ?', ('a',)).fetchone()[0] == 0
+    conn.close()
+    rows = SqliteStore(db).all()
+    assert [c['id'] for c in rows] == ['b', 'c', 'd', 'e']
+    assert rows[0]['city'] == 'Hamburg' and rows[0]['sectors'] == ['Insurance']
+
+def test_missing_required_field_is_refused(tmp_path):
+    broken = dict(CONSULTANTS[0])
+    del broken['website']
+    with pytest.raises(sqlite3.IntegrityError):
+        import_json([broken], str(tmp_path / 'consultants.db'))
+    assert not (tmp_path / 'consultants.db').exists()